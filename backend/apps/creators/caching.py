@@ -0,0 +1,108 @@
+"""
+Versioned response caching for the public creator endpoints.
+
+Each creator's public profile is cached under a per-slug version and the
+creator list under a single list generation. Updating a profile bumps only
+that creator's version and the list generation, so stale entries are simply
+never read again and expire on their own TTL, instead of clearing the
+whole cache.
+"""
+import hashlib
+import logging
+import time
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+PROFILE_CACHE_TTL = 60 * 10
+LIST_CACHE_TTL = 60 * 5
+LIST_GENERATION_KEY = "creators_list:generation"
+
+
+def get_profile_version_key(slug):
+    return f"creator_profile:version:{slug.lower()}"
+
+
+def get_version(key):
+    """
+    Current value of a version counter, creating it if missing.
+
+    New counters start from the clock rather than 1 so an evicted counter
+    never comes back to a version that still has entries cached.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter missing (never read or evicted)
+        cache.set(key, time.time_ns(), None)
+
+
+def get_request_hash(request):
+    """Hash of the absolute URL, responses embed host-dependent links"""
+    return hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+
+
+def get_profile_cache_key(request, slug):
+    version = get_version(get_profile_version_key(slug))
+    return f"creator_profile:{slug.lower()}:{version}:{get_request_hash(request)}"
+
+
+def get_list_cache_key(request):
+    version = get_version(LIST_GENERATION_KEY)
+    return f"creators_list:{version}:{get_request_hash(request)}"
+
+
+def cached_response_data(key_func, build, timeout):
+    """
+    Return cached response data, building and caching it on a miss.
+    Args:
+        key_func (callable): Returns the cache key
+        build (callable): Returns the data to cache, or None to skip caching
+        timeout (int): Cache TTL in seconds
+    Returns:
+        The cached or freshly built data
+    """
+    try:
+        key = key_func()
+        data = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Creator cache unavailable: {str(e)}")
+        return build()
+
+    if data is None:
+        data = build()
+        if data is not None:
+            try:
+                cache.set(key, data, timeout)
+            except Exception as e:
+                logger.warning(f"Creator cache unavailable: {str(e)}")
+    return data
+
+
+def invalidate_creator(slug):
+    """
+    Invalidate the cached public profile for a creator and the creator list,
+    now and again once the surrounding transaction commits (so a read racing
+    the write can't cache the old data under the new version).
+    Args:
+        slug (str): The creator's user slug
+    """
+    def _bump():
+        try:
+            if slug:
+                bump_version(get_profile_version_key(slug))
+            bump_version(LIST_GENERATION_KEY)
+        except Exception as e:
+            logger.warning(f"Creator cache unavailable: {str(e)}")
+
+    _bump()
+    transaction.on_commit(_bump)
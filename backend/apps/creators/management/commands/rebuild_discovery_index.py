@@ -0,0 +1,16 @@
+"""
+Management command to rebuild the denormalized creator discovery feed.
+"""
+
+from django.core.management.base import BaseCommand
+from apps.creators.services.discovery import CreatorDiscoveryService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the creator discovery feed from creator profiles'
+
+    def handle(self, *args, **options):
+        indexed = CreatorDiscoveryService.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Total creators indexed: {indexed}')
+        )
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.1 on 2026-10-18 06:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_discovery_entries(apps, schema_editor):
+    """Index the creators that are already listed"""
+    CreatorProfile = apps.get_model('creators', 'CreatorProfile')
+    CreatorDiscoveryEntry = apps.get_model('creators', 'CreatorDiscoveryEntry')
+    entries = []
+    profiles = (
+        CreatorProfile.objects
+        .select_related('user')
+        .prefetch_related('categories')
+        .filter(status='active', verified=True)
+    )
+    for profile in profiles:
+        user = profile.user
+        base = {
+            'profile': profile,
+            'username': user.username.lower(),
+            'full_name': f"{user.first_name} {user.last_name}".strip().lower(),
+            'followers_count': profile.followers_count,
+        }
+        entries.append(CreatorDiscoveryEntry(category=None, category_slug='', **base))
+        for category in profile.categories.all():
+            entries.append(CreatorDiscoveryEntry(
+                category=category, category_slug=category.slug, **base))
+    CreatorDiscoveryEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('creators', '0004_alter_creatorprofile_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CreatorDiscoveryEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category_slug', models.SlugField(blank=True, db_index=False)),
+                ('username', models.CharField(help_text='Lowercased username', max_length=150)),
+                ('full_name', models.CharField(blank=True, help_text='Lowercased full name', max_length=301)),
+                ('followers_count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='discovery_entries', to='creators.creatorcategory')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='discovery_entries', to='creators.creatorprofile')),
+            ],
+            options={
+                'db_table': 'creators_discovery_entry',
+                'indexes': [models.Index(fields=['category_slug', '-followers_count', '-id'], name='creators_discovery_popular_idx'), models.Index(fields=['category_slug', 'username'], name='creators_discovery_user_idx', opclasses=['varchar_pattern_ops', 'varchar_pattern_ops']), models.Index(fields=['category_slug', 'full_name'], name='creators_discovery_name_idx', opclasses=['varchar_pattern_ops', 'varchar_pattern_ops'])],
+                'constraints': [models.UniqueConstraint(fields=('profile', 'category_slug'), name='creators_discovery_profile_category_uniq')],
+            },
+        ),
+        migrations.RunPython(build_discovery_entries, migrations.RunPython.noop),
+    ]
@@ -91,3 +91,92 @@ class CreatorProfile(models.Model):
         """Check if creator is banned."""
         return self.status == 'banned'
     
+
+
+class CreatorDiscoveryEntry(models.Model):
+    """
+    Denormalized discovery feed row.
+
+    Each listed (active and verified) creator has one row with an empty
+    category_slug for the unfiltered feed, plus one row per category, so
+    category filtering, name prefix search and popularity ordering are all
+    served from this table's indexes without joining profiles, users and
+    categories. Maintained by CreatorDiscoveryService.
+    """
+    profile = models.ForeignKey(
+        CreatorProfile, on_delete=models.CASCADE, related_name='discovery_entries')
+    category = models.ForeignKey(
+        CreatorCategory, on_delete=models.CASCADE, null=True, blank=True,
+        related_name='discovery_entries')
+    category_slug = models.SlugField(blank=True, db_index=False)
+    username = models.CharField(max_length=150, help_text='Lowercased username')
+    full_name = models.CharField(max_length=301, blank=True, help_text='Lowercased full name')
+    followers_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'creators_discovery_entry'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['profile', 'category_slug'],
+                name='creators_discovery_profile_category_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['category_slug', '-followers_count', '-id'],
+                name='creators_discovery_popular_idx',
+            ),
+            models.Index(
+                fields=['category_slug', 'username'],
+                name='creators_discovery_user_idx',
+                opclasses=['varchar_pattern_ops', 'varchar_pattern_ops'],
+            ),
+            models.Index(
+                fields=['category_slug', 'full_name'],
+                name='creators_discovery_name_idx',
+                opclasses=['varchar_pattern_ops', 'varchar_pattern_ops'],
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.username} ({self.category_slug or 'all'})"
+
+
+class EmailDelivery(models.Model):
+    """
+    One outgoing email of a bulk campaign.
+
+    Campaign emails are queued as rows and sent in batches over a shared
+    SMTP connection by EmailDeliveryService, each row records its own
+    outcome so failed messages can be retried individually.
+    """
+
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        # Claimed by a worker, left in place if the outcome could not be saved
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    )
+
+    campaign = models.CharField(max_length=100)
+    recipient = models.EmailField()
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    html_message = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'creators_email_delivery'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['campaign', 'status'], name='creators_email_campaign_idx'),
+            models.Index(fields=['status', 'attempts'], name='creators_email_retry_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign} to {self.recipient} ({self.status})"
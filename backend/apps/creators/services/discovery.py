@@ -0,0 +1,130 @@
+from django.db import transaction
+from django.db.models import Q
+from apps.creators.models import CreatorProfile, CreatorDiscoveryEntry
+
+
+class CreatorDiscoveryService:
+    """Maintains and queries the denormalized creator discovery feed"""
+
+    REBUILD_BATCH_SIZE = 500
+
+    @staticmethod
+    def get_listed_profiles():
+        """Profiles that appear in discovery (active and verified)"""
+        return (
+            CreatorProfile.objects
+            .select_related('user')
+            .prefetch_related('categories')
+            .filter(status="active", verified=True)
+        )
+
+    @staticmethod
+    def build_entries(profile):
+        """
+        Build the discovery rows for a listed profile.
+        Args:
+            profile (CreatorProfile): Profile with user and categories loaded
+        Returns:
+            list: Unsaved CreatorDiscoveryEntry rows, the unfiltered feed row
+                first then one row per category
+        """
+        user = profile.user
+        base = {
+            "profile": profile,
+            "username": user.username.lower(),
+            "full_name": user.get_full_name().lower(),
+            "followers_count": profile.followers_count,
+        }
+        entries = [CreatorDiscoveryEntry(category=None, category_slug="", **base)]
+        for category in profile.categories.all():
+            entries.append(CreatorDiscoveryEntry(
+                category=category, category_slug=category.slug, **base))
+        return entries
+
+    @staticmethod
+    @transaction.atomic
+    def refresh(profile_ids):
+        """
+        Re-index the given profiles, dropping the ones no longer listed.
+        Args:
+            profile_ids (list): CreatorProfile ids
+        Returns:
+            int: Number of discovery rows written
+        """
+        CreatorDiscoveryEntry.objects.filter(profile_id__in=profile_ids).delete()
+        entries = []
+        for profile in CreatorDiscoveryService.get_listed_profiles().filter(
+                id__in=profile_ids):
+            entries.extend(CreatorDiscoveryService.build_entries(profile))
+        CreatorDiscoveryEntry.objects.bulk_create(entries)
+        return len(entries)
+
+    @staticmethod
+    def update_user(user):
+        """
+        Update the denormalized names of a creator's discovery rows.
+        Args:
+            user (User): The creator user
+        """
+        CreatorDiscoveryEntry.objects.filter(profile__user=user).update(
+            username=user.username.lower(),
+            full_name=user.get_full_name().lower(),
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        """
+        Rebuild the whole discovery feed from the creator profiles.
+        Returns:
+            int: Number of profiles indexed
+        """
+        CreatorDiscoveryEntry.objects.all().delete()
+        indexed = 0
+        entries = []
+        profiles = CreatorDiscoveryService.get_listed_profiles().order_by('id')
+        for profile in profiles.iterator(
+                chunk_size=CreatorDiscoveryService.REBUILD_BATCH_SIZE):
+            entries.extend(CreatorDiscoveryService.build_entries(profile))
+            indexed += 1
+            if len(entries) >= CreatorDiscoveryService.REBUILD_BATCH_SIZE:
+                CreatorDiscoveryEntry.objects.bulk_create(entries)
+                entries = []
+        CreatorDiscoveryEntry.objects.bulk_create(entries)
+        return indexed
+
+    @staticmethod
+    def get_feed(category=None, search=None):
+        """
+        Discovery rows ordered by popularity.
+        Args:
+            category (str): Optional category slug filter
+            search (str): Optional prefix of the username or full name
+                (case-insensitive)
+        Returns:
+            QuerySet: CreatorDiscoveryEntry rows
+        """
+        entries = CreatorDiscoveryEntry.objects.filter(category_slug=category or "")
+        search = (search or "").strip().lower()
+        if search:
+            entries = entries.filter(
+                Q(username__startswith=search) | Q(full_name__startswith=search))
+        return entries.order_by('-followers_count', '-id')
+
+    @staticmethod
+    def get_profiles(entries):
+        """
+        Load the profiles of a page of discovery rows, in feed order.
+        Args:
+            entries (list): CreatorDiscoveryEntry rows
+        Returns:
+            list: CreatorProfile instances with user and categories loaded
+        """
+        profile_ids = [entry.profile_id for entry in entries]
+        profiles = (
+            CreatorProfile.objects
+            .select_related('user')
+            .prefetch_related('categories')
+            .in_bulk(profile_ids)
+        )
+        return [profiles[pk] for pk in profile_ids if pk in profiles]
@@ -0,0 +1,121 @@
+import logging
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from apps.creators.models import EmailDelivery
+from utils.send_emails import build_email, send_email_batch
+
+logger = logging.getLogger(__name__)
+
+
+class EmailDeliveryService:
+    """Queues bulk emails and sends them in batches with per-message outcomes"""
+
+    @staticmethod
+    def chunks(items, size=None):
+        size = size or settings.EMAIL_BATCH_SIZE
+        for start in range(0, len(items), size):
+            yield items[start:start + size]
+
+    @staticmethod
+    def queue(campaign, deliveries):
+        """
+        Record the emails of a campaign as pending deliveries.
+        Args:
+            campaign (str): Campaign name, e.g. "share_creator_link"
+            deliveries (list): Dicts with recipient, subject, message and
+                optionally html_message
+        Returns:
+            list: Ids of the created EmailDelivery rows
+        """
+        rows = EmailDelivery.objects.bulk_create(
+            [EmailDelivery(campaign=campaign, **delivery) for delivery in deliveries],
+            batch_size=500,
+        )
+        return [row.id for row in rows]
+
+    @staticmethod
+    def dispatch(delivery_ids):
+        """
+        Fan the deliveries out to Celery in batches of EMAIL_BATCH_SIZE.
+        Args:
+            delivery_ids (list): EmailDelivery ids
+        Returns:
+            int: Number of batch tasks enqueued
+        """
+        from apps.creators.tasks import send_email_batch_task
+
+        batches = list(EmailDeliveryService.chunks(list(delivery_ids)))
+        for batch in batches:
+            transaction.on_commit(
+                lambda batch=batch: send_email_batch_task.delay(batch))
+        return len(batches)
+
+    @staticmethod
+    def send(delivery_ids):
+        """
+        Send the unsent deliveries among the given ids over one connection.
+
+        Rows are claimed in a short transaction first: skip_locked keeps a
+        batch that is re-delivered to a second worker from being sent twice,
+        and the claim marks them ``sending`` and counts the attempt. The
+        SMTP batch runs outside any transaction and the outcomes are saved
+        in a second one. Rows whose outcome could not be saved stay
+        ``sending`` and are not retried automatically, so a message that
+        went out is not sent again.
+
+        Args:
+            delivery_ids (list): EmailDelivery ids
+        Returns:
+            dict: Counts of sent and failed messages
+        """
+        with transaction.atomic():
+            deliveries = list(
+                EmailDelivery.objects
+                .select_for_update(skip_locked=True)
+                .filter(id__in=delivery_ids, status__in=['pending', 'failed'])
+                .filter(attempts__lt=settings.EMAIL_MAX_ATTEMPTS)
+                .order_by('id')
+            )
+            EmailDelivery.objects.filter(id__in=[d.id for d in deliveries]).update(
+                status='sending', attempts=F('attempts') + 1)
+
+        messages = [
+            build_email(d.subject, d.message, d.recipient, d.html_message)
+            for d in deliveries
+        ]
+        errors = send_email_batch(messages)
+
+        with transaction.atomic():
+            now = timezone.now()
+            sent_ids = [d.id for d, error in zip(deliveries, errors) if error is None]
+            EmailDelivery.objects.filter(id__in=sent_ids).update(
+                status='sent', sent_at=now, error='')
+            failed = [(d, error) for d, error in zip(deliveries, errors) if error is not None]
+            for delivery, error in failed:
+                logger.error(
+                    f"Failed to send {delivery.campaign} email to {delivery.recipient}: {error}")
+                delivery.status = 'failed'
+                delivery.error = error
+            EmailDelivery.objects.bulk_update(
+                [delivery for delivery, _ in failed], ['status', 'error'])
+
+        return {"sent": len(sent_ids), "failed": len(failed)}
+
+    @staticmethod
+    def retry_failed(campaign=None):
+        """
+        Re-dispatch failed deliveries that still have attempts left.
+        Args:
+            campaign (str): Only retry this campaign
+        Returns:
+            int: Number of deliveries re-dispatched
+        """
+        failed = EmailDelivery.objects.filter(
+            status='failed', attempts__lt=settings.EMAIL_MAX_ATTEMPTS)
+        if campaign:
+            failed = failed.filter(campaign=campaign)
+        delivery_ids = list(failed.order_by('id').values_list('id', flat=True))
+        EmailDeliveryService.dispatch(delivery_ids)
+        return len(delivery_ids)
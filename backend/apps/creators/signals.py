@@ -1,10 +1,11 @@
 from datetime import datetime, timezone as dt_timezone
 from django.utils import timezone
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete, m2m_changed
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
-from apps.creators.models import CreatorProfile
+from apps.creators.caching import invalidate_creator
+from apps.creators.models import CreatorProfile, CreatorCategory, CreatorDiscoveryEntry
+from apps.creators.services.discovery import CreatorDiscoveryService
 from apps.creators.tasks import send_welcome_email_task, welcome_early_adopter_task
 
 User = get_user_model()
@@ -41,11 +42,61 @@ def creator_profile_post_save(sender, instance, created, **kwargs):
             # Send welcome email to early adopter asynchronously
             welcome_early_adopter_task.delay(instance.user.slug)
     else:
-        # On update (not creation), clear the view cache to ensure fresh data is shown
-        # The @cache_page decorator's cache will expire naturally after TTL,
-        # but this helps for immediate consistency
-        try:
-            cache.clear()
-        except Exception:
-            # Fail silently if cache clear fails - cache will expire on its own
-            pass
\ No newline at end of file
+        # On update (not creation), invalidate only this creator's cached
+        # public profile and the creator list
+        CreatorDiscoveryService.refresh([instance.id])
+        invalidate_creator(instance.user.slug)
+
+
+@receiver(post_delete, sender=CreatorProfile)
+def creator_profile_post_delete(sender, instance, **kwargs):
+    """Drop the cached public profile of a removed creator profile."""
+    try:
+        slug = instance.user.slug
+    except User.DoesNotExist:
+        # Deleted along with its user, the list generation still needs a bump
+        slug = None
+    invalidate_creator(slug)
+
+
+# User fields embedded in the public profile, list and discovery rows
+PUBLIC_USER_FIELDS = frozenset(['username', 'first_name', 'last_name', 'slug', 'user_type'])
+
+
+@receiver(post_save, sender=User)
+def creator_user_post_save(sender, instance, created, update_fields=None, **kwargs):
+    """User fields are embedded in the public profile and list responses."""
+    if update_fields is not None and not PUBLIC_USER_FIELDS & set(update_fields):
+        # e.g. last_login on every sign in
+        return
+    if not created and instance.user_type == 'creator':
+        CreatorDiscoveryService.update_user(instance)
+        invalidate_creator(instance.slug)
+
+
+@receiver(m2m_changed, sender=CreatorProfile.categories.through)
+def creator_categories_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep the per-category discovery rows in step with profile categories."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        CreatorDiscoveryService.refresh([instance.pk])
+        invalidate_creator(instance.user.slug)
+    elif action == "post_clear":
+        # category.creators.clear(), pk_set is not provided
+        CreatorDiscoveryEntry.objects.filter(category=instance).delete()
+        invalidate_creator(None)
+    else:
+        CreatorDiscoveryService.refresh(list(pk_set))
+        slugs = CreatorProfile.objects.filter(pk__in=pk_set).values_list(
+            'user__slug', flat=True)
+        for slug in slugs:
+            invalidate_creator(slug)
+
+
+@receiver(post_save, sender=CreatorCategory)
+def creator_category_post_save(sender, instance, created, **kwargs):
+    """Category slugs are denormalized onto the discovery rows."""
+    if not created:
+        CreatorDiscoveryEntry.objects.filter(category=instance).exclude(
+            category_slug=instance.slug).update(category_slug=instance.slug)
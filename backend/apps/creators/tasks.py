@@ -4,10 +4,12 @@ Handles async operations like sending welcome emails to new creators.
 """
 import logging
 from celery import shared_task
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from apps.wallets.models import Wallet
 from utils.send_emails import (
     send_welcome_email, send_daily_weekly_summary_email,
+    send_daily_weekly_summary_emails,
     send_reminder_to_share_creator_link_email,
     welcome_early_adopter_email)
 from celery.schedules import crontab
@@ -88,24 +90,78 @@ def send_daily_summary_email_task(wallet_id):
         raise
 
 
+@shared_task
+def send_summary_emails_chunk_task(wallet_ids, period='daily'):
+    """
+    Queue summary emails for one chunk of wallets.
+
+    Wallets whose balance dropped to zero since the chunk was dispatched
+    are skipped.
+
+    Args:
+        wallet_ids (list): Wallet ids in the chunk
+        period (str): 'daily' or 'weekly'
+
+    Returns:
+        str: Status message
+    """
+    try:
+        wallets = Wallet.objects.filter(id__in=wallet_ids, balance__gt=0)
+        queued = send_daily_weekly_summary_emails(wallets, period=period)
+        return f"Queued {queued} {period} summary emails"
+    except Exception as e:
+        logger.error(f"Error in send_summary_emails_chunk_task: {str(e)}")
+        raise
+
+
+@shared_task
+def dispatch_daily_summary_emails_task():
+    """
+    Fan the daily summary emails out to chunk tasks.
+
+    Streams the ids of every wallet with a positive balance at run time, so
+    the recipients are always current without restarting beat.
+
+    Returns:
+        str: Status message
+    """
+    try:
+        chunk_size = settings.SUMMARY_EMAIL_CHUNK_SIZE
+        wallet_ids = (
+            Wallet.objects.filter(balance__gt=0)
+            .order_by('id')
+            .values_list('id', flat=True)
+            .iterator(chunk_size=chunk_size)
+        )
+        chunks = 0
+        chunk = []
+        for wallet_id in wallet_ids:
+            chunk.append(str(wallet_id))
+            if len(chunk) == chunk_size:
+                send_summary_emails_chunk_task.delay(chunk, 'daily')
+                chunks += 1
+                chunk = []
+        if chunk:
+            send_summary_emails_chunk_task.delay(chunk, 'daily')
+            chunks += 1
+        logger.info(f"Dispatched {chunks} daily summary email chunks")
+        return f"Dispatched {chunks} daily summary email chunks"
+    except Exception as e:
+        logger.error(f"Error in dispatch_daily_summary_emails_task: {str(e)}")
+        raise
+
+
 # Schedule task to send daily summary emails to creators every day at 7:30 AM
 @app.on_after_finalize.connect
 def setup_periodic_tasks(sender, **kwargs):
-    """Schedule the daily summary email task to run every day at 7:30 AM for
-    every wallet with a positive balance.
-    Fetch all wallets and check if they have balance, then schedule the email task.
+    """Schedule the daily summary dispatcher to run every day at 7:30 AM.
+    The wallets with a positive balance are looked up when it runs.
     """
-    try:
-        wallets = Wallet.objects.filter(balance__gt=0)
-        for wallet in wallets:
-            # Use task.s() to create a task signature for scheduling
-            sender.add_periodic_task(
-                crontab(hour=7, minute=30),  # Run every day at 7:30 AM
-                send_daily_summary_email_task.s(wallet.id),
-                name=f'Send daily summary email for wallet {wallet.id}'
-            )
-    except Exception as e:
-        logger.error(f"Error setting up periodic tasks: {str(e)}")
+    sender.add_periodic_task(
+        crontab(hour=7, minute=30),  # Run every day at 7:30 AM
+        dispatch_daily_summary_emails_task.s(),
+        name='Send daily summary emails'
+    )
 
 
 @shared_task
@@ -119,9 +175,9 @@ def send_reminder_to_share_creator_link_email_task():
     try:
         from apps.wallets.models import Wallet
         wallets = Wallet.objects.filter(balance=0)
-        send_reminder_to_share_creator_link_email(wallets)
-        logger.info(f"Sent reminder email to {wallets.count()} creators to share their creator link")
-        return f"Sent reminder emails to {wallets.count()} creators"
+        queued = send_reminder_to_share_creator_link_email(wallets)
+        logger.info(f"Queued reminder email to {queued} creators to share their creator link")
+        return f"Queued reminder emails to {queued} creators"
     except Exception as e:
         logger.error(f"Error in send_reminder_to_share_creator_link_email_task: {str(e)}")
         raise
@@ -172,3 +228,57 @@ def welcome_early_adopter_task(slug):
     except Exception as e:
         logger.error(f"Error in welcome_early_adopter_task for slug {slug}: {str(e)}")
         raise
+
+
+@shared_task(rate_limit=settings.EMAIL_BATCH_RATE_LIMIT)
+def send_email_batch_task(delivery_ids):
+    """
+    Send one batch of queued campaign emails over a single SMTP connection.
+
+    Rate limited per worker so large campaigns stay under the mail
+    provider's sending limits.
+
+    Args:
+        delivery_ids (list): EmailDelivery ids in the batch
+
+    Returns:
+        str: Status message
+    """
+    from apps.creators.services.email_delivery import EmailDeliveryService
+    try:
+        result = EmailDeliveryService.send(delivery_ids)
+        return f"Sent {result['sent']} emails, {result['failed']} failed"
+    except Exception as e:
+        logger.error(f"Error in send_email_batch_task: {str(e)}")
+        raise
+
+
+@shared_task
+def retry_failed_emails_task(campaign=None):
+    """
+    Re-send failed campaign emails that have attempts left.
+
+    Args:
+        campaign (str): Only retry this campaign
+
+    Returns:
+        str: Status message
+    """
+    from apps.creators.services.email_delivery import EmailDeliveryService
+    try:
+        retried = EmailDeliveryService.retry_failed(campaign)
+        return f"Retrying {retried} failed emails"
+    except Exception as e:
+        logger.error(f"Error in retry_failed_emails_task: {str(e)}")
+        raise
+
+
+# Retry failed campaign emails every hour
+@app.on_after_finalize.connect
+def setup_retry_failed_emails_task(sender, **kwargs):
+    """Schedule the failed email retry task to run every hour."""
+    sender.add_periodic_task(
+        crontab(minute=15),
+        retry_failed_emails_task.s(),
+        name='Retry failed campaign emails every hour'
+    )
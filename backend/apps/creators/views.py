@@ -2,10 +2,11 @@ from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
-from django.views.decorators.cache import cache_page
-from django.utils.decorators import method_decorator
+from rest_framework.pagination import CursorPagination
+from django.db.models.functions import Lower
+from apps.creators import caching
 from apps.creators.models import CreatorProfile
+from apps.creators.services.discovery import CreatorDiscoveryService
 from apps.creators.serializers import (
     CreatorPublicSerializer, CreatorListSerializer,
     UpdateCreatorProfileSerializer, UserTypeSelectionSerializer
@@ -13,6 +14,7 @@ from apps.creators.serializers import (
 from drf_spectacular.utils import extend_schema
 from utils import serializers as helpers
 from utils.authentication import RequireAPIKey
+from utils.pagination import MAX_PAGE_SIZE, SizedPageNumberPagination, use_cursor_pagination
 
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -137,7 +139,6 @@ class CreatorPublicView(APIView):
     permission_classes = [AllowAny]
     serializer_class = CreatorPublicSerializer
 
-    @method_decorator(cache_page(60 * 10))  # Cache for 10 minutes (stable public profiles)
     @extend_schema(
         operation_id="retrieve_creator",
         summary="Retrieve a Creator",
@@ -166,29 +167,51 @@ class CreatorPublicView(APIView):
         slug : str
             Creator slug
         """
-        try:
-            creator_profile = CreatorProfile.objects.select_related('user').get(
-                user__slug__iexact=slug, status="active")
-        except CreatorProfile.DoesNotExist:
+        data = caching.cached_response_data(
+            lambda: caching.get_profile_cache_key(request, slug),
+            lambda: self.get_profile_data(request, slug),
+            caching.PROFILE_CACHE_TTL,
+        )
+        if data is None:
             return Response(
                 {"status": "error", "message": "Creator profile not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        serializer = CreatorPublicSerializer(
-            creator_profile, context={'request': request})
         return Response(
-            {"status": "success", "data": serializer.data},
+            {"status": "success", "data": data},
             status=status.HTTP_200_OK,
         )
 
+    def get_profile_data(self, request, slug):
+        """Serialized public profile, None if there is no active profile."""
+        try:
+            # Lower() matches the case-insensitive unique index on the slug
+            creator_profile = (
+                CreatorProfile.objects.select_related('user')
+                .annotate(slug_lower=Lower('user__slug'))
+                .get(slug_lower=slug.lower(), status="active")
+            )
+        except CreatorProfile.DoesNotExist:
+            return None
+
+        serializer = CreatorPublicSerializer(
+            creator_profile, context={'request': request})
+        return serializer.data
+
+
+class PopularityCursorPagination(CursorPagination):
+    """Keyset pagination over the discovery feed, most followed first."""
+    ordering = ('-followers_count', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+
 
 class CreatorsListView(APIView):
     permission_classes = [AllowAny]
     serializer_class = CreatorListSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = SizedPageNumberPagination
 
-    @method_decorator(cache_page(60 * 5))  # Cache for 5 minutes
     @extend_schema(
         operation_id="fetch_creators",
         summary="Fetch Active/Verfified Creators",
@@ -203,32 +226,50 @@ class CreatorsListView(APIView):
     def get(self, request) -> Response:
         """List active public creators for discovery.
 
-        Returns a paginated list of creators that are publicly visible. Supports
-        search and filtering to help patrons discover creators by name, category,
-        or tags.
+        Returns a paginated list of creators that are publicly visible, most
+        followed first. Supports search and filtering to help patrons discover
+        creators by name or category.
 
         Authentication
         --------------
         Public endpoint (no authentication required).
+
+        Query Parameters
+        ----------------
+        category : str
+            Only creators in the category with this slug
+        search : str
+            Prefix of the creator's username or full name
+        pagination : str
+            ``cursor`` for cursor pagination (follow the ``next`` links)
         """
-        # Optimized query: select_related for user, prefetch_related for M2M relationships
-        creator_profiles = (
-            CreatorProfile.objects
-            .select_related('user')
-            .prefetch_related('categories')
-            .filter(status="active", verified=True)
-            .order_by('-followers_count')
+        data = caching.cached_response_data(
+            lambda: caching.get_list_cache_key(request),
+            lambda: self.get_list_data(request),
+            caching.LIST_CACHE_TTL,
+        )
+        return Response(data)
+
+    def get_list_data(self, request):
+        """Paginated list response data."""
+        entries = CreatorDiscoveryService.get_feed(
+            category=request.query_params.get('category'),
+            search=request.query_params.get('search'),
         )
 
         # Apply pagination
-        paginator = self.pagination_class()
-        paginator.page_size = request.query_params.get('page_size', 20)
-        paginated_creators = paginator.paginate_queryset(creator_profiles, request)
+        if use_cursor_pagination(request):
+            paginator = PopularityCursorPagination()
+        else:
+            paginator = self.pagination_class()
+        paginator.page_size = 20
+        page = paginator.paginate_queryset(entries, request)
 
         serializer = CreatorListSerializer(
-            paginated_creators, many=True, context={'request': request})
-        
+            CreatorDiscoveryService.get_profiles(page), many=True,
+            context={'request': request})
+
         return paginator.get_paginated_response({
             "status": "success",
             "data": serializer.data,
-        })
+        }).data
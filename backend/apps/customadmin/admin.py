@@ -4,7 +4,10 @@ from django.contrib.auth import get_user_model
 from django.utils.html import format_html
 from django.urls import reverse
 from apps.customauth.models import APIClient
+from apps.customauth.api_keys import invalidate_api_keys
+from apps.creators.caching import invalidate_creator
 from apps.creators.models import CreatorProfile
+from apps.creators.services.discovery import CreatorDiscoveryService
 from apps.payments.models import Payment, PaymentStatus
 from apps.payments.models import PaymentWebhookLog as WebHook
 from apps.wallets.models import (
@@ -64,7 +67,7 @@ class WalletTransactionAdmin(admin.ModelAdmin):
         "status",
         "finalize_payout",
     )
-    list_filter = ("transaction_type", "status", "created_at")
+    list_filter = ("transaction_type", "status", "disbursement_status", "created_at")
     search_fields = ("wallet__creator__user__email", "wallet__creator__user__username")
 
     def finalize_payout(self, obj):
@@ -114,7 +117,7 @@ class WalletAdmin(admin.ModelAdmin):
         """
         for wallet in queryset:
             wallet.is_verified = True
-            wallet.save()
+            wallet.save(update_fields=["is_verified", "updated_at"])
 
 
 class PaymentAdmin(admin.ModelAdmin):
@@ -328,14 +331,18 @@ class APIClientAdmin(admin.ModelAdmin):
 
     def deactivate_clients(self, request, queryset):
         """Action to deactivate clients."""
+        api_keys = list(queryset.values_list("api_key", flat=True))
         queryset.update(is_active=False)
+        invalidate_api_keys(*api_keys)
         self.message_user(request, f"{queryset.count()} clients deactivated.")
 
     deactivate_clients.short_description = "Deactivate selected clients"
 
     def activate_clients(self, request, queryset):
         """Action to activate clients."""
+        api_keys = list(queryset.values_list("api_key", flat=True))
         queryset.update(is_active=True)
+        invalidate_api_keys(*api_keys)
         self.message_user(request, f"{queryset.count()} clients activated.")
 
     activate_clients.short_description = "Activate selected clients"
@@ -392,16 +399,29 @@ class CreatorProfileAdmin(admin.ModelAdmin):
         except Exception as e:
             self.message_user(request, f"Error sending welcome emails: {str(e)}", level="error")
 
+    def update_creators(self, queryset, **fields):
+        """
+        Bulk update creators, then re-index and invalidate them since
+        update() sends no post_save.
+        """
+        # Read first, the changelist filters may no longer match afterwards
+        profiles = list(queryset.values_list("id", "user__slug"))
+        count = queryset.update(**fields)
+        CreatorDiscoveryService.refresh([profile_id for profile_id, _ in profiles])
+        for _, slug in profiles:
+            invalidate_creator(slug)
+        return count
+
     @admin.action(description="Verify selected creators")
     def verify_creator(self, request, queryset):
         """Admin action to verify creators."""
-        count = queryset.update(verified=True)
+        count = self.update_creators(queryset, verified=True)
         self.message_user(request, f"Verified {count} creators.")
 
     @admin.action(description="Mark selected creators as early adopters")
     def mark_as_early_adopter(self, request, queryset):
         """Admin action to mark creators as early adopters."""
-        count = queryset.update(is_early_adopter=True)
+        count = self.update_creators(queryset, is_early_adopter=True)
         self.message_user(request, f"Marked {count} creators as early adopters.")
 
 
@@ -0,0 +1,137 @@
+"""
+Cached resolution of X-API-Key values to active APIClient records.
+
+Lookups go through a small in-process LRU backed by the shared Redis cache,
+so the middleware and the DRF authentication class resolve a key without
+touching the database on the hot path. Keys are stored hashed. Redis entries
+are invalidated explicitly whenever a client's key or active flag changes;
+the in-process entries cannot be cleared from other processes and use a
+short TTL instead.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_SIZE = 512
+LOCAL_CACHE_TTL = 30
+SHARED_CACHE_TTL = 300
+# Unknown/inactive keys are cached briefly so bad keys don't hit the database
+NEGATIVE_CACHE_TTL = 30
+MISSING = "missing"
+
+
+class LocalLRUCache:
+    """Thread-safe LRU with per-entry expiry"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns:
+            tuple: (found, value)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return False, None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+local_cache = LocalLRUCache(LOCAL_CACHE_SIZE, LOCAL_CACHE_TTL)
+
+
+def get_cache_key(api_key):
+    return f"api_client:{hashlib.sha256(api_key.encode()).hexdigest()}"
+
+
+def resolve_api_client(api_key):
+    """
+    Resolve an API key to its active client.
+    Args:
+        api_key (str): The X-API-Key header value
+    Returns:
+        APIClient or None: The active client, None if unknown or inactive
+    """
+    from apps.customauth.models import APIClient
+
+    if not api_key:
+        return None
+    key = get_cache_key(api_key)
+    found, client = local_cache.get(key)
+    if found:
+        return client
+
+    try:
+        cached = cache.get(key)
+    except Exception as e:
+        logger.warning(f"API key cache unavailable: {str(e)}")
+        cached = None
+
+    if cached is None:
+        client = APIClient.objects.filter(api_key=api_key, is_active=True).first()
+        try:
+            if client is None:
+                cache.set(key, MISSING, NEGATIVE_CACHE_TTL)
+            else:
+                cache.set(key, client, SHARED_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"API key cache unavailable: {str(e)}")
+    else:
+        client = None if isinstance(cached, str) and cached == MISSING else cached
+
+    local_cache.set(key, client)
+    return client
+
+
+def invalidate_api_keys(*api_keys):
+    """
+    Drop cached lookups for the given keys, now and again once the
+    surrounding transaction commits (so a lookup racing the write can't
+    re-cache the old row).
+    Args:
+        *api_keys (str): API keys whose cached client is stale
+    """
+    keys = [get_cache_key(api_key) for api_key in api_keys if api_key]
+    if not keys:
+        return
+
+    def _delete():
+        for key in keys:
+            local_cache.delete(key)
+        try:
+            cache.delete_many(keys)
+        except Exception as e:
+            logger.warning(f"API key cache unavailable: {str(e)}")
+
+    _delete()
+    transaction.on_commit(_delete)
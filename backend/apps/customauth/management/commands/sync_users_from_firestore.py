@@ -1,7 +1,7 @@
 from django.core.management.base import BaseCommand
 from firebase_admin import firestore
-from apps.customauth.models import CustomUser
 from apps.customauth.firebase import initialize_firebase
+from apps.customauth.services.firestore_sync import FirestoreUserSyncService
 
 
 class Command(BaseCommand):
@@ -20,6 +20,22 @@ class Command(BaseCommand):
             action='store_true',
             help='Show what would be synced without making changes'
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=FirestoreUserSyncService.CHUNK_SIZE,
+            help=f'Users written per chunk (default: {FirestoreUserSyncService.CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue after the last chunk of an interrupted sync'
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only sync users changed since the last incremental sync'
+        )
 
     def handle(self, *args, **options):
         # Initialize Firebase
@@ -38,101 +54,64 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f'✗ Failed to connect to Firestore: {str(e)}'))
             return
 
-        # Fetch users from Firestore
+        # Stream users in document id order, so a checkpoint marks a position
         try:
             users_ref = db.collection('users')
-            firestore_users = users_ref.stream()
-            self.stdout.write(self.style.SUCCESS('✓ Fetched users from Firestore'))
+            if options['incremental']:
+                mark = FirestoreUserSyncService.get_high_water_mark()
+                self.stdout.write(self.style.SUCCESS(
+                    f'✓ Syncing users changed since {mark[0] if mark else "the start"}'))
+            else:
+                users_query = users_ref.order_by('__name__')
+                cursor = FirestoreUserSyncService.get_checkpoint() if options['resume'] else None
+                if cursor:
+                    users_query = users_query.start_after({'__name__': cursor})
+                    self.stdout.write(self.style.SUCCESS(f'✓ Resuming after user {cursor}'))
+                firestore_users = users_query.stream()
+                self.stdout.write(self.style.SUCCESS('✓ Fetched users from Firestore'))
         except Exception as e:
             self.stdout.write(self.style.ERROR(f'✗ Failed to fetch users from Firestore: {str(e)}'))
             return
 
-        # Process and sync users
-        user_type = options['user_type']
         dry_run = options['dry_run']
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
 
         self.stdout.write('\n' + '=' * 60)
         self.stdout.write('SYNCING USERS FROM FIRESTORE')
         self.stdout.write('=' * 60 + '\n')
 
-        for user_doc in firestore_users:
-            try:
-                user_data = user_doc.to_dict()
-                user_id = user_doc.id
-                # Extract required fields
-                email = user_data.get('email', '').strip().lower()
-                username = user_data.get('username', user_data.get('slug')).strip().lower()
-                first_name = user_data.get('firstName', user_data.get('first_name', '')).strip()
-                last_name = user_data.get('lastName', user_data.get('last_name', '')).strip()
-                phone_number = user_data.get('phoneNumber', user_data.get('phone_number', '')).strip()
-
-                # Skip if missing email, if username is missing, use email as username
-                if not email:
-                    self.stdout.write(
-                        self.style.WARNING(f'⊘ Skipped user {user_id}: missing email')
-                    )
-                    skipped_count += 1
-                    continue
-                          
-                # Prepare user data
-                user_defaults = {
-                    'first_name': first_name,
-                    'last_name': last_name,
-                    'phone_number': phone_number,
-                    'user_type': user_type,
-                }
-
-                if not dry_run:
-                    # Create or update user
-                    user_obj, created = CustomUser.objects.update_or_create(
-                        email=email,
-                        defaults={
-                            'username': username,
-                            **user_defaults
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                        self.stdout.write(
-                            self.style.SUCCESS(f'✓ Created user: {email} ({username})')
-                        )
-                    else:
-                        updated_count += 1
-                        self.stdout.write(
-                            self.style.WARNING(f'↻ Updated user: {email} ({username})')
-                        )
-                else:
-                    # Dry run - just show what would be created/updated
-                    try:
-                        existing_user = CustomUser.objects.get(email=email)
-                        updated_count += 1
-                        self.stdout.write(
-                            f'↻ [DRY RUN] Would update user: {email} ({username})'
-                        )
-                    except CustomUser.DoesNotExist:
-                        created_count += 1
-                        self.stdout.write(
-                            f'✓ [DRY RUN] Would create user: {email} ({username})'
-                        )
-
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'✗ Error processing user {user_id}: {str(e)}')
-                )
-                skipped_count += 1
-                continue
+        def report(counts):
+            synced = counts['created'] + counts['updated'] + counts['unchanged']
+            self.stdout.write(f'… {synced} users synced')
+
+        if options['incremental']:
+            counts = FirestoreUserSyncService.sync_incremental(
+                users_ref,
+                user_type=options['user_type'],
+                page_size=options['chunk_size'],
+                dry_run=dry_run,
+                on_chunk=report,
+            )
+        else:
+            counts = FirestoreUserSyncService.sync(
+                firestore_users,
+                user_type=options['user_type'],
+                chunk_size=options['chunk_size'],
+                dry_run=dry_run,
+                on_chunk=report,
+            )
 
         # Summary
         self.stdout.write('\n' + '=' * 60)
         self.stdout.write('SYNC SUMMARY')
         self.stdout.write('=' * 60)
-        self.stdout.write(self.style.SUCCESS(f'✓ Created: {created_count}'))
-        self.stdout.write(self.style.WARNING(f'↻ Updated: {updated_count}'))
-        self.stdout.write(self.style.ERROR(f'⊘ Skipped: {skipped_count}'))
+        self.stdout.write(self.style.SUCCESS(f'✓ Created: {counts["created"]}'))
+        self.stdout.write(self.style.WARNING(f'↻ Updated: {counts["updated"]}'))
+        self.stdout.write(f'= Unchanged: {counts["unchanged"]}')
+        self.stdout.write(self.style.ERROR(f'⊘ Skipped: {counts["skipped"]}'))
+        if counts['failed']:
+            self.stdout.write(self.style.ERROR(f'✗ Failed: {counts["failed"]} (see logs)'))
+            if not options['incremental'] and not dry_run:
+                self.stdout.write(self.style.WARNING('Sync stopped, rerun with --resume to continue'))
 
         if dry_run:
             self.stdout.write(self.style.WARNING('\n[DRY RUN MODE] - No changes were made to the database'))
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customauth', '0002_synccheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='sync_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='synccheckpoint',
+            name='timestamp',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:05
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def dedupe_case_insensitive(apps, schema_editor):
+    """
+    Suffix the later users whose username or slug only differs by case from
+    an earlier one, so the Lower() unique constraints build
+    """
+    CustomUser = apps.get_model('customauth', 'CustomUser')
+    for field in ('username', 'slug'):
+        duplicated = (
+            CustomUser.objects
+            .annotate(value_lower=Lower(field))
+            .order_by()
+            .values('value_lower')
+            .annotate(count=Count('id'))
+            .filter(count__gt=1)
+            .values_list('value_lower', flat=True)
+        )
+        for value_lower in list(duplicated):
+            users = (
+                CustomUser.objects.annotate(value_lower=Lower(field))
+                .filter(value_lower=value_lower)
+                .order_by('date_joined', 'id')
+            )
+            for user in list(users)[1:]:
+                value = getattr(user, field)
+                n = 1
+                while CustomUser.objects.annotate(value_lower=Lower(field)).filter(
+                        value_lower=f"{value}-{n}".lower()).exists():
+                    n += 1
+                setattr(user, field, f"{value}-{n}")
+                user.save(update_fields=[field])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('customauth', '0003_incremental_firestore_sync'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_case_insensitive, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='unique_username_lower', violation_error_message='A user with that username already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('slug'), name='unique_slug_lower', violation_error_message='A user with that slug already exists.'),
+        ),
+    ]
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
 from django.utils.text import slugify
@@ -54,17 +56,43 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     is_superuser = models.BooleanField(default=False)
     date_joined = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    # Hash of the Firestore fields last synced into this user, unchanged
+    # documents are skipped without writing
+    sync_hash = models.CharField(max_length=64, blank=True)
 
     objects = CustomUserManager()
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
+    # Suffixes tried by save() before giving up on a taken username
+    USERNAME_ATTEMPTS = 5
 
     class Meta:
         db_table = 'auth_customuser'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
         ordering = ['-date_joined']
+        constraints = [
+            # Case-insensitive uniqueness, these indexes also serve the
+            # Lower() lookups of usernames and public profile slugs
+            models.UniqueConstraint(
+                Lower('username'),
+                name='unique_username_lower',
+                violation_error_message='A user with that username already exists.',
+            ),
+            models.UniqueConstraint(
+                Lower('slug'),
+                name='unique_slug_lower',
+                violation_error_message='A user with that slug already exists.',
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Username as loaded, save() only allocates a new one when it changes
+        instance._stored_username = instance.__dict__.get('username')
+        return instance
 
     def __str__(self):
         return f'{self.email} {self.username}'
@@ -85,35 +113,83 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
         """Check if user is admin or staff."""
         return self.user_type in ['admin', 'staff']
 
-    def save(self, *args, **kwargs):
+    @classmethod
+    def get_available_username(cls, username, exclude_pk=None):
         """
-        Override save to:
-        1. Replace spaces with hyphens (preserve case for display)
-        2. Check if username exists (case-insensitive)
-        3. If exists, append random digits to avoid duplicates
-        4. Auto-generate slug from final username
+        Normalise a username and make it unique.
+        Args:
+            username (str): The requested username
+            exclude_pk: Pk of the user being updated, if any
+        Returns:
+            str: The username with spaces replaced by hyphens, plus random
+                digits if it is already taken (case-insensitive)
         """
         # Replace spaces with hyphens, preserve case for display
-        self.username = self.username.replace(' ', '-')
-        
-        # Check if username exists (case-insensitive lookup)
-        username_to_check = self.username
-        existing = CustomUser.objects.filter(username__iexact=username_to_check)
-        
+        username = username.replace(' ', '-')
+
+        # Check if username exists (case-insensitive, uses the Lower() index)
+        existing = cls.objects.annotate(
+            username_lower=Lower('username')).filter(username_lower=username.lower())
+
         # Exclude the current user if updating (not creating)
-        if self.pk:
-            existing = existing.exclude(pk=self.pk)
-        
+        if exclude_pk:
+            existing = existing.exclude(pk=exclude_pk)
+
         # If username exists, append random digits
         if existing.exists():
             random_suffix = ''.join([str(secrets.randbelow(10)) for _ in range(4)])
-            self.username = f"{username_to_check}{random_suffix}"
-        
-        # Generate slug from the final username if not present
-        if not self.slug:
-            self.slug = slugify(self.username).lower()
-        
-        super().save(*args, **kwargs)
+            username = f"{username}{random_suffix}"
+        return username
+
+    def is_username_taken(self, check_slug=True):
+        """Whether another user holds this username (or slug), ignoring case"""
+        taken = Q(username_lower=self.username.lower())
+        if check_slug:
+            taken |= Q(slug_lower=self.slug.lower())
+        return (
+            CustomUser.objects
+            .annotate(username_lower=Lower('username'), slug_lower=Lower('slug'))
+            .filter(taken)
+            .exclude(pk=self.pk)
+            .exists()
+        )
+
+    def save(self, *args, **kwargs):
+        """
+        Override save to:
+        1. Replace spaces with hyphens (preserve case for display)
+        2. Auto-generate slug from the username if not present
+        3. If the database rejects the username or slug as taken
+           (case-insensitive unique indexes), append random digits and retry
+
+        Saves that leave the username unchanged (e.g. last_login updates)
+        skip all of this and run no extra query.
+        """
+        update_fields = kwargs.get('update_fields')
+        unchanged = self.username == getattr(self, '_stored_username', None) or (
+            update_fields is not None and 'username' not in update_fields)
+        if unchanged and self.slug:
+            super().save(*args, **kwargs)
+            return
+
+        self.username = self.username.replace(' ', '-')
+        requested = self.username
+        generate_slug = not self.slug
+        for attempt in range(1, CustomUser.USERNAME_ATTEMPTS + 1):
+            if generate_slug:
+                self.slug = slugify(self.username).lower()
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                break
+            except IntegrityError:
+                # Other constraints (e.g. email) are not retried
+                if attempt == CustomUser.USERNAME_ATTEMPTS or not self.is_username_taken(
+                        check_slug=generate_slug):
+                    raise
+                random_suffix = ''.join([str(secrets.randbelow(10)) for _ in range(4)])
+                self.username = f"{requested}{random_suffix}"
+        self._stored_username = self.username
 
 
 class APIClient(models.Model):
@@ -147,11 +223,42 @@ class APIClient(models.Model):
 
     def save(self, *args, **kwargs):
         """Generate API key if not present."""
+        from apps.customauth.api_keys import invalidate_api_keys
         if not self.api_key:
             self.api_key = f"sk_{secrets.token_urlsafe(32)}"
         super().save(*args, **kwargs)
+        # is_active (or anything else) may have changed
+        invalidate_api_keys(self.api_key)
+
+    def delete(self, *args, **kwargs):
+        from apps.customauth.api_keys import invalidate_api_keys
+        api_key = self.api_key
+        result = super().delete(*args, **kwargs)
+        invalidate_api_keys(api_key)
+        return result
 
     def regenerate_api_key(self):
         """Regenerate the API key."""
+        from apps.customauth.api_keys import invalidate_api_keys
+        old_api_key = self.api_key
         self.api_key = f"sk_{secrets.token_urlsafe(32)}"
         self.save()
+        invalidate_api_keys(old_api_key)
+
+
+class SyncCheckpoint(models.Model):
+    """Resume point of a long running import, e.g. the Firestore user sync."""
+
+    name = models.CharField(max_length=100, unique=True)
+    cursor = models.CharField(max_length=255, blank=True)
+    # Update time of the cursor document, for incremental syncs
+    timestamp = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'auth_synccheckpoint'
+        verbose_name = 'Sync Checkpoint'
+        verbose_name_plural = 'Sync Checkpoints'
+
+    def __str__(self):
+        return f'{self.name}: {self.cursor}'
@@ -0,0 +1,386 @@
+"""
+Bulk import of the Firestore "users" collection.
+
+Documents are synced in chunks: existing users are resolved with one query
+per chunk, new users are inserted and changed users updated in bulk, and the
+rows the post_save signals would create one user at a time (creator profile,
+wallet, KYC and payout account) are created set-wise. The id of the last
+document of each committed chunk is saved as a checkpoint, so an interrupted
+sync can resume where it stopped.
+
+The incremental mode only reads the documents changed since the last run,
+ordered by their updatedAt field and id, and keeps that position as a high
+water mark. Documents whose synced fields hash the same as on the last sync
+are not written at all.
+"""
+import hashlib
+import json
+import logging
+import secrets
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.text import slugify
+from apps.creators.caching import invalidate_creator
+from apps.creators.models import CreatorProfile
+from apps.creators.services.discovery import CreatorDiscoveryService
+from apps.customauth.models import CustomUser, SyncCheckpoint
+from apps.wallets.models import Wallet, WalletKYC, WalletPayoutAccount
+from utils.send_emails import send_welcome_emails
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreUserSyncService:
+    """Syncs Firestore user documents into CustomUser in bulk"""
+
+    CHECKPOINT = "firestore_users"
+    INCREMENTAL_CHECKPOINT = "firestore_users_incremental"
+    UPDATED_AT_FIELD = "updatedAt"
+    CHUNK_SIZE = 500
+    # Fields copied from the Firestore document
+    SYNCED_FIELDS = ["username", "first_name", "last_name", "phone_number", "user_type"]
+
+    @staticmethod
+    def parse_document(user_doc, user_type):
+        """
+        Extract the synced fields of a Firestore user document.
+        Args:
+            user_doc: Firestore document snapshot (id and to_dict())
+            user_type (str): User type given to the synced users
+        Returns:
+            dict or None: The user fields and their sync_hash, None when
+                email or username is missing
+        """
+        user_data = user_doc.to_dict() or {}
+
+        def get(*keys):
+            for key in keys:
+                if user_data.get(key):
+                    return str(user_data[key]).strip()
+            return ''
+
+        email = get('email').lower()
+        username = get('username', 'slug').lower()
+        if not email or not username:
+            return None
+        row = {
+            'email': email,
+            'username': username,
+            'first_name': get('firstName', 'first_name'),
+            'last_name': get('lastName', 'last_name'),
+            'phone_number': get('phoneNumber', 'phone_number'),
+            'user_type': user_type,
+        }
+        # Hashed as sent, before the username is made unique
+        row['sync_hash'] = hashlib.sha256(json.dumps(
+            [row[field] for field in FirestoreUserSyncService.SYNCED_FIELDS]
+        ).encode()).hexdigest()
+        return row
+
+    @staticmethod
+    def get_updated_at(user_doc):
+        return (user_doc.to_dict() or {}).get(FirestoreUserSyncService.UPDATED_AT_FIELD)
+
+    @staticmethod
+    def chunks(documents, size):
+        chunk = []
+        for document in documents:
+            chunk.append(document)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def assign_usernames(rows, existing):
+        """
+        Make the usernames of a chunk unique with one query, the bulk
+        counterpart of CustomUser.get_available_username.
+
+        A username taken by another user, in the database or earlier in the
+        chunk, gets random digits appended, unless the user already holds
+        such a suffixed name. New users also need the slug derived from it
+        to be free.
+        Args:
+            rows (list): Parsed documents, updated in place
+            existing (dict): Existing users by email
+        """
+        for row in rows:
+            row['username'] = row['username'].replace(' ', '-')
+        names = {row['username'].lower() for row in rows}
+        slugs = {slugify(name) for name in names}
+        # Lowercased username or slug: email of the user holding it
+        taken = {}
+        for username, slug, email in (
+            CustomUser.objects
+            .annotate(username_lower=Lower('username'), slug_lower=Lower('slug'))
+            .filter(Q(username_lower__in=names) | Q(slug_lower__in=slugs))
+            .values_list('username_lower', 'slug_lower', 'email')
+        ):
+            taken[username] = email
+            taken[slug] = email
+
+        for row in rows:
+            username = row['username']
+            user = existing.get(row['email'])
+            while any(
+                taken.get(key, row['email']) != row['email']
+                for key in (username.lower(), slugify(username) if user is None else None)
+                if key
+            ):
+                if user and user.username.lower().startswith(row['username'].lower()):
+                    # Keep the suffix given on an earlier sync
+                    username = user.username
+                    break
+                random_suffix = ''.join(str(secrets.randbelow(10)) for _ in range(4))
+                username = f"{row['username']}{random_suffix}"
+            row['username'] = username
+            taken[username.lower()] = row['email']
+            taken[slugify(username)] = row['email']
+
+    @staticmethod
+    def provision_creators(created, updated):
+        """
+        Apply what the user post_save signals do, set-wise: creators get a
+        profile, wallet, KYC and payout account, users that are no longer
+        creators lose their profile, and changed creators are re-indexed.
+        Args:
+            created (list): Users inserted by the chunk
+            updated (list): Existing users changed by the chunk
+        """
+        CreatorProfile.objects.filter(
+            user__in=[user for user in updated if user.user_type != 'creator']
+        ).delete()
+
+        creators = [user for user in created + updated if user.user_type == 'creator']
+        existing_profiles = dict(
+            CreatorProfile.objects.filter(user__in=creators).values_list('user_id', 'id'))
+        profiles = CreatorProfile.objects.bulk_create([
+            CreatorProfile(user=user) for user in creators
+            if user.pk not in existing_profiles
+        ])
+        wallets = Wallet.objects.bulk_create([Wallet(creator=profile) for profile in profiles])
+        WalletKYC.objects.bulk_create([WalletKYC(wallet=wallet) for wallet in wallets])
+        WalletPayoutAccount.objects.bulk_create(
+            [WalletPayoutAccount(wallet=wallet) for wallet in wallets])
+
+        changed = [user for user in updated if user.pk in existing_profiles]
+        if changed:
+            CreatorDiscoveryService.refresh(
+                [existing_profiles[user.pk] for user in changed])
+            for user in changed:
+                invalidate_creator(user.slug)
+
+        welcome = [user for user in created if user.user_type == 'creator']
+        if welcome:
+            send_welcome_emails(welcome)
+
+    @staticmethod
+    def sync_chunk(rows, dry_run=False):
+        """
+        Create or update the users of one chunk.
+        Args:
+            rows (list): Parsed documents
+            dry_run (bool): Only count what would change
+        Returns:
+            dict: Counts of created, updated and unchanged users
+        """
+        # A repeated email keeps its last document
+        rows = list({row['email']: row for row in rows}.values())
+        existing = CustomUser.objects.in_bulk(
+            [row['email'] for row in rows], field_name='email')
+        changed = [
+            row for row in rows
+            if row['email'] not in existing
+            or existing[row['email']].sync_hash != row['sync_hash']
+        ]
+        if dry_run:
+            created = sum(1 for row in changed if row['email'] not in existing)
+            return {
+                'created': created,
+                'updated': len(changed) - created,
+                'unchanged': len(rows) - len(changed),
+            }
+
+        FirestoreUserSyncService.assign_usernames(changed, existing)
+        fields = FirestoreUserSyncService.SYNCED_FIELDS + ['sync_hash']
+        now = timezone.now()
+        to_create, to_update = [], []
+        for row in changed:
+            user = existing.get(row['email'])
+            if user is None:
+                user = CustomUser(slug=slugify(row['username']).lower(), **row)
+                user.set_unusable_password()
+                to_create.append(user)
+            else:
+                for field in fields:
+                    setattr(user, field, row[field])
+                user.updated_at = now
+                to_update.append(user)
+
+        CustomUser.objects.bulk_create(to_create, ignore_conflicts=True)
+        created = FirestoreUserSyncService.get_inserted(to_create)
+        if len(created) < len(to_create):
+            # Signed up meanwhile: their own signup provisioned them, the
+            # next sync updates them like any existing user
+            logger.warning(
+                f"Skipped {len(to_create) - len(created)} Firestore users that signed up during the sync")
+        CustomUser.objects.bulk_update(to_update, fields + ['updated_at'])
+        FirestoreUserSyncService.provision_creators(created, to_update)
+        return {
+            'created': len(created),
+            'updated': len(to_update),
+            'unchanged': len(rows) - len(created) - len(to_update),
+        }
+
+    @staticmethod
+    def get_inserted(users):
+        """
+        The users a conflict-ignoring bulk insert actually wrote.
+        Args:
+            users (list): Unsaved users passed to bulk_create
+        Returns:
+            list: The inserted users as read back, with their ids
+        """
+        saved = CustomUser.objects.in_bulk(
+            [user.email for user in users], field_name='email')
+        # Each unusable password is random, a row holding another one was
+        # written by someone else
+        return [
+            saved[user.email] for user in users
+            if user.email in saved and saved[user.email].password == user.password
+        ]
+
+    @staticmethod
+    def get_checkpoint():
+        """Id of the last document synced by an interrupted run, if any"""
+        return SyncCheckpoint.objects.filter(
+            name=FirestoreUserSyncService.CHECKPOINT).values_list(
+            'cursor', flat=True).first()
+
+    @staticmethod
+    def get_high_water_mark():
+        """
+        Position reached by the incremental sync.
+        Returns:
+            tuple or None: (updatedAt, document id) of the last synced
+                document, None before the first incremental run
+        """
+        return SyncCheckpoint.objects.filter(
+            name=FirestoreUserSyncService.INCREMENTAL_CHECKPOINT).values_list(
+            'timestamp', 'cursor').first()
+
+    @staticmethod
+    def get_changed_documents(users_ref, page_size=CHUNK_SIZE):
+        """
+        Stream the user documents changed since the high water mark, one
+        ordered page per query.
+
+        Documents without an updatedAt field are not returned, a full sync
+        picks them up.
+        Args:
+            users_ref: The Firestore "users" collection
+            page_size (int): Documents per query
+        Yields:
+            Firestore document snapshots in (updatedAt, id) order
+        """
+        updated_at = FirestoreUserSyncService.UPDATED_AT_FIELD
+        query = users_ref.order_by(updated_at).order_by('__name__').limit(page_size)
+        mark = FirestoreUserSyncService.get_high_water_mark()
+        position = {updated_at: mark[0], '__name__': mark[1]} if mark else None
+        while True:
+            page = list((query.start_after(position) if position else query).stream())
+            yield from page
+            if len(page) < page_size:
+                return
+            position = {
+                updated_at: FirestoreUserSyncService.get_updated_at(page[-1]),
+                '__name__': page[-1].id,
+            }
+
+    @staticmethod
+    def sync_incremental(users_ref, user_type='creator', page_size=CHUNK_SIZE,
+                         dry_run=False, on_chunk=None):
+        """
+        Sync only the user documents changed since the last incremental run.
+        Args:
+            users_ref: The Firestore "users" collection
+            See sync for the other arguments
+        Returns:
+            dict: See sync
+        """
+        documents = FirestoreUserSyncService.get_changed_documents(users_ref, page_size)
+        return FirestoreUserSyncService.sync(
+            documents, user_type=user_type, chunk_size=page_size,
+            dry_run=dry_run, on_chunk=on_chunk, incremental=True)
+
+    @staticmethod
+    def sync(documents, user_type='creator', chunk_size=CHUNK_SIZE,
+             dry_run=False, on_chunk=None, incremental=False):
+        """
+        Sync a stream of Firestore user documents.
+
+        Documents must arrive in document id order (updatedAt then id order
+        when incremental) for checkpoints to be meaningful. Each chunk
+        commits together with its checkpoint, and the sync stops at the
+        first failed chunk so the checkpoint never moves past it. The full
+        sync checkpoint is cleared once the stream is synced without
+        failures, the incremental one is kept as the high water mark.
+        Args:
+            documents (iterable): Firestore document snapshots
+            user_type (str): User type given to the synced users
+            chunk_size (int): Documents per chunk
+            dry_run (bool): Only count what would change
+            on_chunk (callable): Called with the running counts after each
+                chunk
+            incremental (bool): Record the updatedAt of the last document
+                as the high water mark
+        Returns:
+            dict: Counts of created, updated, unchanged, skipped and failed
+                documents
+        """
+        checkpoint = (
+            FirestoreUserSyncService.INCREMENTAL_CHECKPOINT if incremental
+            else FirestoreUserSyncService.CHECKPOINT)
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0}
+        for chunk in FirestoreUserSyncService.chunks(documents, chunk_size):
+            rows = []
+            for user_doc in chunk:
+                row = FirestoreUserSyncService.parse_document(user_doc, user_type)
+                if row is None:
+                    logger.warning(f"Skipped Firestore user {user_doc.id}: missing email or username")
+                    counts['skipped'] += 1
+                else:
+                    rows.append(row)
+
+            try:
+                with transaction.atomic():
+                    result = FirestoreUserSyncService.sync_chunk(rows, dry_run=dry_run)
+                    if not dry_run:
+                        SyncCheckpoint.objects.update_or_create(
+                            name=checkpoint,
+                            defaults={
+                                'cursor': chunk[-1].id,
+                                'timestamp': (
+                                    FirestoreUserSyncService.get_updated_at(chunk[-1])
+                                    if incremental else None),
+                            },
+                        )
+            except Exception as e:
+                logger.error(
+                    f"Error syncing Firestore users {chunk[0].id} to {chunk[-1].id}: {str(e)}")
+                counts['failed'] += len(rows)
+                # Retried from the checkpoint by the next (--resume) run
+                break
+            else:
+                for key, value in result.items():
+                    counts[key] += value
+            if on_chunk:
+                on_chunk(counts)
+
+        if not dry_run and not incremental and not counts['failed']:
+            SyncCheckpoint.objects.filter(name=checkpoint).delete()
+        return counts
@@ -0,0 +1,64 @@
+"""
+Celery tasks for the customauth app.
+Keeps the users in step with the Firestore "users" collection.
+"""
+import logging
+from celery import shared_task
+from celery.schedules import crontab
+from django.conf import settings
+from django.core.cache import cache
+from firebase_admin import firestore
+from config.celery import app
+from apps.customauth.firebase import initialize_firebase
+from apps.customauth.services.firestore_sync import FirestoreUserSyncService
+
+logger = logging.getLogger(__name__)
+
+SYNC_LOCK_KEY = "firestore_user_sync:lock"
+# Seconds before a lock left by a crashed run expires
+SYNC_LOCK_TIMEOUT = 60 * 30
+
+
+@shared_task
+def sync_firestore_users_task(user_type='creator'):
+    """
+    Sync the Firestore users changed since the last run.
+
+    Runs are serialized with a cache lock, a run still in progress makes the
+    next scheduled one a no-op.
+
+    Args:
+        user_type (str): User type given to newly synced users
+
+    Returns:
+        str: Status message
+    """
+    if not cache.add(SYNC_LOCK_KEY, 1, SYNC_LOCK_TIMEOUT):
+        return "Firestore sync already running"
+    try:
+        initialize_firebase()
+        users_ref = firestore.client().collection('users')
+        counts = FirestoreUserSyncService.sync_incremental(users_ref, user_type=user_type)
+        return (
+            f"Synced Firestore users: {counts['created']} created, "
+            f"{counts['updated']} updated, {counts['unchanged']} unchanged, "
+            f"{counts['skipped']} skipped, {counts['failed']} failed"
+        )
+    except Exception as e:
+        logger.error(f"Error in sync_firestore_users_task: {str(e)}")
+        raise
+    finally:
+        cache.delete(SYNC_LOCK_KEY)
+
+
+# Pull Firestore user changes every few minutes when enabled
+@app.on_after_finalize.connect
+def setup_sync_firestore_users_task(sender, **kwargs):
+    """Schedule the incremental Firestore user sync."""
+    if not settings.FIRESTORE_SYNC_ENABLED:
+        return
+    sender.add_periodic_task(
+        crontab(minute=f'*/{settings.FIRESTORE_SYNC_INTERVAL_MINUTES}'),
+        sync_firestore_users_task.s(),
+        name='Sync changed Firestore users'
+    )
@@ -1,3 +1,4 @@
+from django.utils import timezone
 from apps.payments.models import PaymentWebhookLog as WebHook
 from utils.external_requests import resend_callback
 
@@ -5,15 +6,17 @@ def check_final_status(payment):
     """Checks if the payment is in a final state and logs the webhook call."""
     final_statuses = ["failed", "completed", "reversed"]
     if payment.status in final_statuses:
-        # If webhook log already exists for this payment, skip logging
-        if not WebHook.objects.filter(external_id=payment.reference).exists():
-            WebHook.objects.create(
-                parsed_payload={"payment_id": str(payment.id), "status": payment.status},
-                event_type=f"deposit.{payment.status}",
-                payment=payment,
-                provider=payment.provider,
-                external_id=payment.reference,
-            )
+        # Logged once per payment and status, repeat checks are no-ops
+        WebHook.objects.record(
+            parsed_payload={"payment_id": str(payment.id), "status": payment.status},
+            event_type=f"deposit.{payment.status}",
+            payment=payment,
+            provider=payment.provider,
+            external_id=payment.reference,
+            # Already applied, keep it out of the webhook consumer queue
+            status="processed",
+            processed_at=timezone.now(),
+        )
         return payment.status
     else:
         # If not in final state, attempt to resend callback to update status
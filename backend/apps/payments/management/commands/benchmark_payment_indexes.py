@@ -0,0 +1,152 @@
+"""
+Management command to compare the query plans of the hot Payment status
+queries with and without the partial indexes, on a seeded table.
+
+Everything runs in one transaction that is rolled back, the seeded rows and
+dropped indexes never persist. The payments table stays locked meanwhile, so
+run it against a scratch copy of the database. PostgreSQL only.
+"""
+
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from apps.payments.models import Payment, PaymentStatus, NON_FINAL_STATUSES
+from apps.wallets.models import Wallet
+
+PARTIAL_INDEXES = [
+    index.name for index in Payment._meta.indexes if index.condition is not None
+]
+EXECUTION_TIME = re.compile(r"Execution Time: ([\d.]+) ms")
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the partial Payment indexes on a seeded table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=1_000_000,
+            help='Number of payments to seed (default: 1000000)',
+        )
+        parser.add_argument(
+            '--wallets',
+            type=int,
+            default=100,
+            help='Number of existing wallets to spread them over (default: 100)',
+        )
+        parser.add_argument(
+            '--plans',
+            action='store_true',
+            help='Print the full query plans, not only the timings',
+        )
+
+    def get_queries(self, wallet_id):
+        """The hot queries, as run by the jobs and views that issue them"""
+        return {
+            'get_pending_payments (resend_pending_deposits)': (
+                Payment.objects.get_pending_payments().values_list('id', flat=True)),
+            'get_pending_payments (oldest page)': (
+                Payment.objects.get_pending_payments().values_list('id', flat=True)[:500]),
+            'status refresh (wallet)': Payment.objects.filter(
+                wallet_id=wallet_id, status__in=NON_FINAL_STATUSES,
+            ).order_by('-created_at').values_list('id', flat=True)[:200],
+            'get_failed_payments': Payment.objects.get_failed_payments(),
+            'wallet payments page': Payment.objects.filter(
+                wallet_id=wallet_id).order_by('-created_at')[:25],
+        }
+
+    def seed(self, rows, wallet_ids):
+        """
+        Insert the payments with one INSERT ... SELECT. About 1% are
+        non-final, 1% failed and 1% soft deleted, the rest completed,
+        spread over the last year.
+        """
+        qn = connection.ops.quote_name
+        generated = {
+            'id': 'gen_random_uuid()',
+            'wallet_id': '(%s::uuid[])[1 + n %% %s]',
+            'reference': "'BENCH-' || n",
+            'amount': '50.00',
+            'amount_captured': '50.00',
+            'status': (
+                "CASE WHEN n %% 100 = 0 THEN (%s::text[])[1 + (n / 100) %% %s] "
+                "WHEN n %% 100 = 1 THEN %s ELSE %s END"),
+            'is_deleted': 'n %% 97 = 0',
+            'created_at': "now() - (n %% 525600) * interval '1 minute'",
+            'updated_at': "now() - (n %% 525600) * interval '1 minute'",
+            'provider': '%s',
+            'patron_phone': "'0970000000'",
+        }
+        generated_params = {
+            'wallet_id': [[str(pk) for pk in wallet_ids], len(wallet_ids)],
+            'status': [
+                [str(s) for s in NON_FINAL_STATUSES], len(NON_FINAL_STATUSES),
+                PaymentStatus.FAILED.value, PaymentStatus.COMPLETED.value],
+            'provider': [Payment._meta.get_field('provider').choices[0][0]],
+        }
+
+        columns, expressions, params = [], [], []
+        for field in Payment._meta.concrete_fields:
+            columns.append(qn(field.column))
+            if field.column in generated:
+                expressions.append(generated[field.column])
+                params.extend(generated_params.get(field.column, []))
+            else:
+                # Typed, an untyped NULL in a SELECT list resolves to text
+                expressions.append(f'%s::{field.cast_db_type(connection)}')
+                params.append(field.get_db_prep_save(field.get_default(), connection))
+        params.append(rows)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(Payment._meta.db_table)} ({', '.join(columns)}) "
+                f"SELECT {', '.join(expressions)} FROM generate_series(1, %s) AS n",
+                params,
+            )
+            cursor.execute(f"ANALYZE {qn(Payment._meta.db_table)}")
+
+    def explain(self, queries):
+        """
+        Returns:
+            dict: Query name to (plan, execution time in ms)
+        """
+        results = {}
+        for name, queryset in queries.items():
+            plan = queryset.explain(analyze=True)
+            match = EXECUTION_TIME.search(plan)
+            results[name] = (plan, float(match.group(1)) if match else None)
+        return results
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('The partial index benchmark requires PostgreSQL')
+        wallet_ids = list(
+            Wallet.objects.order_by('id').values_list('id', flat=True)[:options['wallets']])
+        if not wallet_ids:
+            raise CommandError('Create at least one wallet before benchmarking')
+
+        with transaction.atomic():
+            self.stdout.write(f"Seeding {options['rows']} payments...")
+            self.seed(options['rows'], wallet_ids)
+            queries = self.get_queries(wallet_ids[0])
+
+            with_indexes = self.explain(queries)
+            with connection.cursor() as cursor:
+                for name in PARTIAL_INDEXES:
+                    cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+            without_indexes = self.explain(queries)
+
+            for name in queries:
+                plan, elapsed = with_indexes[name]
+                old_plan, old_elapsed = without_indexes[name]
+                self.stdout.write(
+                    f"{name}: {old_elapsed} ms without partial indexes, "
+                    f"{elapsed} ms with them")
+                if options['plans']:
+                    self.stdout.write(f"-- without\n{old_plan}\n-- with\n{plan}\n")
+
+            # Discard the seeded rows and restore the dropped indexes
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark finished, changes rolled back'))
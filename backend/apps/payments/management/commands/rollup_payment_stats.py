@@ -0,0 +1,24 @@
+"""
+Management command to backfill the PaymentDailyStats rollup used by the
+admin dashboards.
+"""
+
+from django.core.management.base import BaseCommand
+from apps.payments.services.payment_stats_service import PaymentDailyStatsService
+
+
+class Command(BaseCommand):
+    help = 'Roll up payments into PaymentDailyStats'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Number of closed days to roll up (default: every day since the first payment)',
+        )
+
+    def handle(self, *args, **options):
+        rows = PaymentDailyStatsService.rollup_days(options['days'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Total PaymentDailyStats rows written: {rows}')
+        )
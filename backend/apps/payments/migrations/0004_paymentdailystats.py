@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0003_convert_pawapay_to_lipila'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('currency', models.CharField(max_length=3)),
+                ('status', models.CharField(max_length=30)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('amount_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('amount_captured_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('amount_refunded_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('provider_fee_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('net_amount_total', models.DecimalField(decimal_places=2, default=0, max_digits=16)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('date', 'currency', 'status'), name='unique_payment_daily_stats')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0004_paymentdailystats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status__in', ['pending', 'submitted', 'accepted', 'processing', 'in_reconciliation'])), fields=['created_at'], name='payment_non_final_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status__in', ['pending', 'submitted', 'accepted', 'processing', 'in_reconciliation'])), fields=['wallet', '-created_at'], name='payment_non_final_wallet_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'failed')), fields=['created_at'], name='payment_failed_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['wallet', '-created_at'], name='payment_live_wallet_idx'),
+        ),
+    ]
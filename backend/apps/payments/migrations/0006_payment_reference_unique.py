@@ -0,0 +1,51 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:05
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def dedupe_references(apps, schema_editor):
+    """Suffix the later payments sharing a reference so the unique index builds"""
+    Payment = apps.get_model('payments', 'Payment')
+    duplicated = (
+        Payment.objects
+        .order_by()
+        .values('reference')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .values_list('reference', flat=True)
+    )
+    max_length = Payment._meta.get_field('reference').max_length
+    for reference in list(duplicated):
+        payments = Payment.objects.filter(reference=reference).order_by('created_at', 'id')
+        n = 0
+        for payment in list(payments)[1:]:
+            # Skip suffixes an existing reference already ends with
+            while True:
+                n += 1
+                suffix = f"-{n}"
+                value = f"{reference[:max_length - len(suffix)]}{suffix}"
+                if not Payment.objects.filter(reference=value).exists():
+                    break
+            payment.reference = value
+            payment.save(update_fields=['reference'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0005_payment_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(dedupe_references, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='payments_pa_referen_e9ad27_idx',
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='reference',
+            field=models.CharField(help_text='reference for patron-facing purposes', max_length=100, unique=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:40
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def drop_duplicate_events(apps, schema_editor):
+    """Keep the first log of each event so the unique constraint builds"""
+    PaymentWebhookLog = apps.get_model('payments', 'PaymentWebhookLog')
+    duplicated = (
+        PaymentWebhookLog.objects
+        .exclude(external_id='')
+        .order_by()
+        .values('provider', 'external_id', 'event_type')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for key in list(duplicated):
+        key.pop('count')
+        logs = PaymentWebhookLog.objects.filter(**key).order_by('created_at', 'id')
+        first = logs.first()
+        logs.exclude(id=first.id).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0006_payment_reference_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_events, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='paymentwebhooklog',
+            constraint=models.UniqueConstraint(condition=models.Q(('external_id', ''), _negated=True), fields=('provider', 'external_id', 'event_type'), name='unique_webhook_event'),
+        ),
+    ]
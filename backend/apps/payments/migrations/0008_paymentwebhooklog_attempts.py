@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 15:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0007_webhook_event_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentwebhooklog',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
@@ -1,5 +1,8 @@
-from django.db import models
-from django.db.models import Sum
+from django.conf import settings
+from django.db import connections, models, router
+from django.db.models import Count, Q, Sum
+from django.db.models.constants import OnConflict
+from django.db.models.sql import InsertQuery
 from django.utils import timezone
 from datetime import timedelta
 from django.contrib.auth import get_user_model
@@ -8,6 +11,8 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 import uuid
 from decimal import Decimal
 from typing import Optional, Dict
+from utils.daily_rollup import get_day_start
+from utils.ulid import new_ulid
 
 User = get_user_model()
 
@@ -111,6 +116,40 @@ class SoftDeleteModel(models.Model):
 
 
 # ========== PAYMENT MANAGER ===========
+SUCCESSFUL_STATUSES = [PaymentStatus.CAPTURED, PaymentStatus.COMPLETED]
+CAPTURED_STATUSES = [PaymentStatus.CAPTURED, PaymentStatus.PARTIALLY_CAPTURED]
+REFUNDED_STATUSES = [PaymentStatus.REFUNDED, PaymentStatus.PARTIALLY_REFUNDED]
+# Payments still waiting on the provider, a small slice of the table that the
+# status refresh and resend jobs poll, see the partial indexes on Payment
+NON_FINAL_STATUSES = [
+    PaymentStatus.PENDING,
+    PaymentStatus.SUBMITTED,
+    PaymentStatus.ACCEPTED,
+    PaymentStatus.PROCESSING,
+    PaymentStatus.IN_RECONCILIATION,
+]
+# Payment column: PaymentDailyStats column holding its daily sum
+ROLLUP_COLUMNS = {
+    "amount": "amount_total",
+    "amount_captured": "amount_captured_total",
+    "amount_refunded": "amount_refunded_total",
+    "provider_fee": "provider_fee_total",
+    "net_amount": "net_amount_total",
+}
+
+
+def payment_count(rolled_up, **filters):
+    """Count of payments, over Payment rows or PaymentDailyStats rows"""
+    condition = Q(**filters) if filters else None
+    if rolled_up:
+        return Sum("count", filter=condition)
+    return Count("id", filter=condition)
+
+
+def payment_sum(column, rolled_up, **filters):
+    """Sum of a Payment column, over Payment rows or PaymentDailyStats rows"""
+    condition = Q(**filters) if filters else None
+    return Sum(ROLLUP_COLUMNS[column] if rolled_up else column, filter=condition)
 
 
 class PaymentManager(models.Manager):
@@ -138,6 +177,19 @@ class PaymentManager(models.Manager):
         """Get payment by reference"""
         return self.get(reference=reference)
 
+    def get_by_deposit_id(self, deposit_id):
+        """
+        Get the payment a gateway callback refers to with a single lookup.
+        Deposits are submitted with the payment id, older ones with the
+        reference, so UUID-shaped ids resolve by id and anything else by
+        reference.
+        """
+        try:
+            payment_id = uuid.UUID(str(deposit_id))
+        except ValueError:
+            return self.get(reference=deposit_id)
+        return self.get(id=payment_id)
+
     def get_by_external_id(self, provider, external_id):
         """Get payment by provider and external ID"""
         return self.get(provider=provider, external_id=external_id)
@@ -164,12 +216,16 @@ class PaymentManager(models.Manager):
         return queryset
 
     def get_pending_payments(self):
-        """Get all pending payments"""
+        """
+        Get the payments still waiting on the provider, oldest first.
+        Filters on exactly the predicate of payment_non_final_created_idx,
+        so pages of the oldest are read from it without a sort (expired
+        payments have the final EXPIRED status)
+        """
         return self.filter(
-            status=PaymentStatus.PENDING,
+            status__in=NON_FINAL_STATUSES,
             is_deleted=False,
-            expired_at__gt=timezone.now(),  # Not expired
-        )
+        ).order_by("created_at")
 
     def get_failed_payments(self, hours=24):
         """Get failed payments within last N hours"""
@@ -179,6 +235,40 @@ class PaymentManager(models.Manager):
             is_deleted=False, created_at__gte=cutoff
         )
 
+    def get_stats_sources(self, start_date, end_date):
+        """
+        Split a date range between the live payments and the daily rollup.
+
+        With DASHBOARD_USE_DAILY_STATS, the closed days that lie wholly inside
+        the range are read from PaymentDailyStats and only the partial days at
+        the edges and today are read from the payments table.
+
+        Args:
+            start_date (datetime): Start of date range
+            end_date (datetime): End of date range (inclusive)
+        Returns:
+            tuple: (Payment queryset, PaymentDailyStats queryset or None)
+        """
+        live = self.filter(created_at__range=[start_date, end_date])
+        if not settings.DASHBOARD_USE_DAILY_STATS:
+            return live, None
+
+        first_day = timezone.localdate(start_date)
+        if get_day_start(first_day) < start_date:
+            first_day += timedelta(days=1)
+        # Exclusive, end_date's own day is only partly covered
+        last_day = min(timezone.localdate(end_date), timezone.localdate())
+        if first_day >= last_day:
+            return live, None
+
+        live = live.exclude(
+            created_at__gte=get_day_start(first_day),
+            created_at__lt=get_day_start(last_day),
+        )
+        rolled_up = PaymentDailyStats.objects.filter(
+            date__gte=first_day, date__lt=last_day)
+        return live, rolled_up
+
     def get_revenue_by_currency(self, start_date, end_date):
         """
         Get revenue aggregation by currency within date range
@@ -187,55 +277,78 @@ class PaymentManager(models.Manager):
             start_date (datetime): Start of date range
             end_date (datetime): End of date range
         Returns:
-            QuerySet: Aggregated revenue data by currency
+            list: Dicts with currency, total_amount, total_fees and
+                net_revenue, highest total_amount first
         """
-        return (
-            self.get_successful_payments(start_date, end_date)
-            .values("currency")
-            .annotate(
-                total_amount=Sum("amount"),
-                total_fees=Sum("provider_fee"),
-                net_revenue=Sum("net_amount"),
+        live, rolled_up = self.get_stats_sources(start_date, end_date)
+        sources = [(live, False)]
+        if rolled_up is not None:
+            sources.append((rolled_up, True))
+
+        revenue = {}
+        for queryset, is_rollup in sources:
+            rows = (
+                queryset.filter(status__in=SUCCESSFUL_STATUSES)
+                .order_by()
+                .values("currency")
+                .annotate(
+                    total_amount=payment_sum("amount", is_rollup),
+                    total_fees=payment_sum("provider_fee", is_rollup),
+                    net_revenue=payment_sum("net_amount", is_rollup),
+                )
             )
-            .order_by("-total_amount")
-        )
+            for row in rows:
+                totals = revenue.setdefault(row["currency"], {
+                    "currency": row["currency"],
+                    "total_amount": Decimal("0"),
+                    "total_fees": Decimal("0"),
+                    "net_revenue": Decimal("0"),
+                })
+                for key in ("total_amount", "total_fees", "net_revenue"):
+                    totals[key] += row[key] or Decimal("0")
+        return sorted(revenue.values(), key=lambda row: row["total_amount"], reverse=True)
+
+    @staticmethod
+    def get_stats_aggregates(rolled_up):
+        return {
+            "total_payments": payment_count(rolled_up),
+            "successful_payments": payment_count(rolled_up, status__in=SUCCESSFUL_STATUSES),
+            "failed_payments": payment_count(rolled_up, status=PaymentStatus.FAILED),
+            "refunded_payments": payment_count(rolled_up, status__in=REFUNDED_STATUSES),
+            "total_amount": payment_sum("amount", rolled_up),
+            "captured_amount": payment_sum(
+                "amount_captured", rolled_up, status__in=CAPTURED_STATUSES),
+            "refunded_amount": payment_sum("amount_refunded", rolled_up),
+        }
 
     def get_payment_stats(self, start_date, end_date):
-        """Get comprehensive payment statistics"""
-        queryset = self.filter(
-            created_at__range=[start_date, end_date], is_deleted=False
-        )
+        """
+        Get comprehensive payment statistics with one conditional aggregate
+        (plus one over the daily rollup when it covers part of the range)
+        Args:
+            start_date (datetime): Start of date range
+            end_date (datetime): End of date range (inclusive)
+        Returns:
+            dict: Payment counts, success rate and amounts
+        """
+        live, rolled_up = self.get_stats_sources(start_date, end_date)
+        stats = live.aggregate(**self.get_stats_aggregates(False))
+        if rolled_up is not None:
+            rolled_up_stats = rolled_up.aggregate(**self.get_stats_aggregates(True))
+            stats = {key: (stats[key] or 0) + (rolled_up_stats[key] or 0) for key in stats}
 
-        total = queryset.count()
-        successful = queryset.filter(
-            status__in=[PaymentStatus.CAPTURED, PaymentStatus.COMPLETED]
-        ).count()
-        failed = queryset.filter(status=PaymentStatus.FAILED).count()
-        refunded = queryset.filter(
-            status__in=[
-                PaymentStatus.REFUNDED, PaymentStatus.PARTIALLY_REFUNDED]
-        ).count()
-
-        # Calculate amounts
-        total_amount = queryset.aggregate(
-            total=Sum("amount"))["total"] or Decimal("0")
-
-        captured_amount = queryset.filter(
-            status__in=[
-                PaymentStatus.CAPTURED, PaymentStatus.PARTIALLY_CAPTURED]
-        ).aggregate(total=Sum("amount_captured"))["total"] or Decimal("0")
-
-        refunded_amount = queryset.aggregate(total=Sum("amount_refunded"))[
-            "total"
-        ] or Decimal("0")
+        total = stats["total_payments"] or 0
+        successful = stats["successful_payments"] or 0
+        captured_amount = stats["captured_amount"] or Decimal("0")
+        refunded_amount = stats["refunded_amount"] or Decimal("0")
 
         return {
             "total_payments": total,
             "successful_payments": successful,
-            "failed_payments": failed,
-            "refunded_payments": refunded,
+            "failed_payments": stats["failed_payments"] or 0,
+            "refunded_payments": stats["refunded_payments"] or 0,
             "success_rate": (successful / total * 100) if total > 0 else 0,
-            "total_amount": total_amount,
+            "total_amount": stats["total_amount"] or Decimal("0"),
             "captured_amount": captured_amount,
             "refunded_amount": refunded_amount,
             "net_amount": captured_amount - refunded_amount,
@@ -258,7 +371,7 @@ class Payment(UUIDModel, TimeStampedModel, SoftDeleteModel):
         related_name="payments",
     )
     reference = models.CharField(
-        max_length=100, help_text=_("reference for patron-facing purposes")
+        max_length=100, unique=True, help_text=_("reference for patron-facing purposes")
     )
     external_id = models.CharField(
         max_length=255,
@@ -372,10 +485,33 @@ class Payment(UUIDModel, TimeStampedModel, SoftDeleteModel):
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["reference", "status"]),
             models.Index(fields=["patron_phone", "created_at"]),
             models.Index(fields=["created_at", "status"]),
             models.Index(fields=["amount", "currency"]),
+            # Partial indexes, the predicates match the manager filters so
+            # the hot queries skip the completed bulk of the table
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(
+                    status__in=NON_FINAL_STATUSES, is_deleted=False),
+                name="payment_non_final_created_idx",
+            ),
+            models.Index(
+                fields=["wallet", "-created_at"],
+                condition=models.Q(
+                    status__in=NON_FINAL_STATUSES, is_deleted=False),
+                name="payment_non_final_wallet_idx",
+            ),
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(status=PaymentStatus.FAILED, is_deleted=False),
+                name="payment_failed_created_idx",
+            ),
+            models.Index(
+                fields=["wallet", "-created_at"],
+                condition=models.Q(is_deleted=False),
+                name="payment_live_wallet_idx",
+            ),
         ]
         verbose_name = _("Payment")
         verbose_name_plural = _("Payments")
@@ -465,13 +601,37 @@ class Payment(UUIDModel, TimeStampedModel, SoftDeleteModel):
 
     @classmethod
     def generate_reference(cls, prefix: str = "PAY") -> str:
-        """Generate unique payment reference"""
-        import secrets
-        import datetime
+        """Generate a unique, time-ordered payment reference"""
+        return f"{prefix}-{new_ulid()}"
+
+
+class PaymentDailyStats(models.Model):
+    """
+    Payment counts and sums per creation day, currency and status, so long
+    date ranges don't scan the payments table. Rolled up nightly by
+    PaymentDailyStatsService, including older days whose payments changed.
+    """
+    date = models.DateField()
+    currency = models.CharField(max_length=3)
+    status = models.CharField(max_length=30)
+    count = models.PositiveIntegerField(default=0)
+    amount_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    amount_captured_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    amount_refunded_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    provider_fee_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    net_amount_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
-        timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-        random_str = secrets.token_hex(3).upper()
-        return f"{prefix}-{timestamp}-{random_str}"
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "currency", "status"],
+                name="unique_payment_daily_stats",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.currency}/{self.status}: {self.count}"
 
 
 class WebhookEventType(models.TextChoices):
@@ -482,6 +642,38 @@ class WebhookEventType(models.TextChoices):
     DEPOSIT_CALLBACK_RECEIVED = "deposit.callback_received"
 
 
+class PaymentWebhookLogManager(models.Manager):
+    """Manager for webhook logs with idempotent recording"""
+
+    def record(self, **fields):
+        """
+        Record a webhook event unless the provider already delivered it.
+
+        Inserts with ON CONFLICT DO NOTHING against the unique
+        (provider, external_id, event_type) constraint, so concurrent
+        retries are absorbed by the database in a single statement.
+
+        Args:
+            **fields: PaymentWebhookLog field values
+        Returns:
+            tuple: (PaymentWebhookLog, created), created is False for a
+                duplicate and the returned log is then unsaved
+        """
+        log = self.model(**fields)
+        using = self._db or router.db_for_write(self.model)
+        query = InsertQuery(self.model, on_conflict=OnConflict.IGNORE)
+        query.insert_values(
+            [f for f in self.model._meta.concrete_fields if not f.generated], [log])
+        with connections[using].cursor() as cursor:
+            for sql, params in query.get_compiler(using=using).as_sql():
+                cursor.execute(sql, params)
+            created = cursor.rowcount == 1
+        if created:
+            log._state.adding = False
+            log._state.db = using
+        return log, created
+
+
 class PaymentWebhookLog(UUIDModel, TimeStampedModel):
     """Log webhook events from payment providers"""
     provider = models.CharField(max_length=30, choices=PaymentProvider.choices)
@@ -509,6 +701,7 @@ class PaymentWebhookLog(UUIDModel, TimeStampedModel):
         default='received'
     )
     error_message = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
 
     # Related payment
     payment = models.ForeignKey(
@@ -523,6 +716,8 @@ class PaymentWebhookLog(UUIDModel, TimeStampedModel):
     processed_at = models.DateTimeField(null=True, blank=True)
     processing_time_ms = models.FloatField(null=True, blank=True)
 
+    objects = PaymentWebhookLogManager()
+
     class Meta:
         verbose_name = _("Payment Webhook Log")
         verbose_name_plural = _("Payment Webhook Logs")
@@ -532,6 +727,15 @@ class PaymentWebhookLog(UUIDModel, TimeStampedModel):
             models.Index(fields=['created_at', 'status']),
             models.Index(fields=['payment', 'created_at']),
         ]
+        constraints = [
+            # Idempotency key for provider callbacks, events without an
+            # external id cannot be matched and are always recorded
+            models.UniqueConstraint(
+                fields=['provider', 'external_id', 'event_type'],
+                condition=~models.Q(external_id=''),
+                name='unique_webhook_event',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.provider} - {self.event_type} - {self.status}"
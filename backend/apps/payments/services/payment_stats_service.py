@@ -0,0 +1,22 @@
+from apps.payments.models import (
+    Payment, PaymentDailyStats, payment_count, payment_sum)
+from utils.daily_rollup import DailyRollupService
+
+
+class PaymentDailyStatsService(DailyRollupService):
+    """Maintains the PaymentDailyStats rollup"""
+
+    source_model = Payment
+    stats_model = PaymentDailyStats
+    group_by = ("currency", "status")
+
+    @classmethod
+    def get_aggregates(cls):
+        return {
+            "count": payment_count(False),
+            "amount_total": payment_sum("amount", False),
+            "amount_captured_total": payment_sum("amount_captured", False),
+            "amount_refunded_total": payment_sum("amount_refunded", False),
+            "provider_fee_total": payment_sum("provider_fee", False),
+            "net_amount_total": payment_sum("net_amount", False),
+        }
@@ -0,0 +1,148 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from apps.payments.models import Payment
+from apps.payments.services.webhook_service import NON_FINAL_STATUSES
+from apps.wallets.services.wallet_services import WalletTransactionService
+from utils.exceptions import DuplicateTransaction
+from utils.external_requests import pawapay_request
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentStatusRefreshService:
+    """
+    Refresh non-final payment statuses from the provider.
+
+    Provider lookups run on a bounded thread pool (they are pure I/O), the
+    resulting status changes are applied on the calling thread.
+    """
+    MAX_WORKERS = 8
+    # Most payments checked per wallet run
+    BATCH_SIZE = 200
+    # Seconds before the same payment is checked again, the cache key holding
+    # the last check time doubles as the in-flight lock
+    CHECK_INTERVAL = 300
+
+    @staticmethod
+    def check_key(payment_id):
+        return f"payment_status_check:{payment_id}"
+
+    @staticmethod
+    def last_checked(payment_id):
+        """
+        Get the time of the last provider check for a payment.
+        Args:
+            payment_id: Payment id
+        Returns:
+            str or None: ISO timestamp of the last check within CHECK_INTERVAL
+        """
+        return cache.get(PaymentStatusRefreshService.check_key(payment_id))
+
+    @staticmethod
+    def claim_payments(wallet, limit=BATCH_SIZE):
+        """
+        Select the wallet's non-final payments that are due for a check.
+
+        A payment is claimed by atomically adding its check key, so a payment
+        already being checked (or checked recently) by another worker is
+        skipped.
+        Args:
+            wallet (Wallet): The wallet whose payments to check
+            limit (int): Maximum number of payments to claim
+        Returns:
+            list: Claimed payment ids
+        """
+        payment_ids = list(
+            Payment.objects.filter(wallet=wallet, status__in=NON_FINAL_STATUSES)
+            .order_by("-created_at")
+            .values_list("id", flat=True)[:limit]
+        )
+        if not payment_ids:
+            return []
+
+        keys = {PaymentStatusRefreshService.check_key(pid): pid for pid in payment_ids}
+        recent = cache.get_many(list(keys))
+        checked_at = timezone.now().isoformat()
+        return [
+            pid for key, pid in keys.items()
+            if key not in recent
+            and cache.add(key, checked_at, timeout=PaymentStatusRefreshService.CHECK_INTERVAL)
+        ]
+
+    @staticmethod
+    def fetch_status(payment_id):
+        """
+        Ask the provider for a payment's status.
+        Args:
+            payment_id: Payment id
+        Returns:
+            str or None: Lowercased provider status, None if unavailable
+        """
+        data, code = pawapay_request("GET", f"/v2/deposits/{payment_id}")
+        if code == 200 and isinstance(data, dict) and "data" in data:
+            return (data["data"].get("status") or "").lower() or None
+        return None
+
+    @staticmethod
+    @transaction.atomic
+    def apply_status(payment_id, provider_status):
+        """
+        Apply a provider status to a payment, crediting the wallet on completion.
+        Args:
+            payment_id: Payment id
+            provider_status (str): Lowercased provider status
+        Returns:
+            bool: True if the payment status changed
+        """
+        if provider_status in NON_FINAL_STATUSES:
+            return False
+        payment = Payment.objects.select_for_update().filter(pk=payment_id).first()
+        if payment is None or payment.status not in NON_FINAL_STATUSES:
+            # Deleted, or finalised by a webhook in the meantime
+            return False
+
+        payment.status = provider_status
+        payment.save(update_fields=["status", "updated_at"])
+
+        if provider_status == "completed" and payment.wallet is not None:
+            try:
+                WalletTransactionService.cash_in(
+                    wallet=payment.wallet,
+                    amount=payment.amount,
+                    payment=payment,
+                    reference=payment.reference,
+                )
+            except DuplicateTransaction:
+                pass
+        return True
+
+    @staticmethod
+    def refresh_wallet(wallet, max_workers=MAX_WORKERS):
+        """
+        Check all due non-final payments of a wallet concurrently.
+        Args:
+            wallet (Wallet): The wallet whose payments to refresh
+            max_workers (int): Maximum concurrent provider requests
+        Returns:
+            int: Number of payments whose status changed
+        """
+        payment_ids = PaymentStatusRefreshService.claim_payments(wallet)
+        if not payment_ids:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(payment_ids))) as executor:
+            statuses = list(executor.map(PaymentStatusRefreshService.fetch_status, payment_ids))
+
+        updated = 0
+        for payment_id, provider_status in zip(payment_ids, statuses):
+            if provider_status is None:
+                continue
+            try:
+                if PaymentStatusRefreshService.apply_status(payment_id, provider_status):
+                    updated += 1
+            except Exception as e:
+                logger.error(f"Failed to refresh payment {payment_id}: {str(e)}")
+        return updated
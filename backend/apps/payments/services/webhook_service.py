@@ -0,0 +1,146 @@
+import logging
+import time
+from datetime import timedelta
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from apps.payments.models import Payment, NON_FINAL_STATUSES
+from apps.payments.models import PaymentWebhookLog as WebHook
+from apps.wallets.services.wallet_services import WalletTransactionService
+from utils.exceptions import DuplicateTransaction
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookService:
+    """
+    Two-stage webhook pipeline.
+
+    The endpoint only records the callback (status ``received``) and
+    acknowledges it, the Celery consumer later claims batches of received
+    events and applies them to payments and wallets.
+    """
+    BATCH_SIZE = 100
+    # Events stuck in ``processing`` longer than this are assumed to belong
+    # to a dead worker and are claimed again
+    STALE_AFTER = timedelta(minutes=5)
+    # Failed events are retried after a pause, up to MAX_ATTEMPTS claims
+    RETRY_AFTER = timedelta(minutes=2)
+    MAX_ATTEMPTS = 5
+
+    @staticmethod
+    def claim_batch(batch_size=BATCH_SIZE):
+        """
+        Mark the oldest pending events as ``processing`` and return their ids.
+
+        Rows locked by another consumer are skipped so several workers can
+        drain the queue concurrently. Failed events are claimed again until
+        they have used up their attempts.
+        Args:
+            batch_size (int): Maximum number of events to claim
+        Returns:
+            list: Ids of the claimed webhook logs, oldest first
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            ids = list(
+                WebHook.objects.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status="received")
+                    | Q(status="processing", updated_at__lt=now - WebhookService.STALE_AFTER)
+                    | Q(
+                        status="failed",
+                        attempts__lt=WebhookService.MAX_ATTEMPTS,
+                        updated_at__lt=now - WebhookService.RETRY_AFTER,
+                    )
+                )
+                .order_by("created_at")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if ids:
+                WebHook.objects.filter(id__in=ids).update(
+                    status="processing", attempts=F("attempts") + 1, updated_at=now
+                )
+        return ids
+
+    @staticmethod
+    @transaction.atomic
+    def apply_event(webhook_log):
+        """
+        Apply a single recorded callback to its payment and wallet.
+        Args:
+            webhook_log (PaymentWebhookLog): The claimed webhook event
+        Returns:
+            Payment: The updated payment
+        """
+        payment = Payment.objects.select_for_update().get(pk=webhook_log.payment_id)
+        # Read under the lock, a payment completed by an earlier callback or
+        # the status refresh has already been credited
+        already_completed = payment.status == "completed"
+        res_status = webhook_log.event_type.removeprefix("deposit.")
+        # Non-final gateway statuses must not clobber an already final state
+        if res_status in NON_FINAL_STATUSES:
+            res_status = payment.status
+        payment.status = res_status
+        # store gateway id if present
+        if webhook_log.external_id:
+            payment.external_id = webhook_log.external_id
+        payment.provider_data = webhook_log.parsed_payload
+        payment.save()
+
+        if res_status == "completed" and not already_completed and payment.wallet is not None:
+            try:
+                # Same reference as the status refresh, one cash-in per payment
+                WalletTransactionService.cash_in(
+                    wallet=payment.wallet,
+                    amount=payment.amount,
+                    payment=payment,
+                    reference=payment.reference,
+                )
+            except DuplicateTransaction:
+                pass
+        return payment
+
+    @staticmethod
+    def process_event(webhook_log):
+        """
+        Apply an event and record the outcome on the webhook log.
+
+        A failing event is marked ``failed`` without affecting the rest of
+        the batch, claim_batch retries it later.
+        Args:
+            webhook_log (PaymentWebhookLog): The claimed webhook event
+        Returns:
+            bool: True if the event was applied
+        """
+        started = time.monotonic()
+        update_fields = ["status", "processed_at", "processing_time_ms", "updated_at"]
+        try:
+            if webhook_log.payment_id is None:
+                webhook_log.status = "ignored"
+            else:
+                WebhookService.apply_event(webhook_log)
+                webhook_log.status = "processed"
+        except Exception as e:
+            logger.error(f"Failed to process webhook {webhook_log.id}: {str(e)}")
+            webhook_log.status = "failed"
+            webhook_log.error_message = str(e)
+            update_fields.append("error_message")
+        webhook_log.processed_at = timezone.now()
+        webhook_log.processing_time_ms = (time.monotonic() - started) * 1000
+        webhook_log.save(update_fields=update_fields)
+        return webhook_log.status == "processed"
+
+    @staticmethod
+    def process_received(batch_size=BATCH_SIZE):
+        """
+        Claim and apply one batch of received webhook events.
+        Args:
+            batch_size (int): Maximum number of events to process
+        Returns:
+            int: Number of events claimed
+        """
+        ids = WebhookService.claim_batch(batch_size)
+        for webhook_log in WebHook.objects.filter(id__in=ids).order_by("created_at"):
+            WebhookService.process_event(webhook_log)
+        return len(ids)
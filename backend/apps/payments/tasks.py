@@ -1,7 +1,16 @@
+import logging
 from celery import shared_task
+from celery.schedules import crontab
+from config.celery import app
 from apps.payments.models import Payment
+from apps.wallets.models import Wallet
+from apps.payments.services.status_refresh_service import PaymentStatusRefreshService
+from apps.payments.services.webhook_service import WebhookService
+from apps.payments.services.payment_stats_service import PaymentDailyStatsService
 from utils.external_requests import resend_callback
 
+logger = logging.getLogger(__name__)
+
 
 @shared_task(bind=True, max_retries=5, default_retry_delay=300)
 def resend_deposit_callback(self, payment_id):
@@ -24,9 +33,94 @@ def resend_deposit_callback(self, payment_id):
 
 @shared_task
 def resend_pending_deposits():
-    pending = Payment.objects.filter(
-        status__in=["pending", "accepted", "submitted", "processing", "in_reconciliation"]
+    pending = Payment.objects.get_pending_payments()
+
+    for payment_id in pending.values_list("id", flat=True).iterator():
+        resend_deposit_callback.delay(payment_id)
+
+
+@shared_task
+def process_webhook_events_task(batch_size=WebhookService.BATCH_SIZE):
+    """
+    Drain received webhook events and apply them to payments and wallets.
+
+    Processes one batch per run and re-queues itself while the batch comes
+    back full, so a burst of callbacks is spread over several task runs.
+
+    Args:
+        batch_size (int): Maximum number of events to process per run
+
+    Returns:
+        str: Status message
+    """
+    try:
+        count = WebhookService.process_received(batch_size=batch_size)
+        if count >= batch_size:
+            process_webhook_events_task.delay(batch_size)
+        return f"Processed {count} webhook events"
+    except Exception as e:
+        logger.error(f"Error in process_webhook_events_task: {str(e)}")
+        raise
+
+
+@shared_task
+def refresh_wallet_payment_statuses_task(wallet_id):
+    """
+    Refresh the provider status of a wallet's non-final payments.
+
+    Queued by the wallet dashboard so provider lookups never run on the
+    request path.
+
+    Args:
+        wallet_id (int): Wallet whose payments to refresh
+
+    Returns:
+        str: Status message
+    """
+    wallet = Wallet.objects.filter(id=wallet_id).first()
+    if wallet is None:
+        return f"Wallet {wallet_id} not found"
+    updated = PaymentStatusRefreshService.refresh_wallet(wallet)
+    return f"Updated {updated} payments for wallet {wallet_id}"
+
+
+# Pick up webhook events whose enqueue was lost (broker down, worker crash)
+@app.on_after_finalize.connect
+def setup_process_webhook_events_task(sender, **kwargs):
+    """Schedule the webhook consumer to run every minute."""
+    sender.add_periodic_task(
+        crontab(minute='*'),
+        process_webhook_events_task.s(),
+        name='Process received webhook events every minute'
     )
 
-    for payment in pending:
-        resend_deposit_callback.delay(payment.id)
+
+@shared_task
+def rollup_payment_daily_stats_task(hours=25):
+    """
+    Roll up yesterday's payments, and older days whose payments changed
+    since the previous run, into PaymentDailyStats.
+
+    Args:
+        hours (int): How far back to look for changed payments
+
+    Returns:
+        str: Status message
+    """
+    try:
+        days = PaymentDailyStatsService.rollup_recent(hours=hours)
+        return f"Rolled up payment stats for {days} days"
+    except Exception as e:
+        logger.error(f"Error in rollup_payment_daily_stats_task: {str(e)}")
+        raise
+
+
+# Roll up payment statistics every day at 0:45 AM
+@app.on_after_finalize.connect
+def setup_rollup_payment_daily_stats_task(sender, **kwargs):
+    """Schedule the payment stats rollup task to run daily at 0:45 AM."""
+    sender.add_periodic_task(
+        crontab(hour=0, minute=45),
+        rollup_payment_daily_stats_task.s(),
+        name='Roll up payment daily stats every day'
+    )
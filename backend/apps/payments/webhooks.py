@@ -1,4 +1,5 @@
 import json
+import logging
 from django.db import transaction
 from django.contrib.auth import get_user_model
 from rest_framework.response import Response
@@ -8,11 +9,11 @@ from rest_framework.permissions import AllowAny
 from rest_framework.views import APIView
 from apps.payments.models import Payment
 from apps.payments.models import PaymentWebhookLog as WebHook
-from apps.wallets.services.wallet_services import WalletTransactionService
+from apps.payments.tasks import process_webhook_events_task
 from utils.authentication import RequireAPIKey
-from utils.exceptions import DuplicateTransaction
 from utils.external_requests import limopay_request
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 class WebhookAPIView(APIView):
@@ -43,68 +44,36 @@ class WebhookAPIView(APIView):
                 {"error": "Invalid payload"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        res_status = res_status.lower()
-
-        # IDEMPOTENCY CHECK - prefer external_id when available
-        if external_id and WebHook.objects.filter(external_id=external_id).exists():
-            return Response(
-                {"message": "Duplicate callback ignored"}, status=status.HTTP_200_OK
-            )
         try:
-            with transaction.atomic():
-                # Try to resolve by reference first, fallback to UUID id
-                try:
-                    payment = Payment.objects.select_for_update().get(reference=deposit_id)
-                except Payment.DoesNotExist:
-                    payment = Payment.objects.select_for_update().get(id=deposit_id)
-
-                # Dont update status if pending/submitted/accepted to
-                # avoid overwriting final state
-                skip_statuses = [
-                    "pending",
-                    "submitted",
-                    "accepted",
-                    "processing",
-                    "in_reconciliation",
-                ]
-                if res_status in skip_statuses:
-                    res_status = payment.status
-                payment.status = res_status
-                # store gateway id if present
-                if external_id:
-                    payment.external_id = external_id
-                payment.provider_data = data
-                payment.save()
-
-                # Create webhook log ONCE, include raw payload
-                WebHook.objects.create(
-                    raw_payload=json.dumps(payload),
-                    parsed_payload=data if isinstance(data, dict) else {"data": data},
-                    event_type=f"deposit.{res_status}",
-                    payment=payment,
-                    provider=payment.provider,
-                    external_id=external_id or "",
-                )
-                if res_status == "completed" and payment.wallet is not None:
-                    try:
-                        WalletTransactionService.cash_in(
-                            wallet=payment.wallet,
-                            amount=payment.amount,
-                            payment=payment,
-                            reference=external_id or payment.reference,
-                        )
-                    except DuplicateTransaction:
-                        pass
-
+            payment = Payment.objects.get_by_deposit_id(deposit_id)
         except Payment.DoesNotExist:
             return Response({"status": "NOT_FOUND"}, status=status.HTTP_404_NOT_FOUND)
 
-        except Exception:
-            # If unique constraint triggered by race condition or other parsing errors
+        # Durably record the callback, the consumer task applies it. The
+        # unique event key turns provider retries into a no-op insert
+        _, created = WebHook.objects.record(
+            raw_payload=json.dumps(payload),
+            parsed_payload=data if isinstance(data, dict) else {"data": data},
+            event_type=f"deposit.{res_status}",
+            payment=payment,
+            provider=payment.provider,
+            external_id=external_id or "",
+            status="received",
+        )
+        if not created:
             return Response(
                 {"message": "Duplicate callback ignored"}, status=status.HTTP_200_OK
             )
-        return Response({"message": "Callback processed"}, status=status.HTTP_200_OK)
+        transaction.on_commit(enqueue_webhook_processing)
+        return Response({"message": "Callback received"}, status=status.HTTP_200_OK)
+
+
+def enqueue_webhook_processing():
+    """Queue the webhook consumer, the periodic drain covers a failed enqueue."""
+    try:
+        process_webhook_events_task.delay()
+    except Exception as e:
+        logger.warning(f"Could not enqueue webhook processing: {str(e)}")
 
 
 class PaymentStatusAPIView(APIView):
@@ -0,0 +1,32 @@
+"""
+Management command to return submitted payouts to the disbursement queue.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from apps.payouts.services.disbursement_service import PayoutDisbursementService
+from apps.wallets.models import WalletTransaction
+
+
+class Command(BaseCommand):
+    help = (
+        'Release submitted payouts so the next disbursement run sends them '
+        'again. Only use this once the gateway has confirmed it never '
+        'received them.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'references',
+            nargs='+',
+            help='References of the payout transactions to release',
+        )
+
+    def handle(self, *args, **options):
+        ids = WalletTransaction.objects.filter(
+            reference__in=options['references']).values_list('id', flat=True)
+        released = PayoutDisbursementService.release(ids)
+        if not released:
+            raise CommandError('No submitted pending payouts match the given references')
+        self.stdout.write(
+            self.style.SUCCESS(f'Total payouts released: {released}')
+        )
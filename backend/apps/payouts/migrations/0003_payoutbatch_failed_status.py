@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 15:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payouts', '0002_payoutbatch'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='payoutbatch',
+            name='status',
+            field=models.CharField(choices=[('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='running', max_length=20),
+        ),
+    ]
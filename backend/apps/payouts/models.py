@@ -1,4 +1,8 @@
 from django.db import models
+from django.contrib.auth import get_user_model
+
+User = get_user_model()
+
 
 class PayoutSchedule(models.Model):
     """
@@ -60,4 +64,46 @@ class PayoutSchedule(models.Model):
             self.next_payout_date = now.replace(year=year, month=next_month, day=1)
 
         self.save()
-      
\ No newline at end of file
+      
+
+class PayoutBatch(models.Model):
+    """
+    One run of the automatic payout job. Each chunk task adds its counts as
+    it finishes, so the row shows the progress of a running batch.
+    """
+    STATUS_CHOICES = (
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="running")
+    initiated_by = models.ForeignKey(
+        User, null=True, blank=True, on_delete=models.SET_NULL,
+        related_name='payout_batches')
+    wallet_count = models.PositiveIntegerField(default=0)
+    chunk_count = models.PositiveIntegerField(default=0)
+    chunks_done = models.PositiveIntegerField(default=0)
+    succeeded = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    # Wallets locked by a concurrent run or no longer eligible
+    skipped = models.PositiveIntegerField(default=0)
+    total_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    # [{"wallet_id": ..., "error": ...}] of the failed wallets
+    errors = models.JSONField(default=list, blank=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Summed processing time of the chunk tasks
+    processing_seconds = models.FloatField(default=0)
+
+    class Meta:
+        ordering = ['-started_at']
+
+    def __str__(self):
+        return f"PayoutBatch({self.pk}) - {self.status}"
+
+    @property
+    def duration(self):
+        """Wall clock time of the run, None while it is running"""
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
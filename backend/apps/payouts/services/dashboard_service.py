@@ -0,0 +1,158 @@
+import logging
+from datetime import timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import Abs
+from django.utils import timezone
+from apps.creators.models import CreatorProfile
+from apps.payments.models import Payment
+from apps.wallets.models import LedgerDailyStats, Wallet, WalletTransaction
+from apps.wallets.services.wallet_services import LedgerDailyStatsService
+
+logger = logging.getLogger(__name__)
+
+PAYOUT_SUMMARY_CACHE_KEY = "dashboard:payout_summary"
+PLATFORM_STATS_CACHE_KEY = "dashboard:platform_stats"
+RECENT_DAYS = 30
+
+PAYOUT = {"transaction_type": "PAYOUT"}
+# name: (kind, ledger filters, only the last RECENT_DAYS)
+PAYOUT_SUMMARY_METRICS = {
+    "pending_count": ("count", {**PAYOUT, "status": "PENDING"}, False),
+    "pending_total": ("sum", {**PAYOUT, "status": "PENDING"}, False),
+    "completed_count": ("count", {**PAYOUT, "status": "COMPLETED"}, False),
+    "completed_total": ("sum", {**PAYOUT, "status": "COMPLETED"}, False),
+    "failed_count": ("count", {**PAYOUT, "status": "FAILED"}, False),
+    "failed_total": ("sum", {**PAYOUT, "status": "FAILED"}, False),
+    "recent_payouts_count": ("count", PAYOUT, True),
+    "total_payouts": ("sum", PAYOUT, False),
+    "total_count": ("count", PAYOUT, False),
+}
+PLATFORM_LEDGER_METRICS = {
+    "cash_in_total": ("sum", {"transaction_type": "CASH_IN"}, True),
+    "cash_in_count": ("count", {"transaction_type": "CASH_IN"}, True),
+    "payout_total": ("sum", PAYOUT, True),
+    "payout_count": ("count", PAYOUT, True),
+    "total_fees": ("abs_sum", {"transaction_type": "FEE"}, False),
+}
+
+LEDGER_AGGREGATES = {
+    "count": lambda condition: Count("id", filter=condition),
+    "sum": lambda condition: Sum("amount", filter=condition),
+    "abs_sum": lambda condition: Sum(Abs("amount"), filter=condition),
+}
+ROLLUP_AGGREGATES = {
+    "count": lambda condition: Sum("count", filter=condition),
+    "sum": lambda condition: Sum("amount_total", filter=condition),
+    "abs_sum": lambda condition: Sum("abs_amount_total", filter=condition),
+}
+
+
+def cached(key, build):
+    try:
+        data = cache.get(key)
+    except Exception as e:
+        logger.warning(f"Dashboard cache unavailable: {str(e)}")
+        return build()
+    if data is None:
+        data = build()
+        try:
+            cache.set(key, data, settings.DASHBOARD_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Dashboard cache unavailable: {str(e)}")
+    return data
+
+
+class DashboardStatsService:
+    """Figures behind the payout summary and platform stats admin pages"""
+
+    @staticmethod
+    def aggregate_ledger(metrics):
+        """
+        Compute ledger metrics with one conditional aggregate query.
+
+        With DASHBOARD_USE_DAILY_STATS, only today is read from the ledger and
+        the closed days come from the LedgerDailyStats rollup, the recent
+        window then starts at midnight RECENT_DAYS days ago. Days missing
+        from the rollup are missing from the figures, the rollup_ledger_stats
+        command backfills every day since the first transaction.
+
+        Args:
+            metrics (dict): {name: (kind, filters, recent)}
+        Returns:
+            dict: {name: value}, missing sums are 0
+        """
+        now = timezone.now()
+        recent_since = now - timedelta(days=RECENT_DAYS)
+        transaction_types = {filters["transaction_type"] for _, filters, _ in metrics.values()}
+        ledger = WalletTransaction.objects.filter(transaction_type__in=transaction_types)
+
+        use_rollup = settings.DASHBOARD_USE_DAILY_STATS
+        if use_rollup:
+            today = timezone.localdate(now)
+            ledger = ledger.filter(
+                created_at__gte=LedgerDailyStatsService.get_day_start(today))
+
+        totals = ledger.aggregate(**{
+            name: LEDGER_AGGREGATES[kind](
+                Q(**filters, **({"created_at__gte": recent_since} if recent else {})))
+            for name, (kind, filters, recent) in metrics.items()
+        })
+
+        if use_rollup:
+            rolled_up = LedgerDailyStats.objects.filter(
+                transaction_type__in=transaction_types, date__lt=today,
+            ).aggregate(**{
+                name: ROLLUP_AGGREGATES[kind](
+                    Q(**filters, **({"date__gte": recent_since.date()} if recent else {})))
+                for name, (kind, filters, recent) in metrics.items()
+            })
+            totals = {name: (totals[name] or 0) + (rolled_up[name] or 0) for name in totals}
+
+        return {name: value or 0 for name, value in totals.items()}
+
+    @staticmethod
+    def get_payout_summary():
+        """
+        Payout counts and totals per status, cached for DASHBOARD_CACHE_TTL.
+        Returns:
+            dict: Payout summary figures
+        """
+        return cached(
+            PAYOUT_SUMMARY_CACHE_KEY,
+            lambda: DashboardStatsService.aggregate_ledger(PAYOUT_SUMMARY_METRICS),
+        )
+
+    @staticmethod
+    def build_platform_stats():
+        stats = {"total_creators": CreatorProfile.objects.count()}
+        stats.update(Wallet.objects.aggregate(
+            total_wallets=Count("id"),
+            verified_creators=Count("id", filter=Q(is_verified=True)),
+            active_creators=Count("id", filter=Q(is_active=True)),
+            total_balance=Sum("balance"),
+            avg_balance=Avg("balance"),
+        ))
+        stats.update(DashboardStatsService.aggregate_ledger(PLATFORM_LEDGER_METRICS))
+        stats.update(Payment.objects.aggregate(
+            total_payments=Count("id"),
+            successful_payments=Count("id", filter=Q(status="completed")),
+            pending_payments=Count("id", filter=Q(status="pending")),
+            failed_payments=Count("id", filter=Q(status="failed")),
+            # Only completed payments count towards the total amount
+            total_payment_amount=Sum("amount", filter=Q(status="completed")),
+            total_pending_amount=Sum("amount", filter=Q(status="pending")),
+            total_failed_amount=Sum("amount", filter=Q(status="failed")),
+        ))
+        return {name: value or 0 for name, value in stats.items()}
+
+    @staticmethod
+    def get_platform_stats():
+        """
+        Creator, wallet, ledger and payment statistics, one query per table,
+        cached for DASHBOARD_CACHE_TTL.
+        Returns:
+            dict: Platform statistics
+        """
+        return cached(PLATFORM_STATS_CACHE_KEY, DashboardStatsService.build_platform_stats)
@@ -0,0 +1,297 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from apps.payments.services.payout_orchestrator import PayoutOrchestrator
+from apps.wallets.models import WalletTransaction
+from utils.exceptions import DisbursementError
+from utils.external_requests import limopay_request
+from utils.gateway_client import GatewayUnavailable
+
+logger = logging.getLogger(__name__)
+
+
+class LimopayDisbursementClient:
+    """Submits payout batches to the Limopay bulk disbursement endpoint"""
+
+    SUCCESS_STATUSES = frozenset(["success", "successful", "completed"])
+    FAILED_STATUSES = frozenset(["failed", "rejected"])
+
+    def get_outcome(self, result):
+        status = (result.get("status") or "").lower()
+        if status in self.SUCCESS_STATUSES:
+            return True
+        if status in self.FAILED_STATUSES:
+            return False
+        return None
+
+    def submit(self, provider, items):
+        """
+        Send one batch of payouts for a provider.
+        Args:
+            provider (str): Mobile money provider, e.g. "MTN_MOMO_ZMB"
+            items (list): Payout items built by PayoutDisbursementService
+        Returns:
+            dict: {reference: True (paid), False (rejected) or None (still
+                processing)}
+        Raises:
+            GatewayUnavailable: If the circuit is open and nothing was sent
+            DisbursementError: If the gateway did not accept the batch
+        """
+        data, code = limopay_request(
+            "POST",
+            f"/api/v1/disbursements/bulk/{settings.LIMOPAY_WALLET_ID}/",
+            payload={"provider": provider, "disbursements": items},
+        )
+        if not 200 <= code < 300 or not isinstance(data, dict):
+            status = data.get("status") if isinstance(data, dict) else data
+            if status == "GATEWAY_UNAVAILABLE":
+                raise GatewayUnavailable(f"{provider} batch not sent, gateway circuit open")
+            raise DisbursementError(f"Gateway rejected {provider} batch ({code}): {status}")
+
+        return {
+            result.get("reference"): self.get_outcome(result)
+            for result in data.get("results", [])
+        }
+
+    def lookup(self, reference):
+        """
+        Ask the gateway for the current outcome of one payout.
+        Args:
+            reference (str): The payout transaction reference
+        Returns:
+            bool: True (paid), False (rejected) or None (still processing
+                or unknown to the gateway)
+        Raises:
+            DisbursementError: If the gateway could not be asked
+        """
+        data, code = limopay_request("GET", f"/api/v1/disbursements/{reference}/")
+        if code == 404:
+            return None
+        if not 200 <= code < 300 or not isinstance(data, dict):
+            status = data.get("status") if isinstance(data, dict) else data
+            raise DisbursementError(f"Status lookup of payout {reference} failed ({code}): {status}")
+        return self.get_outcome(data)
+
+
+class PayoutDisbursementService:
+    """Pays out pending payouts through the gateway in provider batches"""
+
+    @staticmethod
+    def claim_pending_payouts():
+        """
+        Claim the pending payouts that have not been sent to the gateway.
+
+        Rows locked by an overlapping run are skipped, and claimed payouts
+        are marked SUBMITTED, so two runs never send the same payout.
+        Returns:
+            QuerySet: The claimed payout transactions, oldest first
+        """
+        with transaction.atomic():
+            ids = list(
+                WalletTransaction.objects.select_for_update(skip_locked=True)
+                .filter(transaction_type="PAYOUT", status="PENDING",
+                        disbursement_status="UNSENT")
+                .order_by("created_at")
+                .values_list("id", flat=True)
+            )
+            WalletTransaction.objects.filter(id__in=ids).update(
+                disbursement_status="SUBMITTED", submitted_at=timezone.now())
+        return (
+            WalletTransaction.objects
+            .filter(id__in=ids)
+            .select_related("wallet__payout_account")
+            .order_by("created_at")
+        )
+
+    @staticmethod
+    def release(payout_ids):
+        """
+        Return submitted payouts to the queue so the next run sends them.
+
+        Only for payouts known not to have reached the gateway, releasing a
+        payout the gateway received pays it out twice.
+        Args:
+            payout_ids (iterable): Ids of the payout transactions
+        Returns:
+            int: Number of payouts released
+        """
+        return WalletTransaction.objects.filter(
+            id__in=list(payout_ids), transaction_type="PAYOUT",
+            status="PENDING", disbursement_status="SUBMITTED",
+        ).update(disbursement_status="UNSENT", submitted_at=None)
+
+    @staticmethod
+    def build_item(payout_tx):
+        account = payout_tx.wallet.payout_account
+        return {
+            "reference": payout_tx.reference,
+            "amount": str(abs(payout_tx.amount)),
+            "currency": payout_tx.wallet.currency,
+            "recipient": account.phone_number,
+            "recipientName": account.account_name,
+            "walletId": str(payout_tx.wallet_id),
+        }
+
+    @staticmethod
+    def get_batches(payouts, batch_size):
+        """
+        Group payouts by the provider of their payout account.
+        Args:
+            payouts (iterable): Pending payout transactions
+            batch_size (int): Payouts per batch
+        Returns:
+            tuple: (list of (provider, [WalletTransaction]) batches,
+                payouts without a usable payout account)
+        """
+        by_provider = defaultdict(list)
+        no_account = []
+        for payout_tx in payouts:
+            account = getattr(payout_tx.wallet, "payout_account", None)
+            # Accounts are created blank with the wallet
+            if account is None or not account.provider or not account.phone_number:
+                no_account.append(payout_tx)
+            else:
+                by_provider[account.provider].append(payout_tx)
+
+        batches = []
+        for provider, provider_payouts in by_provider.items():
+            for start in range(0, len(provider_payouts), batch_size):
+                batches.append((provider, provider_payouts[start:start + batch_size]))
+        return batches, no_account
+
+    @staticmethod
+    @transaction.atomic
+    def finalize_batch(payouts, outcomes, approved_by):
+        """
+        Apply the gateway outcomes of one batch in a single transaction.
+        Args:
+            payouts (list): The batch's payout transactions
+            outcomes (dict): {reference: True, False or None}
+            approved_by (User): The user the payouts are finalized as
+        Returns:
+            dict: Counts of completed, failed and still pending payouts
+        """
+        counts = {"completed": 0, "failed": 0, "pending": 0}
+        for payout_tx in payouts:
+            success = outcomes.get(payout_tx.reference)
+            if success is None:
+                counts["pending"] += 1
+                continue
+            PayoutOrchestrator.finalize(
+                payout_tx=payout_tx, success=success, approved_by=approved_by)
+            counts["completed" if success else "failed"] += 1
+        return counts
+
+    @staticmethod
+    def disburse(approved_by, client=None, batch_size=None, concurrency=None):
+        """
+        Submit every unsent pending payout to the gateway and finalize the
+        results.
+
+        Payouts are claimed first, then grouped by provider and sent in
+        batches, with at most `concurrency` gateway requests in flight.
+        Payouts still processing, in a batch that errored, or whose outcome
+        could not be recorded may have been paid, so they stay SUBMITTED
+        until reconcile() reads their outcome from the gateway or they are
+        released by hand. Only batches never sent (circuit open) and
+        payouts without a payout account are released for the next run.
+
+        Args:
+            approved_by (User): The user the payouts are finalized as
+            client: Disbursement client, defaults to LimopayDisbursementClient
+            batch_size (int): Payouts per gateway request
+            concurrency (int): Gateway requests in flight at once
+        Returns:
+            dict: Counts of batches, completed, failed, pending, errored
+                (in a batch that failed), unsent (released, circuit open),
+                unrecorded (outcome not saved) and no_account payouts
+        """
+        client = client or LimopayDisbursementClient()
+        batch_size = batch_size or settings.PAYOUT_DISBURSE_BATCH_SIZE
+        concurrency = concurrency or settings.PAYOUT_DISBURSE_CONCURRENCY
+
+        batches, no_account = PayoutDisbursementService.get_batches(
+            PayoutDisbursementService.claim_pending_payouts(), batch_size)
+        result = {
+            "batches": len(batches), "completed": 0, "failed": 0, "pending": 0,
+            "errored": 0, "unsent": 0, "unrecorded": 0, "no_account": len(no_account),
+        }
+        for payout_tx in no_account:
+            logger.warning(f"Payout {payout_tx.reference} skipped: wallet has no payout account set up")
+        # Never sent, release them for the next run
+        PayoutDisbursementService.release(payout_tx.id for payout_tx in no_account)
+        if not batches:
+            return result
+
+        # Only the gateway calls run in the pool, the ledger is updated
+        # from this thread
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(
+                    client.submit, provider,
+                    [PayoutDisbursementService.build_item(tx) for tx in payouts],
+                ): (provider, payouts)
+                for provider, payouts in batches
+            }
+            for future in as_completed(futures):
+                provider, payouts = futures[future]
+                try:
+                    outcomes = future.result()
+                except GatewayUnavailable as e:
+                    logger.warning(f"Disbursement of {len(payouts)} {provider} payouts not sent: {str(e)}")
+                    PayoutDisbursementService.release(payout_tx.id for payout_tx in payouts)
+                    result["unsent"] += len(payouts)
+                    continue
+                except Exception as e:
+                    logger.error(f"Disbursement of {len(payouts)} {provider} payouts failed: {str(e)}")
+                    result["errored"] += len(payouts)
+                    continue
+                try:
+                    counts = PayoutDisbursementService.finalize_batch(
+                        payouts, outcomes, approved_by)
+                except Exception as e:
+                    logger.error(f"Recording outcomes of {len(payouts)} {provider} payouts failed: {str(e)}")
+                    result["unrecorded"] += len(payouts)
+                    continue
+                for key, value in counts.items():
+                    result[key] += value
+
+        logger.info(f"Payout disbursement finished: {result}")
+        return result
+
+    @staticmethod
+    def reconcile(approved_by, client=None):
+        """
+        Finalize submitted payouts from their status on the gateway.
+        Args:
+            approved_by (User): The user the payouts are finalized as
+            client: Disbursement client, defaults to LimopayDisbursementClient
+        Returns:
+            dict: Counts of completed, failed, pending (still processing or
+                unknown to the gateway) and errored (lookup or recording
+                failed) payouts
+        """
+        client = client or LimopayDisbursementClient()
+        submitted = WalletTransaction.objects.filter(
+            transaction_type="PAYOUT", status="PENDING",
+            disbursement_status="SUBMITTED",
+        ).order_by("created_at")
+
+        result = {"completed": 0, "failed": 0, "pending": 0, "errored": 0}
+        for payout_tx in submitted:
+            try:
+                success = client.lookup(payout_tx.reference)
+                counts = PayoutDisbursementService.finalize_batch(
+                    [payout_tx], {payout_tx.reference: success}, approved_by)
+            except Exception as e:
+                logger.error(f"Reconciling payout {payout_tx.reference} failed: {str(e)}")
+                result["errored"] += 1
+                continue
+            for key, value in counts.items():
+                result[key] += value
+
+        logger.info(f"Payout reconciliation finished: {result}")
+        return result
@@ -0,0 +1,158 @@
+import logging
+import time
+from decimal import Decimal
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from apps.payouts.models import PayoutBatch
+from apps.payments.services.payout_orchestrator import PayoutOrchestrator
+from apps.wallets.models import Wallet
+from utils.exceptions import InsufficientBalance, InvalidTransaction
+
+logger = logging.getLogger(__name__)
+
+
+class PayoutBatchService:
+    """Runs automatic payouts for many wallets as one tracked batch"""
+
+    # Expected per wallet rejections, other errors are recorded on the batch
+    # too but logged as errors
+    WALLET_ERRORS = (InsufficientBalance, InvalidTransaction, PermissionDenied)
+
+    @staticmethod
+    def get_eligible_wallet_ids():
+        """Ids of the verified wallets with a balance to pay out"""
+        return (
+            Wallet.objects.filter(balance__gt=0, is_verified=True)
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+
+    @staticmethod
+    def start(initiated_by, chunk_size):
+        """
+        Create a batch for the currently eligible wallets.
+        Args:
+            initiated_by (User): The staff user the payouts are made as
+            chunk_size (int): Wallets per chunk
+        Returns:
+            tuple: (PayoutBatch, list of wallet id chunks)
+        """
+        chunks = []
+        chunk = []
+        for wallet_id in PayoutBatchService.get_eligible_wallet_ids().iterator(
+                chunk_size=chunk_size):
+            chunk.append(str(wallet_id))
+            if len(chunk) == chunk_size:
+                chunks.append(chunk)
+                chunk = []
+        if chunk:
+            chunks.append(chunk)
+
+        batch = PayoutBatch.objects.create(
+            initiated_by=initiated_by,
+            wallet_count=sum(len(chunk) for chunk in chunks),
+            chunk_count=len(chunks),
+        )
+        return batch, chunks
+
+    @staticmethod
+    def payout_wallet(wallet_id, initiated_by):
+        """
+        Pay out one wallet, skipping it if a concurrent run holds its lock.
+        Args:
+            wallet_id (str): The wallet id
+            initiated_by (User): The staff user the payout is made as
+        Returns:
+            WalletTransaction or None: The payout, None if the wallet was
+                skipped
+        Raises:
+            InsufficientBalance, InvalidTransaction, PermissionDenied: If the
+                payout is rejected
+        """
+        with transaction.atomic():
+            wallet = (
+                Wallet.objects.select_for_update(skip_locked=True)
+                .filter(id=wallet_id, balance__gt=0, is_verified=True)
+                .first()
+            )
+            if wallet is None:
+                return None
+            return PayoutOrchestrator.initiate_payout(
+                wallet=wallet, initiated_by=initiated_by)
+
+    @staticmethod
+    def process_chunk(batch_id, wallet_ids, initiated_by):
+        """
+        Pay out a chunk of wallets and add the outcome to the batch.
+
+        A failing wallet is recorded on the batch and does not stop the
+        rest of the chunk.
+
+        Args:
+            batch_id (int): The PayoutBatch id
+            wallet_ids (list): Wallet ids in the chunk
+            initiated_by (User): The staff user the payouts are made as
+        Returns:
+            dict: Counts of succeeded, failed and skipped wallets and the
+                total paid out
+        """
+        started = time.monotonic()
+        succeeded = skipped = 0
+        total_amount = Decimal("0.00")
+        errors = []
+        for wallet_id in wallet_ids:
+            try:
+                payout_tx = PayoutBatchService.payout_wallet(wallet_id, initiated_by)
+            except PayoutBatchService.WALLET_ERRORS as e:
+                logger.warning(f"Payout batch {batch_id}: wallet {wallet_id} failed: {str(e)}")
+                errors.append({"wallet_id": str(wallet_id), "error": str(e)})
+                continue
+            except Exception as e:
+                logger.error(f"Payout batch {batch_id}: wallet {wallet_id} errored: {str(e)}")
+                errors.append({"wallet_id": str(wallet_id), "error": str(e)})
+                continue
+            if payout_tx is None:
+                skipped += 1
+            else:
+                succeeded += 1
+                total_amount += abs(payout_tx.amount)
+
+        with transaction.atomic():
+            batch = PayoutBatch.objects.select_for_update().get(pk=batch_id)
+            batch.chunks_done = F('chunks_done') + 1
+            batch.succeeded = F('succeeded') + succeeded
+            batch.failed = F('failed') + len(errors)
+            batch.skipped = F('skipped') + skipped
+            batch.total_amount = F('total_amount') + total_amount
+            batch.processing_seconds = F('processing_seconds') + (time.monotonic() - started)
+            batch.errors = batch.errors + errors
+            batch.save(update_fields=[
+                'chunks_done', 'succeeded', 'failed', 'skipped', 'total_amount',
+                'processing_seconds', 'errors'])
+
+        return {
+            "succeeded": succeeded,
+            "failed": len(errors),
+            "skipped": skipped,
+            "total_amount": str(total_amount),
+        }
+
+    @staticmethod
+    def finish(batch_id, status="completed"):
+        """
+        Close a batch.
+        Args:
+            batch_id (int): The PayoutBatch id
+            status (str): "completed", or "failed" if a chunk task died
+        Returns:
+            PayoutBatch: The closed batch
+        """
+        PayoutBatch.objects.filter(pk=batch_id).update(
+            status=status, finished_at=timezone.now())
+        batch = PayoutBatch.objects.get(pk=batch_id)
+        logger.info(
+            f"Payout batch {batch.pk} {status}: {batch.succeeded} paid, "
+            f"{batch.failed} failed, {batch.skipped} skipped, total {batch.total_amount}")
+        return batch
@@ -1,6 +1,6 @@
-from celery import shared_task
-from apps.wallets.models import Wallet
-from apps.payments.services.payout_orchestrator import PayoutOrchestrator
+from celery import shared_task, chord, group
+from apps.payouts.services.payout_batch_service import PayoutBatchService
+from apps.payouts.services.disbursement_service import PayoutDisbursementService
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
 from django.conf import settings
@@ -12,10 +12,134 @@ logger = logging.getLogger(__name__)
 
 @shared_task
 def auto_payout_wallets():
+    """
+    Pay out every verified wallet with a balance as one PayoutBatch.
+
+    The eligible wallets are split into chunks of PAYOUT_BATCH_CHUNK_SIZE
+    that run in parallel, and the batch is closed once all chunks are done.
+
+    Returns:
+        int: The PayoutBatch id
+    """
     # get superuser
     system_user = User.objects.filter(is_superuser=True).first()
-    for wallet in Wallet.objects.filter(balance__gt=0, is_verified=True):
-        PayoutOrchestrator.initiate_payout(
-            wallet=wallet,
-            initiated_by=system_user,  # System initiated
-        )
\ No newline at end of file
+    if system_user is None:
+        logger.error("Auto payout skipped: no superuser to initiate payouts")
+        return None
+
+    batch, chunks = PayoutBatchService.start(
+        initiated_by=system_user, chunk_size=settings.PAYOUT_BATCH_CHUNK_SIZE)
+    if not chunks:
+        PayoutBatchService.finish(batch.id)
+        return batch.id
+
+    job = chord(
+        group(process_payout_chunk_task.s(batch.id, chunk, system_user.id) for chunk in chunks),
+        finish_payout_batch_task.si(batch.id),
+    )
+    # A chunk task that dies skips the body, close the batch as failed instead
+    job.link_error(fail_payout_batch_task.s(batch.id))
+    job.delay()
+    logger.info(f"Payout batch {batch.id} started: {batch.wallet_count} wallets in {len(chunks)} chunks")
+    return batch.id
+
+
+@shared_task
+def process_payout_chunk_task(batch_id, wallet_ids, initiated_by_id):
+    """
+    Pay out one chunk of a payout batch.
+
+    Args:
+        batch_id (int): The PayoutBatch id
+        wallet_ids (list): Wallet ids in the chunk
+        initiated_by_id (int): Id of the staff user the payouts are made as
+
+    Returns:
+        dict: Counts of succeeded, failed and skipped wallets
+    """
+    try:
+        initiated_by = User.objects.get(id=initiated_by_id)
+        return PayoutBatchService.process_chunk(batch_id, wallet_ids, initiated_by)
+    except Exception as e:
+        logger.error(f"Error in process_payout_chunk_task for batch {batch_id}: {str(e)}")
+        raise
+
+
+@shared_task
+def finish_payout_batch_task(batch_id):
+    """
+    Close a payout batch once all its chunks have run.
+
+    Args:
+        batch_id (int): The PayoutBatch id
+
+    Returns:
+        str: Status message
+    """
+    batch = PayoutBatchService.finish(batch_id)
+    return f"Payout batch {batch.id}: {batch.succeeded} paid, {batch.failed} failed"
+
+
+@shared_task
+def fail_payout_batch_task(request, exc, traceback, batch_id):
+    """
+    Close a payout batch whose chord failed.
+
+    Args:
+        request: The failed task's request
+        exc (Exception): The error that failed the chord
+        traceback: Its traceback
+        batch_id (int): The PayoutBatch id
+
+    Returns:
+        str: Status message
+    """
+    logger.error(f"Payout batch {batch_id} failed: {str(exc)}")
+    batch = PayoutBatchService.finish(batch_id, status="failed")
+    return f"Payout batch {batch.id} failed after {batch.chunks_done} of {batch.chunk_count} chunks"
+
+
+@shared_task
+def disburse_pending_payouts_task(approved_by_id=None):
+    """
+    Pay out all pending payouts through the gateway.
+
+    Args:
+        approved_by_id (int): Id of the user the payouts are finalized as,
+            defaults to the system superuser
+
+    Returns:
+        dict: Counts of the disbursed payouts
+    """
+    try:
+        if approved_by_id is not None:
+            approved_by = User.objects.get(id=approved_by_id)
+        else:
+            approved_by = User.objects.filter(is_superuser=True).first()
+        return PayoutDisbursementService.disburse(approved_by=approved_by)
+    except Exception as e:
+        logger.error(f"Error in disburse_pending_payouts_task: {str(e)}")
+        raise
+
+
+@shared_task
+def reconcile_submitted_payouts_task(approved_by_id=None):
+    """
+    Finalize submitted payouts from their status on the gateway.
+
+    Args:
+        approved_by_id (int): Id of the user the payouts are finalized as,
+            defaults to the system superuser
+
+    Returns:
+        dict: Counts of the reconciled payouts
+    """
+    try:
+        if approved_by_id is not None:
+            approved_by = User.objects.get(id=approved_by_id)
+        else:
+            approved_by = User.objects.filter(is_superuser=True).first()
+        return PayoutDisbursementService.reconcile(approved_by=approved_by)
+    except Exception as e:
+        logger.error(f"Error in reconcile_submitted_payouts_task: {str(e)}")
+        raise
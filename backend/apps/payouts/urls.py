@@ -6,6 +6,7 @@ from .views import (
     finalise_wallet_payout,
     trigger_wallet_payout,
     payout_summary,
+    disburse_pending_payouts,
     stats,
 )
 
@@ -14,6 +15,7 @@ app_name = "payouts"
 urlpatterns = [
     path("summary/", payout_summary, name="payout_summary"),
     path("stats/", stats, name="stats"),
+    path("disburse/", disburse_pending_payouts, name="disburse_pending_payouts"),
     path(
         "<uuid:wallet_id>/initiate/", trigger_wallet_payout, name="trigger_wallet_payout",
     ),
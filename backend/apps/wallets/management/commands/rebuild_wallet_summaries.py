@@ -0,0 +1,24 @@
+"""
+Management command to rebuild the materialized wallet summaries from the ledger.
+"""
+
+from django.core.management.base import BaseCommand
+from apps.wallets.services.wallet_services import WalletSummaryService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild WalletSummary dashboard totals from wallet transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--wallet',
+            action='append',
+            dest='wallet_ids',
+            help='Only rebuild the given wallet id (can be repeated)',
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = WalletSummaryService.rebuild(options['wallet_ids'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Total WalletSummaries rebuilt: {rebuilt}')
+        )
@@ -0,0 +1,24 @@
+"""
+Management command to backfill the LedgerDailyStats rollup used by the
+admin dashboards.
+"""
+
+from django.core.management.base import BaseCommand
+from apps.wallets.services.wallet_services import LedgerDailyStatsService
+
+
+class Command(BaseCommand):
+    help = 'Roll up the wallet transaction ledger into LedgerDailyStats'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Number of closed days to roll up (default: every day since the first transaction)',
+        )
+
+    def handle(self, *args, **options):
+        rows = LedgerDailyStatsService.rollup_days(options['days'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Total LedgerDailyStats rows written: {rows}')
+        )
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0002_wallettransaction_balance_after'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletSummary',
+            fields=[
+                ('wallet', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='wallets.wallet')),
+                ('cash_in_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('cash_out_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('fee_total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('total_outgoing', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('transaction_count', models.PositiveIntegerField(default=0)),
+                ('last_payout_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-18 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def build_daily_earnings(apps, schema_editor):
+    """Backfill the series from the existing cash-ins"""
+    WalletTransaction = apps.get_model('wallets', 'WalletTransaction')
+    WalletDailyEarnings = apps.get_model('wallets', 'WalletDailyEarnings')
+    rows = (
+        WalletTransaction.objects
+        .filter(transaction_type='CASH_IN', status='COMPLETED')
+        .annotate(day=TruncDate('created_at'))
+        .order_by()
+        .values('wallet_id', 'day')
+        .annotate(earnings=Sum('amount'), tip_count=Count('id'))
+    )
+    WalletDailyEarnings.objects.bulk_create(
+        [
+            WalletDailyEarnings(
+                wallet_id=row['wallet_id'], date=row['day'],
+                earnings=row['earnings'], tip_count=row['tip_count'])
+            for row in rows.iterator()
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0005_ledgerdailystats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletDailyEarnings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('earnings', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('tip_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('wallet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_earnings', to='wallets.wallet')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('wallet', 'date'), name='unique_wallet_daily_earnings')],
+            },
+        ),
+        migrations.RunPython(build_daily_earnings, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-18 17:10
+
+from django.db import migrations, models
+
+
+def mark_submitted(apps, schema_editor):
+    """Claimed payouts may already be paid, keep them from being sent again"""
+    WalletTransaction = apps.get_model('wallets', 'WalletTransaction')
+    WalletTransaction.objects.filter(
+        transaction_type='PAYOUT', submitted_at__isnull=False,
+    ).update(disbursement_status='SUBMITTED')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallets', '0008_wallettransaction_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='wallettransaction',
+            name='disbursement_status',
+            field=models.CharField(choices=[('UNSENT', 'Not sent'), ('SUBMITTED', 'Submitted')], default='UNSENT', max_length=20),
+        ),
+        migrations.RunPython(mark_submitted, migrations.RunPython.noop),
+    ]
@@ -78,6 +78,12 @@ class WalletTransaction(UUIDModel):
         ("COMPLETED", "Completed"),
         ("FAILED", "Failed"),
     )
+
+    DISBURSEMENT_STATUS = (
+        ("UNSENT", "Not sent"),
+        # Sent, or about to be sent, with no outcome recorded yet
+        ("SUBMITTED", "Submitted"),
+    )
     wallet = models.ForeignKey(
         Wallet, on_delete=models.CASCADE, related_name="transactions"
     )
@@ -106,6 +112,11 @@ class WalletTransaction(UUIDModel):
 
     reference = models.CharField(max_length=100, unique=True)
     correlation_id = models.CharField(max_length=100, db_index=True)
+    # Running balance of the wallet right after this transaction was applied.
+    # Null for rows that do not move the balance (fees, pending/failed payouts)
+    balance_after = models.DecimalField(
+        max_digits=12, decimal_places=2, null=True, blank=True
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     approved_by = models.ForeignKey(
@@ -116,11 +127,107 @@ class WalletTransaction(UUIDModel):
         related_name="approved_payouts",
     )
     approved_at = models.DateTimeField(null=True, blank=True)
+    # Set when a pending payout is claimed for submission to the gateway.
+    # A submitted payout is never claimed again until a gateway status
+    # lookup finalizes it or it is released by hand
+    disbursement_status = models.CharField(
+        max_length=20, choices=DISBURSEMENT_STATUS, default="UNSENT")
+    submitted_at = models.DateTimeField(null=True, blank=True)
+    # Moves when a payout is finalized, so the ledger rollup can re-roll
+    # the day it was created on
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            # Transaction history, newest first
+            models.Index(fields=["wallet", "created_at"]),
+            # Balance and summary aggregates
+            models.Index(fields=["wallet", "transaction_type", "status"]),
+            # Supporters list and period summaries
+            models.Index(fields=["wallet", "transaction_type", "created_at"]),
+        ]
 
     def __str__(self):
         return f"TXN - {self.transaction_type} - {self.amount}"
 
 
+class WalletSummary(models.Model):
+    """
+    Per wallet dashboard totals, kept in step with the ledger by
+    WalletTransactionService. Rebuild with `manage.py rebuild_wallet_summaries`.
+    """
+    wallet = models.OneToOneField(
+        Wallet, on_delete=models.CASCADE, primary_key=True, related_name="summary"
+    )
+    # Completed credits (cash-ins and fee reversals)
+    cash_in_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    # Completed payouts
+    cash_out_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    # Completed fees
+    fee_total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    # Payouts of any status
+    total_outgoing = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    transaction_count = models.PositiveIntegerField(default=0)
+    last_payout_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Summary({self.wallet_id})"
+
+
+class WalletDailyEarnings(models.Model):
+    """
+    Per wallet completed cash-ins per day, the time series behind the creator
+    analytics endpoint. Kept in step by WalletTransactionService.cash_in.
+    """
+    wallet = models.ForeignKey(
+        Wallet, on_delete=models.CASCADE, related_name="daily_earnings"
+    )
+    date = models.DateField()
+    # Net of fees, like the CASH_IN transactions
+    earnings = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    tip_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["wallet", "date"],
+                name="unique_wallet_daily_earnings",
+            )
+        ]
+
+    def __str__(self):
+        return f"Earnings({self.wallet_id}, {self.date})"
+
+
+class LedgerDailyStats(models.Model):
+    """
+    Platform wide ledger totals per day, transaction type and status, so the
+    admin dashboards don't scan the whole ledger. Closed days are rolled up
+    nightly, see LedgerDailyStatsService.
+    """
+    date = models.DateField()
+    transaction_type = models.CharField(max_length=20)
+    status = models.CharField(max_length=20)
+    count = models.PositiveIntegerField(default=0)
+    amount_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    # Sum of absolute amounts, fees are stored as negative amounts
+    abs_amount_total = models.DecimalField(max_digits=16, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["date", "transaction_type", "status"],
+                name="unique_ledger_daily_stats",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.date} {self.transaction_type}/{self.status}: {self.count}"
+
+
 class WalletKYC(models.Model):
 
     ID_DOCUMENT_TYPE = (
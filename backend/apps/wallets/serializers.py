@@ -2,8 +2,9 @@
 Serializers for payment-related models (Wallet, WalletTransaction, KYC, etc.)
 """
 from rest_framework import serializers
+from datetime import timedelta
 from decimal import Decimal
-from django.db import models
+from django.utils import timezone
 from .models import Wallet, WalletPayoutAccount, WalletTransaction, WalletKYC
 
 
@@ -99,18 +100,19 @@ class WalletDetailSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
 
+    def get_summary(self, obj):
+        from .services.wallet_services import WalletSummaryService
+        return WalletSummaryService.get_summary(obj)
+
     def get_transaction_count(self, obj):
-        return obj.transactions.count()
+        return self.get_summary(obj).transaction_count
 
     def get_total_outgoing(self, obj):
-        return abs(obj.transactions.filter(transaction_type="PAYOUT").aggregate(
-            total=models.Sum("amount")
-        )["total"] or Decimal("0"))
+        return self.get_summary(obj).total_outgoing
 
     def get_next_payout_date(self, obj):
         from .services.wallet_services import PayoutScheduleService
-        last_payout = obj.transactions.filter(transaction_type="PAYOUT").order_by("-created_at").first()
-        last_payout_date = last_payout.created_at if last_payout else None
+        last_payout_date = self.get_summary(obj).last_payout_at
         payout_interval = obj.payout_interval_days or 30  # default to 30 days if not set
         next_payout_date = PayoutScheduleService.get_next_payout_date(
             last_payout_date, payout_interval
@@ -371,3 +373,58 @@ class WalletKYCSerializer(serializers.ModelSerializer):
                 "Bank account number must be at least 5 characters"
             )
         return value
+
+
+# ========== WALLET ANALYTICS SERIALIZERS ==========
+class WalletAnalyticsQuerySerializer(serializers.Serializer):
+    """Query parameters of the earnings analytics endpoint"""
+
+    # Longest series a single request may ask for
+    MAX_BUCKETS = 400
+    DEFAULT_DAYS = 30
+
+    interval = serializers.ChoiceField(
+        choices=["day", "week", "month"], default="day"
+    )
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        """Default to the last 30 days and cap the number of buckets"""
+        end = attrs.get("end") or timezone.localdate()
+        start = attrs.get("start") or end - timedelta(days=self.DEFAULT_DAYS - 1)
+        if start > end:
+            raise serializers.ValidationError(
+                {"start": "Start must be on or before end"}
+            )
+        days_per_bucket = {"day": 1, "week": 7, "month": 28}[attrs["interval"]]
+        if (end - start).days // days_per_bucket + 1 > self.MAX_BUCKETS:
+            raise serializers.ValidationError(
+                {"start": f"Range exceeds {self.MAX_BUCKETS} {attrs['interval']}s"}
+            )
+        attrs["start"], attrs["end"] = start, end
+        return attrs
+
+
+class WalletAnalyticsTotalsSerializer(serializers.Serializer):
+    """Earnings, tip count and average tip over a period"""
+
+    earnings = serializers.DecimalField(max_digits=14, decimal_places=2)
+    tip_count = serializers.IntegerField()
+    average_tip = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class WalletAnalyticsBucketSerializer(WalletAnalyticsTotalsSerializer):
+    """Earnings of one bucket of the analytics series"""
+
+    period = serializers.DateField()
+
+
+class WalletAnalyticsSerializer(serializers.Serializer):
+    """Earnings analytics series with its totals"""
+
+    interval = serializers.CharField()
+    start = serializers.DateField()
+    end = serializers.DateField()
+    buckets = WalletAnalyticsBucketSerializer(many=True)
+    totals = WalletAnalyticsTotalsSerializer()
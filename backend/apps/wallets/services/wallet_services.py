@@ -6,13 +6,19 @@ wallet transactions, ensuring data integrity, and maintaining accurate
 wallet balances.
 """
 import uuid
+import logging
 from decimal import Decimal
 from django.db import transaction
-from django.db.models import Sum, Q
+from django.db.models import Sum, Q, F, Count, Max, Window
+from django.db.models.functions import RowNumber, Abs, TruncDate, TruncWeek, TruncMonth
+from django.utils import timezone
+from utils.daily_rollup import DailyRollupService
 from utils.exceptions import WalletNotFound, WalletError
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Optional
-from apps.wallets.models import WalletTransaction, Wallet
+from apps.wallets.models import (
+    WalletTransaction, Wallet, WalletSummary, LedgerDailyStats, WalletDailyEarnings)
+from apps.payments.models import Payment
 from apps.payments.services.fee_service import FeeService
 from utils.exceptions import (
     InsufficientBalance,
@@ -20,6 +26,30 @@ from utils.exceptions import (
     InvalidTransaction,
 )
 
+logger = logging.getLogger(__name__)
+
+# Transactions that make up the wallet balance once COMPLETED. Fees are
+# already netted off the cash-in amount so they are not part of the balance.
+BALANCE_FILTER = (
+    (Q(transaction_type="CASH_IN") | Q(transaction_type="PAYOUT")) &
+    Q(status="COMPLETED")
+)
+
+# Ledger aggregates behind WalletSummary, outgoing totals are negated into
+# positive values when stored
+SUMMARY_AGGREGATES = {
+    "cash_in_total": Sum("amount", filter=Q(status="COMPLETED", amount__gt=0)),
+    "cash_out_total": Sum(
+        "amount",
+        filter=Q(status="COMPLETED", amount__lt=0, transaction_type="PAYOUT")),
+    "fee_total": Sum(
+        "amount", filter=Q(status="COMPLETED", amount__lt=0, transaction_type="FEE")),
+    "total_outgoing": Sum("amount", filter=Q(transaction_type="PAYOUT")),
+    "transaction_count": Count("id"),
+    "last_payout_at": Max("created_at", filter=Q(transaction_type="PAYOUT")),
+}
+CENTS = Decimal("0.01")
+SUMMARY_TOTAL_FIELDS = ["cash_in_total", "cash_out_total", "fee_total", "total_outgoing"]
 
 
 class PayoutScheduleService:
@@ -68,6 +98,23 @@ class WalletService:
         except Exception:
             raise WalletNotFound("User does not have a wallet")
 
+    @staticmethod
+    def get_ledger_balance(wallet) -> Decimal:
+        """
+        Derives the wallet balance from its completed transaction history.
+        This is a full scan of the wallet ledger, use it for verification
+        and repairs only, money movements update the balance incrementally.
+        Args:
+            wallet (Wallet): The wallet instance to derive the balance for.
+        Returns:
+            Decimal: The balance according to the ledger.
+        """
+        try:
+            return (wallet.transactions.filter(BALANCE_FILTER).aggregate(
+                total=Sum("amount"))["total"] or Decimal("0"))
+        except AttributeError:
+            raise WalletError("Wallet error")
+
     @staticmethod
     def recalculate_wallet_balance(wallet):
         """
@@ -78,21 +125,448 @@ class WalletService:
         Returns:
             Decimal: The updated wallet balance.
         """
+        wallet.balance = WalletService.get_ledger_balance(wallet)
+        wallet.save(update_fields=["balance"])
+
+        return wallet.balance
+
+    @staticmethod
+    def apply_balance_delta(wallet, delta: Decimal) -> Decimal:
+        """
+        Applies a signed amount to the wallet balance in O(1), without
+        touching the transaction history. The wallet row is locked for the
+        rest of the surrounding transaction so concurrent movements on the
+        same wallet are serialised and the returned running balance is exact.
+        Args:
+            wallet (Wallet): The wallet to update (its balance attribute is
+                refreshed in place).
+            delta (Decimal): Positive to credit, negative to debit.
+        Returns:
+            Decimal: The wallet balance after applying the delta.
+        """
         try:
-            query_filter = (
-                (Q(transaction_type="CASH_IN") | Q(transaction_type="PAYOUT")) &
-                Q(status="COMPLETED")
+            current = (
+                Wallet.objects.select_for_update()
+                .values_list("balance", flat=True)
+                .get(pk=wallet.pk)
             )
-            total = (wallet.transactions.filter(query_filter).aggregate(
-                total=Sum("amount"))["total"] or 0)
-        except AttributeError:
+        except (AttributeError, Wallet.DoesNotExist):
             raise WalletError("Wallet error")
 
-        wallet.balance = total
-        wallet.save(update_fields=["balance"])
-
+        Wallet.objects.filter(pk=wallet.pk).update(balance=F("balance") + delta)
+        wallet.balance = current + delta
         return wallet.balance
 
+    @staticmethod
+    def verify_wallet_balance(wallet, repair: bool = False) -> Decimal:
+        """
+        Compares the stored balance with the balance derived from the ledger
+        while holding the wallet row lock.
+        Args:
+            wallet (Wallet): The wallet to verify.
+            repair (bool): Overwrite the stored balance with the ledger
+                balance when they differ.
+        Returns:
+            Decimal: The drift (ledger balance - stored balance), 0 if in sync.
+        """
+        with transaction.atomic():
+            locked = Wallet.objects.select_for_update().get(pk=wallet.pk)
+            ledger_balance = WalletService.get_ledger_balance(locked)
+            drift = ledger_balance - locked.balance
+            if drift:
+                logger.warning(
+                    f"Wallet {locked.pk} balance drift: stored "
+                    f"{locked.balance}, ledger {ledger_balance}"
+                )
+                if repair:
+                    locked.balance = ledger_balance
+                    locked.save(update_fields=["balance"])
+                    wallet.balance = ledger_balance
+        return drift
+
+    @staticmethod
+    def find_balance_drift(repair: bool = False) -> dict:
+        """
+        Verifies every wallet against its ledger. Ledger totals for all
+        wallets are computed in a single grouped query, only wallets that
+        look out of sync are re-checked under lock (which also rules out
+        movements that landed between the two reads).
+        Args:
+            repair (bool): Fix drifted balances from the ledger.
+        Returns:
+            dict: {wallet_id: drift} for wallets whose balance has drifted.
+        """
+        ledger = dict(
+            WalletTransaction.objects.filter(BALANCE_FILTER)
+            .values("wallet_id")
+            .annotate(total=Sum("amount"))
+            .values_list("wallet_id", "total")
+        )
+        drifted = {}
+        wallets = Wallet.objects.values_list("id", "balance").iterator()
+        for wallet_id, balance in wallets:
+            if ledger.get(wallet_id, Decimal("0")) == balance:
+                continue
+            wallet = Wallet(pk=wallet_id)
+            drift = WalletService.verify_wallet_balance(wallet, repair=repair)
+            if drift:
+                drifted[wallet_id] = drift
+        return drifted
+
+
+class WalletSummaryService:
+    """Maintains the materialized WalletSummary dashboard totals."""
+
+    @staticmethod
+    def get_contributions(amount: Decimal, transaction_type: str, status: str) -> dict:
+        """
+        Computes what a single transaction adds to each summary total, the
+        in-memory counterpart of SUMMARY_AGGREGATES.
+        Args:
+            amount (Decimal): Signed transaction amount.
+            transaction_type (str): The transaction type.
+            status (str): The transaction status.
+        Returns:
+            dict: {summary field: amount to add}
+        """
+        completed = status == "COMPLETED"
+        return {
+            "cash_in_total": amount if completed and amount > 0 else Decimal("0"),
+            "cash_out_total": (
+                -amount if completed and amount < 0 and transaction_type == "PAYOUT"
+                else Decimal("0")),
+            "fee_total": (
+                -amount if completed and amount < 0 and transaction_type == "FEE"
+                else Decimal("0")),
+            "total_outgoing": -amount if transaction_type == "PAYOUT" else Decimal("0"),
+        }
+
+    @staticmethod
+    def record_transaction(wallet_tx: WalletTransaction, previous_status: Optional[str] = None):
+        """
+        Applies a new transaction, or a status change of an existing one, to
+        the wallet summary. Must run in the transaction that writes wallet_tx.
+        Args:
+            wallet_tx (WalletTransaction): The created or updated transaction.
+            previous_status (str): The status before the change, None when
+                wallet_tx was just created.
+        """
+        deltas = WalletSummaryService.get_contributions(
+            wallet_tx.amount, wallet_tx.transaction_type, wallet_tx.status)
+        if previous_status is not None:
+            previous = WalletSummaryService.get_contributions(
+                wallet_tx.amount, wallet_tx.transaction_type, previous_status)
+            deltas = {field: deltas[field] - previous[field] for field in deltas}
+
+        updates = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if previous_status is None:
+            updates["transaction_count"] = F("transaction_count") + 1
+            if wallet_tx.transaction_type == "PAYOUT":
+                updates["last_payout_at"] = wallet_tx.created_at
+        if not updates:
+            return
+
+        updated = WalletSummary.objects.filter(wallet_id=wallet_tx.wallet_id).update(
+            updated_at=timezone.now(), **updates)
+        if not updated:
+            # No summary yet, the ledger already includes wallet_tx
+            WalletSummaryService.rebuild([wallet_tx.wallet_id])
+
+    @staticmethod
+    def rebuild(wallet_ids=None) -> int:
+        """
+        Recomputes summaries from the ledger with one grouped query.
+        Args:
+            wallet_ids (list): Wallets to rebuild, all wallets when None.
+        Returns:
+            int: Number of summaries written.
+        """
+        transactions = WalletTransaction.objects.all()
+        wallets = Wallet.objects.all()
+        if wallet_ids is not None:
+            transactions = transactions.filter(wallet_id__in=wallet_ids)
+            wallets = wallets.filter(id__in=wallet_ids)
+
+        totals = {
+            row["wallet_id"]: row
+            for row in transactions.order_by().values("wallet_id").annotate(**SUMMARY_AGGREGATES)
+        }
+        summaries = []
+        for wallet_id in wallets.values_list("id", flat=True).iterator():
+            row = totals.get(wallet_id, {})
+            summaries.append(WalletSummary(
+                wallet_id=wallet_id,
+                **{field: abs(row.get(field) or Decimal("0")) for field in SUMMARY_TOTAL_FIELDS},
+                transaction_count=row.get("transaction_count", 0),
+                last_payout_at=row.get("last_payout_at"),
+            ))
+        WalletSummary.objects.bulk_create(
+            summaries,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["wallet"],
+            update_fields=SUMMARY_TOTAL_FIELDS + [
+                "transaction_count", "last_payout_at", "updated_at"],
+        )
+        return len(summaries)
+
+    @staticmethod
+    def get_summary(wallet) -> WalletSummary:
+        """
+        Fetches the wallet summary, building it from the ledger on first use.
+        Args:
+            wallet (Wallet): The wallet instance.
+        Returns:
+            WalletSummary: The wallet summary.
+        """
+        try:
+            return wallet.summary
+        except WalletSummary.DoesNotExist:
+            WalletSummaryService.rebuild([wallet.pk])
+            wallet.summary = WalletSummary.objects.get(pk=wallet.pk)
+            return wallet.summary
+
+
+class EarningsSummaryService:
+    """Computes the earnings figures behind the daily/weekly summary emails."""
+
+    RECENT_TIPS_LIMIT = 5
+    # period: (length, label)
+    PERIODS = {
+        "daily": (timedelta(days=1), "Today"),
+        "weekly": (timedelta(days=7), "This Week"),
+    }
+
+    @staticmethod
+    def get_period(period: str, now: Optional[datetime] = None):
+        """
+        Resolves a summary period name to its start date and label.
+        Args:
+            period (str): 'daily', 'weekly' or anything else for a one day
+                custom period.
+            now (datetime): End of the period, defaults to now.
+        Returns:
+            tuple: (start_date, period_label)
+        """
+        now = now or timezone.now()
+        length, label = EarningsSummaryService.PERIODS.get(
+            period, (timedelta(days=1), "Custom Period"))
+        return now - length, label
+
+    @staticmethod
+    def get_summaries(wallet_ids, start_date: datetime) -> dict:
+        """
+        Earnings since start_date for many wallets, with one aggregate query
+        grouped by wallet and one windowed query for the recent tips.
+        Args:
+            wallet_ids (list): Wallet ids.
+            start_date (datetime): Start of the period.
+        Returns:
+            dict: {wallet_id: {"total_earnings", "total_fees", "total_tips",
+                "average_tip", "recent_tips"}}, every wallet id is present.
+        """
+        wallet_ids = list(wallet_ids)
+        totals = {
+            row["wallet_id"]: row
+            for row in WalletTransaction.objects.filter(
+                wallet_id__in=wallet_ids,
+                created_at__gte=start_date,
+                transaction_type="CASH_IN",
+                status="COMPLETED",
+            ).order_by().values("wallet_id").annotate(
+                total_earnings=Sum("amount"),
+                total_fees=Sum("fee"),
+                total_tips=Count("id"),
+            )
+        }
+
+        recent_tips = {wallet_id: [] for wallet_id in wallet_ids}
+        payments = Payment.objects.filter(
+            wallet_id__in=wallet_ids,
+            created_at__gte=start_date,
+            status__in=["completed", "captured"],
+        ).annotate(
+            row_number=Window(
+                RowNumber(), partition_by=F("wallet_id"), order_by=F("created_at").desc()),
+        ).filter(
+            row_number__lte=EarningsSummaryService.RECENT_TIPS_LIMIT,
+        ).order_by("wallet_id", "-created_at")
+        for payment in payments:
+            recent_tips[payment.wallet_id].append(payment)
+
+        summaries = {}
+        for wallet_id in wallet_ids:
+            row = totals.get(wallet_id, {})
+            # Some backends drop the column scale from SUM()
+            total_earnings = (row.get("total_earnings") or Decimal("0")).quantize(CENTS)
+            total_tips = row.get("total_tips", 0)
+            summaries[wallet_id] = {
+                "total_earnings": total_earnings,
+                "total_fees": (row.get("total_fees") or Decimal("0")).quantize(CENTS),
+                "total_tips": total_tips,
+                "average_tip": (
+                    total_earnings / total_tips if total_tips > 0 else Decimal("0.00")),
+                "recent_tips": recent_tips[wallet_id],
+            }
+        return summaries
+
+    @staticmethod
+    def get_summary(wallet, start_date: datetime) -> dict:
+        """
+        Earnings since start_date for a single wallet, see get_summaries.
+        Args:
+            wallet (Wallet): The wallet instance.
+            start_date (datetime): Start of the period.
+        Returns:
+            dict: The wallet's summary figures.
+        """
+        return EarningsSummaryService.get_summaries([wallet.pk], start_date)[wallet.pk]
+
+
+class LedgerDailyStatsService(DailyRollupService):
+    """Maintains the LedgerDailyStats rollup behind the admin dashboards."""
+
+    source_model = WalletTransaction
+    stats_model = LedgerDailyStats
+    group_by = ("transaction_type", "status")
+
+    @classmethod
+    def get_aggregates(cls) -> dict:
+        return {
+            "count": Count("id"),
+            "amount_total": Sum("amount"),
+            "abs_amount_total": Sum(Abs("amount")),
+        }
+
+
+class WalletAnalyticsService:
+    """Maintains and queries the per wallet daily earnings series."""
+
+    # interval: function truncating a date to the start of its bucket
+    INTERVALS = {
+        "day": lambda day: day,
+        "week": lambda day: day - timedelta(days=day.weekday()),
+        "month": lambda day: day.replace(day=1),
+    }
+    BUCKET_STEPS = {"day": 1, "week": 7, "month": 31}
+    DB_TRUNCATIONS = {"week": TruncWeek, "month": TruncMonth}
+
+    @staticmethod
+    def record_cash_in(cashin_tx: WalletTransaction):
+        """
+        Adds a completed cash-in to its day. Must run in the transaction
+        that writes cashin_tx, after the wallet row was locked.
+        Args:
+            cashin_tx (WalletTransaction): The created cash-in.
+        """
+        day = timezone.localdate(cashin_tx.created_at)
+        updated = WalletDailyEarnings.objects.filter(
+            wallet_id=cashin_tx.wallet_id, date=day,
+        ).update(
+            earnings=F("earnings") + cashin_tx.amount,
+            tip_count=F("tip_count") + 1,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            # First tip of the day, the ledger already includes cashin_tx
+            WalletAnalyticsService.rebuild([cashin_tx.wallet_id], since=day)
+
+    @staticmethod
+    def rebuild(wallet_ids=None, since: Optional[date] = None) -> int:
+        """
+        Recomputes the series from the ledger with one grouped query.
+        Args:
+            wallet_ids (list): Wallets to rebuild, all wallets when None.
+            since (date): First day to rebuild, all days when None.
+        Returns:
+            int: Number of days written.
+        """
+        transactions = WalletTransaction.objects.filter(
+            transaction_type="CASH_IN", status="COMPLETED")
+        if wallet_ids is not None:
+            transactions = transactions.filter(wallet_id__in=wallet_ids)
+        if since is not None:
+            transactions = transactions.filter(
+                created_at__gte=LedgerDailyStatsService.get_day_start(since))
+
+        rows = (
+            transactions.annotate(day=TruncDate("created_at"))
+            .order_by()
+            .values("wallet_id", "day")
+            .annotate(earnings=Sum("amount"), tip_count=Count("id"))
+        )
+        days = [
+            WalletDailyEarnings(
+                wallet_id=row["wallet_id"], date=row["day"],
+                earnings=row["earnings"], tip_count=row["tip_count"])
+            for row in rows
+        ]
+        WalletDailyEarnings.objects.bulk_create(
+            days,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["wallet", "date"],
+            update_fields=["earnings", "tip_count", "updated_at"],
+        )
+        return len(days)
+
+    @staticmethod
+    def get_buckets(interval: str, start: date, end: date) -> list:
+        """Start dates of the buckets covering start to end."""
+        truncate = WalletAnalyticsService.INTERVALS[interval]
+        step = WalletAnalyticsService.BUCKET_STEPS[interval]
+        buckets = []
+        bucket = truncate(start)
+        while bucket <= end:
+            buckets.append(bucket)
+            # Any day of the next bucket truncates to its start
+            bucket = truncate(bucket + timedelta(days=step))
+        return buckets
+
+    @staticmethod
+    def get_series(wallet, interval: str, start: date, end: date) -> dict:
+        """
+        Earnings, tip counts and average tip per bucket, read from the daily
+        series only.
+        Args:
+            wallet (Wallet): The wallet instance.
+            interval (str): 'day', 'week' or 'month'.
+            start (date): First day of the range.
+            end (date): Last day of the range.
+        Returns:
+            dict: {"buckets": [{"period", "earnings", "tip_count",
+                "average_tip"}], "totals": {...}}, buckets without tips
+                are included with zeros.
+        """
+        days = WalletDailyEarnings.objects.filter(
+            wallet=wallet, date__gte=start, date__lte=end)
+        truncation = WalletAnalyticsService.DB_TRUNCATIONS.get(interval)
+        period = truncation("date") if truncation else F("date")
+        rows = {
+            row["period"]: row
+            for row in days.annotate(period=period).order_by()
+            .values("period").annotate(earnings=Sum("earnings"), tip_count=Sum("tip_count"))
+        }
+
+        def figures(earnings, tip_count):
+            earnings = (earnings or Decimal("0")).quantize(CENTS)
+            return {
+                "earnings": earnings,
+                "tip_count": tip_count,
+                "average_tip": (
+                    (earnings / tip_count).quantize(CENTS) if tip_count else Decimal("0.00")),
+            }
+
+        buckets = []
+        total_earnings, total_tips = Decimal("0"), 0
+        for bucket in WalletAnalyticsService.get_buckets(interval, start, end):
+            row = rows.get(bucket, {})
+            tip_count = row.get("tip_count") or 0
+            total_earnings += row.get("earnings") or Decimal("0")
+            total_tips += tip_count
+            buckets.append({"period": bucket, **figures(row.get("earnings"), tip_count)})
+        return {"buckets": buckets, "totals": figures(total_earnings, total_tips)}
+
 
 class WalletTransactionService:
     """
@@ -138,6 +612,7 @@ class WalletTransactionService:
             related_transaction=related_transaction,
             correlation_id=related_transaction.correlation_id,
         )
+        WalletSummaryService.record_transaction(fee_tx)
 
         return fee_tx
 
@@ -164,6 +639,7 @@ class WalletTransactionService:
         net_amount = amount - fee
         
         correlation_id = f"CASHIN-{uuid.uuid4()}"
+        balance_after = WalletService.apply_balance_delta(wallet, net_amount)
 
         cashin_tx = WalletTransaction.objects.create(
             wallet=wallet,
@@ -173,7 +649,10 @@ class WalletTransactionService:
             payment=payment,
             reference=reference,
             correlation_id=correlation_id,
+            balance_after=balance_after,
         )
+        WalletSummaryService.record_transaction(cashin_tx)
+        WalletAnalyticsService.record_cash_in(cashin_tx)
 
         # Fee linked to cash-in
         if fee > 0:
@@ -184,7 +663,6 @@ class WalletTransactionService:
                 related_transaction=cashin_tx,
             )
 
-        WalletService.recalculate_wallet_balance(wallet)
         return cashin_tx
 
     @staticmethod
@@ -208,8 +686,9 @@ class WalletTransactionService:
 
         payout_fee = FeeService.payout_fee()
         total_required = amount + payout_fee
+        # The locked row holds the up to date balance, pending payouts are
+        # only deducted once finalized
         wallet = Wallet.objects.select_for_update().get(pk=wallet.pk)
-        WalletService.recalculate_wallet_balance(wallet)
 
         if wallet.balance < total_required:
             raise InsufficientBalance(
@@ -227,6 +706,7 @@ class WalletTransactionService:
             reference=payout_reference,
             correlation_id=correlation_id,
         )
+        WalletSummaryService.record_transaction(payout_tx)
         if payout_fee > 0:
             # Fee linked to payout
             WalletTransactionService.create_fee_transaction(
@@ -236,7 +716,6 @@ class WalletTransactionService:
                 related_transaction=payout_tx,
             )
 
-        WalletService.recalculate_wallet_balance(wallet)
         return payout_tx
 
     @staticmethod
@@ -256,6 +735,13 @@ class WalletTransactionService:
         if payout_tx.transaction_type != "PAYOUT":
             raise InvalidTransaction("Not a payout transaction")
 
+        # Re-read the status under lock so concurrent finalizations can't
+        # apply the payout to the balance twice
+        payout_tx.status = (
+            WalletTransaction.objects.select_for_update()
+            .values_list("status", flat=True)
+            .get(pk=payout_tx.pk)
+        )
         if payout_tx.status != "PENDING":
             return payout_tx  # idempotent
 
@@ -263,13 +749,20 @@ class WalletTransactionService:
 
         if success:
             payout_tx.status = "COMPLETED"
-            payout_tx.save(update_fields=["status", "approved_by"])
-            WalletService.recalculate_wallet_balance(payout_tx.wallet)
+            payout_tx.balance_after = WalletService.apply_balance_delta(
+                payout_tx.wallet, payout_tx.amount
+            )
+            payout_tx.save(
+                update_fields=["status", "approved_by", "balance_after", "updated_at"])
+            WalletSummaryService.record_transaction(
+                payout_tx, previous_status="PENDING")
             return payout_tx
         
         # FAILED PAYOUT → reverse fee
         payout_tx.status = "FAILED"
-        payout_tx.save(update_fields=["status", "approved_by"])
+        payout_tx.save(update_fields=["status", "approved_by", "updated_at"])
+        WalletSummaryService.record_transaction(
+            payout_tx, previous_status="PENDING")
 
         fee_tx = payout_tx.related_fees.filter(
             transaction_type="FEE",
@@ -285,5 +778,5 @@ class WalletTransactionService:
                 transaction_type="FEE_REVERSAL",
             )
 
-        WalletService.recalculate_wallet_balance(payout_tx.wallet)
+        # Failed payouts and fee reversals don't move the balance
         return payout_tx
@@ -0,0 +1,80 @@
+"""
+Celery tasks for the wallets app.
+Handles background checks on wallet balances and the nightly ledger rollup.
+"""
+import logging
+from celery import shared_task
+from celery.schedules import crontab
+from config.celery import app
+from apps.wallets.services.wallet_services import (
+    WalletService, LedgerDailyStatsService)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def verify_wallet_balances_task(repair=False):
+    """
+    Re-derive every wallet balance from its ledger and flag drift.
+
+    Balances are maintained incrementally by WalletTransactionService, this
+    task is the safety net that catches any divergence (manual edits, bugs).
+
+    Args:
+        repair (bool): Overwrite drifted balances with the ledger balance
+
+    Returns:
+        str: Status message
+    """
+    try:
+        drifted = WalletService.find_balance_drift(repair=repair)
+        if drifted:
+            for wallet_id, drift in drifted.items():
+                logger.error(f"Wallet {wallet_id} balance drift of {drift}")
+            return f"Balance drift detected on {len(drifted)} wallets"
+        return "All wallet balances match the ledger"
+    except Exception as e:
+        logger.error(f"Error in verify_wallet_balances_task: {str(e)}")
+        raise
+
+
+# Verify wallet balances against the ledger every day at 2:00 AM
+@app.on_after_finalize.connect
+def setup_verify_wallet_balances_task(sender, **kwargs):
+    """Schedule the wallet balance verification task to run daily at 2:00 AM."""
+    sender.add_periodic_task(
+        crontab(hour=2, minute=0),
+        verify_wallet_balances_task.s(),
+        name='Verify wallet balances against the ledger every day'
+    )
+
+
+@shared_task
+def rollup_ledger_daily_stats_task(hours=25):
+    """
+    Roll up yesterday's ledger, and older days whose transactions changed
+    since the previous run (payouts finalized late), into LedgerDailyStats.
+
+    Args:
+        hours (int): How far back to look for changed transactions
+
+    Returns:
+        str: Status message
+    """
+    try:
+        days = LedgerDailyStatsService.rollup_recent(hours=hours)
+        return f"Rolled up ledger stats for {days} days"
+    except Exception as e:
+        logger.error(f"Error in rollup_ledger_daily_stats_task: {str(e)}")
+        raise
+
+
+# Roll up the ledger for the admin dashboards every day at 0:30 AM
+@app.on_after_finalize.connect
+def setup_rollup_ledger_daily_stats_task(sender, **kwargs):
+    """Schedule the ledger rollup task to run daily at 0:30 AM."""
+    sender.add_periodic_task(
+        crontab(hour=0, minute=30),
+        rollup_ledger_daily_stats_task.s(),
+        name='Roll up ledger daily stats every day'
+    )
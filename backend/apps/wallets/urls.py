@@ -4,6 +4,7 @@ from apps.wallets.views import (
     WalletListView,
     WalletTransactionsView,
     WalletKYCView,
+    WalletAnalyticsView,
     WalletPayoutAccountView)
 
 app_name = 'wallets'
@@ -14,4 +15,5 @@ urlpatterns = [
     path('transactions/', WalletTransactionsView.as_view(), name='wallet_transactions'),
     path('payout-account/', WalletPayoutAccountView.as_view(), name='wallet_payout_account'),
     path('supporters/', SupporterListView.as_view(), name='wallet_supporters'),
+    path('analytics/', WalletAnalyticsView.as_view(), name='wallet_analytics'),
 ]
\ No newline at end of file
@@ -1,12 +1,13 @@
-from django.db.models import Sum, Q, Count, F
+import logging
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination, LimitOffsetPagination
+from rest_framework.pagination import LimitOffsetPagination
 from drf_spectacular.utils import extend_schema
 from apps.wallets.models import WalletTransaction, WalletKYC, WalletPayoutAccount
-from apps.payments.models import Payment
+from apps.payments.tasks import refresh_wallet_payment_statuses_task
 from apps.wallets.serializers import (
     CreatorSupporterSerializer,
     WalletDetailSerializer,
@@ -14,19 +15,24 @@ from apps.wallets.serializers import (
     WalletKYCSerializer,
     WalletPayoutAccountSerializer,
     WalletUpdateSerializer,
+    WalletAnalyticsQuerySerializer,
+    WalletAnalyticsSerializer,
 )
 from apps.wallets.services.wallet_services import (
-    WalletTransactionService, WalletService)
-from utils.exceptions import DuplicateTransaction, WalletNotFound
+    WalletService, WalletSummaryService, WalletAnalyticsService)
+from utils.exceptions import WalletNotFound
 from utils.authentication import RequireAPIKey
 from utils import serializers as helpers
-from utils.external_requests import pawapay_request
+from utils.pagination import (
+    CreatedAtCursorPagination, SizedPageNumberPagination, use_cursor_pagination)
+
+logger = logging.getLogger(__name__)
 
 
 class SupporterListView(APIView):
     permission_classes = [RequireAPIKey, IsAuthenticated]
     serializer_class = CreatorSupporterSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = SizedPageNumberPagination
 
     @extend_schema(
         operation_id="list_wallet_supporters",
@@ -68,9 +74,12 @@ class SupporterListView(APIView):
             .filter(wallet=wallet, transaction_type="CASH_IN")
         )
 
-        # Apply pagination
-        paginator = self.pagination_class()
-        paginator.page_size = request.query_params.get('page_size', 25)
+        # Apply pagination, ?pagination=cursor switches to keyset pages
+        if use_cursor_pagination(request):
+            paginator = CreatedAtCursorPagination()
+        else:
+            paginator = self.pagination_class()
+        paginator.page_size = 25
         paginated_supporters = paginator.paginate_queryset(supporters, request)
 
         serializer = CreatorSupporterSerializer(paginated_supporters, many=True)
@@ -171,6 +180,9 @@ class WalletPayoutAccountView(APIView):
 
 class WalletListView(APIView):
     permission_classes = [RequireAPIKey, IsAuthenticated]
+    # Seconds between background payment status refreshes per wallet
+    STATUS_REFRESH_INTERVAL = 60
+
     @extend_schema(
         operation_id="retrieve__Wallet",
         summary="Retrieve Users Wallet",
@@ -210,19 +222,12 @@ class WalletListView(APIView):
             wallet=wallet, transaction_type="CASH_IN"
         ).order_by("-created_at")[:10]
 
-        # Update payment statuses for incomplete payments
-        self._update_payment_statuses(wallet)
-
-        # Calculate totals for completed transactions
-        totals = WalletTransaction.objects.filter(
-            wallet=wallet, status="COMPLETED"
-        ).aggregate(
-            cash_in=Sum("amount", filter=Q(amount__gt=0)),
-            cash_out=Sum("amount",
-                        filter=Q(amount__lt=0) & Q(transaction_type="PAYOUT")),
-            cash_in_costs=Sum("amount",
-                            filter=Q(amount__lt=0) & Q(transaction_type="FEE")),
-        )
+        # Refresh incomplete payment statuses off the request path,
+        # the response is built from the current DB state
+        self._schedule_payment_status_refresh(wallet)
+
+        # Totals for completed transactions, maintained by WalletTransactionService
+        summary = WalletSummaryService.get_summary(wallet)
 
         # Serialize wallet details
         serializer = WalletDetailSerializer(wallet)
@@ -230,9 +235,9 @@ class WalletListView(APIView):
 
         # Add transaction summaries and recent transactions
         wallet_data.update({
-            "cash_in": totals["cash_in"] or 0,
-            "cash_out": abs(totals["cash_out"] or 0),
-            "cash_in_costs": abs(totals["cash_in_costs"] or 0),
+            "cash_in": summary.cash_in_total,
+            "cash_out": summary.cash_out_total,
+            "cash_in_costs": summary.fee_total,
             "recent_transactions": WalletTransactionListSerializer(
                 transactions, many=True
             ).data,
@@ -243,45 +248,17 @@ class WalletListView(APIView):
             status=status.HTTP_200_OK
         )
 
-    def _update_payment_statuses(self, wallet):
-        """Helper method to update payment statuses from external provider."""
-        payments = Payment.objects.filter(wallet=wallet)
-
-        if not payments:
+    def _schedule_payment_status_refresh(self, wallet):
+        """Queue a background status refresh, at most once per interval per wallet."""
+        if not cache.add(f"wallet_status_refresh:{wallet.id}", 1,
+                         timeout=self.STATUS_REFRESH_INTERVAL):
             return
+        try:
+            refresh_wallet_payment_statuses_task.delay(wallet.id)
+        except Exception as e:
+            # The dashboard still renders from DB state
+            logger.warning(f"Could not queue payment status refresh: {str(e)}")
 
-        for payment in payments:
-            skip_statuses = [
-                "pending",
-                "submitted",
-                "accepted",
-                "processing",
-                "in_reconciliation",
-            ]
-            payment_status = payment.status
-
-            if payment_status.lower() != "completed":
-                data, code = pawapay_request(
-                    "GET", f"/v2/deposits/{payment.id}"
-                )
-                if code == 200 and "data" in data:
-                    payment_status = data["data"]["status"].lower()
-
-                    if payment_status not in skip_statuses:
-                        payment.status = payment_status
-                        payment.save()
-
-                    # Process completed payment
-                    if payment_status == "completed" and payment.wallet is not None:
-                        try:
-                            WalletTransactionService.cash_in(
-                                wallet=payment.wallet,
-                                amount=payment.amount,
-                                payment=payment,
-                                reference=payment.reference,
-                            )
-                        except DuplicateTransaction:
-                            pass
     @extend_schema(
             operation_id="update_wallet_payout_interval",
             summary="Update Wallet Payout Interval",
@@ -317,7 +294,8 @@ class WalletListView(APIView):
             )
 
         wallet.payout_interval_days = serializer.validated_data["payout_interval_days"]
-        wallet.save()
+        # Never write the (possibly stale) balance back from a settings update
+        wallet.save(update_fields=["payout_interval_days", "updated_at"])
 
         return Response(
             {
@@ -382,9 +360,14 @@ class WalletTransactionsView(APIView):
         # Order by creation date (newest first)
         queryset = queryset.order_by("-created_at")
 
-        # Apply pagination (supports both 'limit' and 'offset' params for backward compatibility)
-        paginator = self.pagination_class()
-        paginator.page_size = int(request.query_params.get("limit", 10))
+        # Apply pagination (supports both 'limit' and 'offset' params for backward compatibility,
+        # ?pagination=cursor switches to keyset pages for deep history)
+        if use_cursor_pagination(request):
+            paginator = CreatedAtCursorPagination()
+            paginator.page_size_query_param = "limit"
+            paginator.page_size = 10
+        else:
+            paginator = self.pagination_class()
         paginated_transactions = paginator.paginate_queryset(queryset, request)
 
         serializer = WalletTransactionListSerializer(paginated_transactions, many=True)
@@ -475,3 +458,60 @@ class WalletKYCView(APIView):
             {"error": "Invalid data", "details": serializer.errors},
             status=status.HTTP_400_BAD_REQUEST
         )
+
+
+class WalletAnalyticsView(APIView):
+    permission_classes = [RequireAPIKey, IsAuthenticated]
+    serializer_class = WalletAnalyticsSerializer
+
+    @extend_schema(
+        operation_id="get_wallet_analytics",
+        summary="Get Wallet Earnings Analytics",
+        parameters=[WalletAnalyticsQuerySerializer],
+        responses={
+            200: helpers.SuccessResponseSerializer,
+            400: helpers.ValidationErrorSerializer,
+            401: helpers.UnauthorizedErrorSerializer,
+            403: helpers.ForbiddenErrorSerializer,
+            404: helpers.NotFoundErrorSerializer,
+            429: helpers.RateLimitErrorSerializer,
+            500: helpers.ServerErrorSerializer,
+        }
+    )
+    def get(self, request):
+        """
+        Earnings, tip counts and average tip of the authenticated creator,
+        bucketed by day, week or month.
+
+        Query parameters: interval (day, week or month, default day), start
+        and end (YYYY-MM-DD, default the last 30 days). Buckets without tips
+        are returned with zeros. Served from the daily earnings series, not
+        the ledger.
+
+        Authentication
+        --------------
+        Requires authentication (creator).
+        """
+        query = WalletAnalyticsQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(
+                {"status": "failed", "errors": query.errors},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            wallet = WalletService.get_wallet_for_user(request.user)
+        except WalletNotFound:
+            return Response(
+                {"status": "NOT_FOUND"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        params = query.validated_data
+        series = WalletAnalyticsService.get_series(
+            wallet, params["interval"], params["start"], params["end"])
+        serializer = WalletAnalyticsSerializer({**params, **series})
+        return Response(
+            {"status": "success", "data": serializer.data},
+            status=status.HTTP_200_OK
+        )
@@ -214,6 +214,15 @@ LIMOPAY_BASE_URL = env("LIMOPAY_BASE_URL", default="https://sandbox.lipila.tech"
 LIMOPAY_API_KEY = env("LIMOPAY_API_KEY", default="")
 LIMOPAY_WALLET_ID = env("LIMOPAY_WALLET_ID", default="")
 
+# Gateway HTTP client (utils/gateway_client.py)
+LIMOPAY_POOL_SIZE = env.int("LIMOPAY_POOL_SIZE", default=10)
+LIMOPAY_CONNECT_TIMEOUT = env.float("LIMOPAY_CONNECT_TIMEOUT", default=3.05)
+LIMOPAY_READ_TIMEOUT = env.float("LIMOPAY_READ_TIMEOUT", default=10)
+LIMOPAY_MAX_RETRIES = env.int("LIMOPAY_MAX_RETRIES", default=2)
+LIMOPAY_RETRY_BACKOFF = env.float("LIMOPAY_RETRY_BACKOFF", default=0.5)
+LIMOPAY_CIRCUIT_FAILURE_THRESHOLD = env.int("LIMOPAY_CIRCUIT_FAILURE_THRESHOLD", default=5)
+LIMOPAY_CIRCUIT_RESET_TIMEOUT = env.int("LIMOPAY_CIRCUIT_RESET_TIMEOUT", default=30)
+
 # Configure Gmail Email settings
 EMAIL_HOST = 'smtp.gmail.com'
 EMAIL_PORT = 587
@@ -222,6 +231,30 @@ EMAIL_HOST_USER = env('EMAIL_HOST_USER', default='')
 EMAIL_HOST_PASSWORD = env('EMAIL_HOST_PASSWORD', default='')
 # set default from email to the same as host user
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+# Bulk campaign emails: messages sent per SMTP connection, batch tasks a
+# worker may start (Celery rate limit) and send attempts per message
+EMAIL_BATCH_SIZE = env.int("EMAIL_BATCH_SIZE", default=50)
+EMAIL_BATCH_RATE_LIMIT = env("EMAIL_BATCH_RATE_LIMIT", default="20/m")
+EMAIL_MAX_ATTEMPTS = env.int("EMAIL_MAX_ATTEMPTS", default=3)
+# Wallets per summary email job enqueued by the daily summary dispatcher
+SUMMARY_EMAIL_CHUNK_SIZE = env.int("SUMMARY_EMAIL_CHUNK_SIZE", default=500)
+# Wallets per chunk task of an automatic payout batch
+PAYOUT_BATCH_CHUNK_SIZE = env.int("PAYOUT_BATCH_CHUNK_SIZE", default=100)
+# Bulk disbursement: payouts per gateway request and gateway requests in
+# flight at once
+PAYOUT_DISBURSE_BATCH_SIZE = env.int("PAYOUT_DISBURSE_BATCH_SIZE", default=100)
+PAYOUT_DISBURSE_CONCURRENCY = env.int("PAYOUT_DISBURSE_CONCURRENCY", default=4)
+# Admin dashboards: seconds the figures are cached, and whether closed days
+# are read from the nightly LedgerDailyStats/PaymentDailyStats rollups
+# instead of the ledger and payments tables. All-time figures only cover the
+# rolled up days, so run `manage.py rollup_ledger_stats` and
+# `manage.py rollup_payment_stats` (all history by default) before turning
+# this on
+DASHBOARD_CACHE_TTL = env.int("DASHBOARD_CACHE_TTL", default=60)
+DASHBOARD_USE_DAILY_STATS = env.bool("DASHBOARD_USE_DAILY_STATS", default=False)
+# Incremental Firestore user sync from Celery beat, every N minutes
+FIRESTORE_SYNC_ENABLED = env.bool("FIRESTORE_SYNC_ENABLED", default=False)
+FIRESTORE_SYNC_INTERVAL_MINUTES = env.int("FIRESTORE_SYNC_INTERVAL_MINUTES", default=5)
 
 
 # Celery Configuration
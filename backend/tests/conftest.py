@@ -24,6 +24,25 @@ def mock_firebase_setup():
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached state (throttles, dedup keys, cached pages) per test"""
+    from django.core.cache import cache
+    from apps.customauth.api_keys import local_cache
+    cache.clear()
+    local_cache.clear()
+    yield
+    cache.clear()
+    local_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    """Write uploaded test files under a temporary MEDIA_ROOT"""
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    return settings.MEDIA_ROOT
+
+
 @pytest.fixture
 def api_client():
     """Fixture for DRF API client."""
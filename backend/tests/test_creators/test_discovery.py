@@ -0,0 +1,148 @@
+"""
+Tests for the denormalized creator discovery feed and the list endpoint
+filters built on it.
+"""
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.urls import reverse
+from apps.creators.models import CreatorCategory, CreatorDiscoveryEntry, CreatorProfile
+from apps.creators.services.discovery import CreatorDiscoveryService
+from apps.customadmin.admin import CreatorProfileAdmin
+from tests.factories import UserFactory
+
+
+def make_listed_creator(followers=0, categories=(), **user_fields):
+    user = UserFactory(**user_fields)
+    profile = user.creator_profile
+    profile.verified = True
+    profile.followers_count = followers
+    profile.save()
+    if categories:
+        profile.categories.set(categories)
+    return profile
+
+
+def make_category(name):
+    return CreatorCategory.objects.create(name=name)
+
+
+def listed_usernames(response):
+    return [item["user"]["username"] for item in response.json()["results"]["data"]]
+
+
+@pytest.mark.django_db
+class TestCreatorDiscoveryService:
+
+    def test_only_active_verified_creators_are_indexed(self):
+        listed = make_listed_creator()
+        unverified = UserFactory().creator_profile
+        suspended = make_listed_creator()
+        suspended.status = "suspended"
+        suspended.save()
+
+        profile_ids = set(CreatorDiscoveryEntry.objects.values_list("profile_id", flat=True))
+
+        assert profile_ids == {listed.id}
+        assert unverified.id not in profile_ids
+
+    def test_category_rows_follow_profile_categories(self):
+        music, comedy = make_category("Music"), make_category("Comedy")
+        profile = make_listed_creator(categories=[music, comedy])
+
+        profile.categories.remove(comedy)
+
+        slugs = set(CreatorDiscoveryEntry.objects.filter(
+            profile=profile).values_list("category_slug", flat=True))
+        assert slugs == {"", music.slug}
+
+    def test_category_slug_change_is_propagated(self):
+        music = make_category("Music")
+        make_listed_creator(categories=[music])
+
+        music.slug = "music-renamed"
+        music.save()
+
+        assert CreatorDiscoveryEntry.objects.filter(category_slug="music-renamed").count() == 1
+
+    def test_user_rename_updates_search_fields(self):
+        profile = make_listed_creator(username="oldname")
+        user = profile.user
+        user.username = "NewName"
+        user.save()
+
+        assert list(CreatorDiscoveryService.get_feed(search="newn")) != []
+        assert list(CreatorDiscoveryService.get_feed(search="oldn")) == []
+
+    def test_saving_unrelated_user_fields_skips_reindex(self, mocker):
+        user = make_listed_creator().user
+        update_user = mocker.patch.object(CreatorDiscoveryService, "update_user")
+
+        user.save(update_fields=["last_login"])
+        user.save(update_fields=["first_name"])
+
+        update_user.assert_called_once_with(user)
+
+    def test_feed_is_ordered_by_followers(self):
+        low = make_listed_creator(followers=5)
+        high = make_listed_creator(followers=50)
+
+        feed = CreatorDiscoveryService.get_feed()
+
+        assert [entry.profile_id for entry in feed] == [high.id, low.id]
+
+    def test_rebuild_command_restores_feed(self):
+        profile = make_listed_creator(categories=[make_category("Music")])
+        CreatorDiscoveryEntry.objects.all().delete()
+
+        call_command("rebuild_discovery_index")
+
+        assert CreatorDiscoveryEntry.objects.filter(profile=profile).count() == 2
+
+    def test_admin_verify_action_lists_creators(self, mocker):
+        profile = UserFactory().creator_profile
+        admin = CreatorProfileAdmin(CreatorProfile, AdminSite())
+        mocker.patch.object(admin, "message_user")
+        invalidate = mocker.patch("apps.customadmin.admin.invalidate_creator")
+
+        admin.verify_creator(None, CreatorProfile.objects.filter(verified=False))
+
+        assert CreatorDiscoveryEntry.objects.filter(profile=profile).exists()
+        invalidate.assert_called_once_with(profile.user.slug)
+
+
+@pytest.mark.django_db
+class TestCreatorsListFilters:
+
+    def test_filter_by_category(self, api_client):
+        music = make_category("Music")
+        in_category = make_listed_creator(categories=[music])
+        make_listed_creator()
+
+        url = reverse("creators:creator_profiles_list")
+        response = api_client.get(url, {"category": music.slug})
+
+        assert response.status_code == 200
+        assert listed_usernames(response) == [in_category.user.username]
+
+    def test_search_by_name_prefix(self, api_client):
+        match = make_listed_creator(first_name="Mutale", last_name="Banda")
+        make_listed_creator(first_name="Chanda", last_name="Phiri")
+
+        url = reverse("creators:creator_profiles_list")
+        response = api_client.get(url, {"search": "muta"})
+
+        assert listed_usernames(response) == [match.user.username]
+
+    def test_cursor_pagination(self, api_client):
+        profiles = [make_listed_creator(followers=n) for n in range(5)]
+        expected = [p.user.username for p in reversed(profiles)]
+
+        url = reverse("creators:creator_profiles_list")
+        response = api_client.get(url, {"pagination": "cursor", "page_size": 2})
+        seen = listed_usernames(response)
+        while response.json()["next"]:
+            response = api_client.get(response.json()["next"])
+            seen += listed_usernames(response)
+
+        assert seen == expected
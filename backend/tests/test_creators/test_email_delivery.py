@@ -0,0 +1,124 @@
+"""
+Tests for batched campaign email delivery.
+"""
+import pytest
+from django.core import mail
+from apps.creators.models import EmailDelivery
+from apps.creators.services.email_delivery import EmailDeliveryService
+from apps.creators.tasks import send_email_batch_task, retry_failed_emails_task
+
+
+def queue(count, campaign="test_campaign"):
+    return EmailDeliveryService.queue(campaign, [
+        {"recipient": f"creator{n}@example.com", "subject": "Hi", "message": "Hello"}
+        for n in range(count)
+    ])
+
+
+@pytest.mark.django_db
+class TestEmailDeliveryService:
+
+    def test_send_marks_deliveries_sent(self):
+        delivery_ids = queue(3)
+
+        result = EmailDeliveryService.send(delivery_ids)
+
+        assert result == {"sent": 3, "failed": 0}
+        assert len(mail.outbox) == 3
+        assert not EmailDelivery.objects.exclude(status="sent").exists()
+        assert not EmailDelivery.objects.filter(sent_at__isnull=True).exists()
+
+    def test_send_skips_already_sent(self):
+        delivery_ids = queue(2)
+        EmailDeliveryService.send(delivery_ids)
+
+        result = EmailDeliveryService.send(delivery_ids)
+
+        assert result == {"sent": 0, "failed": 0}
+        assert len(mail.outbox) == 2
+
+    def test_html_alternative_is_attached(self):
+        delivery_ids = EmailDeliveryService.queue("test_campaign", [{
+            "recipient": "creator@example.com", "subject": "Hi",
+            "message": "Hello", "html_message": "<p>Hello</p>",
+        }])
+
+        EmailDeliveryService.send(delivery_ids)
+
+        assert mail.outbox[0].alternatives[0][0] == "<p>Hello</p>"
+
+    def test_connection_failure_fails_whole_batch(self, mocker):
+        mocker.patch(
+            "django.core.mail.backends.locmem.EmailBackend.open",
+            side_effect=ConnectionError("SMTP down"))
+        delivery_ids = queue(2)
+
+        result = EmailDeliveryService.send(delivery_ids)
+
+        assert result == {"sent": 0, "failed": 2}
+        assert set(EmailDelivery.objects.values_list("error", flat=True)) == {"SMTP down"}
+
+    def test_rows_are_claimed_before_smtp(self, mocker):
+        delivery_ids = queue(2)
+        seen = []
+
+        def send_email_batch(messages):
+            seen.extend(EmailDelivery.objects.values_list("status", "attempts"))
+            return [None] * len(messages)
+
+        mocker.patch(
+            "apps.creators.services.email_delivery.send_email_batch",
+            side_effect=send_email_batch)
+
+        EmailDeliveryService.send(delivery_ids)
+
+        assert seen == [("sending", 1), ("sending", 1)]
+        assert set(EmailDelivery.objects.values_list("status", "attempts")) == {("sent", 1)}
+
+    def test_unsaved_outcome_is_not_sent_again(self, mocker):
+        delivery_ids = queue(1)
+        mocker.patch.object(
+            EmailDelivery.objects, "bulk_update", side_effect=RuntimeError("db down"))
+
+        with pytest.raises(RuntimeError):
+            EmailDeliveryService.send(delivery_ids)
+        mocker.stopall()
+
+        assert EmailDeliveryService.send(delivery_ids) == {"sent": 0, "failed": 0}
+        assert EmailDelivery.objects.get().status == "sending"
+        assert len(mail.outbox) == 1
+
+    def test_retry_failed_respects_max_attempts(self, mocker, settings):
+        settings.EMAIL_MAX_ATTEMPTS = 2
+        retryable, exhausted, other = queue(3)
+        EmailDelivery.objects.filter(id=retryable).update(status="failed", attempts=1)
+        EmailDelivery.objects.filter(id=exhausted).update(status="failed", attempts=2)
+        mock_dispatch = mocker.patch.object(EmailDeliveryService, "dispatch")
+
+        retried = EmailDeliveryService.retry_failed()
+
+        assert retried == 1
+        mock_dispatch.assert_called_once_with([retryable])
+
+
+@pytest.mark.django_db
+class TestEmailDeliveryTasks:
+
+    def test_send_email_batch_task(self):
+        delivery_ids = queue(2)
+
+        result = send_email_batch_task(delivery_ids)
+
+        assert result == "Sent 2 emails, 0 failed"
+
+    def test_retry_failed_emails_task_dispatches_batches(
+            self, mocker, django_capture_on_commit_callbacks):
+        delivery_ids = queue(2)
+        EmailDelivery.objects.update(status="failed", attempts=1)
+        mock_delay = mocker.patch("apps.creators.tasks.send_email_batch_task.delay")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = retry_failed_emails_task()
+
+        assert result == "Retrying 2 failed emails"
+        mock_delay.assert_called_once_with(delivery_ids)
@@ -2,7 +2,10 @@
 Tests for Celery tasks in the creators app.
 """
 import pytest
-from apps.creators.tasks import send_welcome_email_task
+from decimal import Decimal
+from apps.creators.tasks import (
+    send_welcome_email_task, dispatch_daily_summary_emails_task,
+    send_summary_emails_chunk_task, setup_periodic_tasks)
 from tests.factories import UserFactory
 
 
@@ -142,3 +145,64 @@ class TestWelcomeEmailTaskSignalIntegration:
         assert hasattr(user, 'creator_profile')
         # Task should have been called with the user ID
         mock_task.assert_called_once_with(user.id)
+
+
+@pytest.mark.django_db
+class TestDailySummaryDispatch:
+    """Tests for the daily summary email fan-out."""
+
+    def make_wallet(self, balance):
+        wallet = UserFactory().creator_profile.wallet
+        wallet.__class__.objects.filter(pk=wallet.pk).update(balance=Decimal(balance))
+        return wallet
+
+    def test_dispatch_chunks_wallets_with_balance(self, mocker, settings):
+        """Only funded wallets are dispatched, in chunks of the configured size."""
+        settings.SUMMARY_EMAIL_CHUNK_SIZE = 2
+        funded = sorted(
+            (self.make_wallet("10.00") for _ in range(3)), key=lambda wallet: wallet.id)
+        self.make_wallet("0.00")
+        mock_delay = mocker.patch(
+            'apps.creators.tasks.send_summary_emails_chunk_task.delay')
+
+        result = dispatch_daily_summary_emails_task()
+
+        assert '2' in result
+        chunks = [call.args[0] for call in mock_delay.call_args_list]
+        assert chunks == [[str(funded[0].id), str(funded[1].id)], [str(funded[2].id)]]
+        assert all(call.args[1] == 'daily' for call in mock_delay.call_args_list)
+
+    def test_dispatch_without_wallets(self, mocker):
+        """Nothing is enqueued when no wallet has a balance."""
+        mock_delay = mocker.patch(
+            'apps.creators.tasks.send_summary_emails_chunk_task.delay')
+
+        dispatch_daily_summary_emails_task()
+
+        mock_delay.assert_not_called()
+
+    def test_chunk_task_skips_emptied_wallets(self, mocker):
+        """Wallets emptied after dispatch get no summary."""
+        funded = self.make_wallet("10.00")
+        emptied = self.make_wallet("0.00")
+        mock_send = mocker.patch(
+            'apps.creators.tasks.send_daily_weekly_summary_emails', return_value=1)
+
+        send_summary_emails_chunk_task([funded.id, emptied.id])
+
+        wallets = mock_send.call_args.args[0]
+        assert list(wallets) == [funded]
+        assert mock_send.call_args.kwargs['period'] == 'daily'
+
+    def test_single_beat_entry_without_queries(self, mocker, django_assert_num_queries):
+        """Startup registers one dispatcher entry regardless of wallet count."""
+        self.make_wallet("10.00")
+        self.make_wallet("20.00")
+        sender = mocker.Mock()
+
+        with django_assert_num_queries(0):
+            setup_periodic_tasks(sender)
+
+        sender.add_periodic_task.assert_called_once()
+        signature = sender.add_periodic_task.call_args.args[1]
+        assert signature.task == dispatch_daily_summary_emails_task.name
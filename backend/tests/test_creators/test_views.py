@@ -423,3 +423,77 @@ class TestPublicCreatorProfile:
         assert creator_profile.user.first_name in response.content.decode()
         assert creator_profile.user.last_name in response.content.decode()
         assert "bio" in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestCreatorViewCaching:
+    """Cached public responses are invalidated per creator, not wholesale."""
+
+    def test_public_view_is_cached(self, api_client, user_factory, django_assert_num_queries):
+        slug = user_factory.creator_profile.user.slug
+        url = reverse("creators:creator_public_view", args=[slug])
+        api_client.get(url)
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+
+        assert response.status_code == 200
+
+    def test_profile_update_refreshes_public_view(self, api_client, user_factory):
+        profile = user_factory.creator_profile
+        url = reverse("creators:creator_public_view", args=[profile.user.slug])
+        api_client.get(url)
+
+        profile.bio = "Freshly updated bio"
+        profile.save()
+
+        response = api_client.get(url)
+        assert "Freshly updated bio" in response.content.decode()
+
+    def test_profile_update_keeps_other_creators_cached(
+            self, api_client, django_assert_num_queries):
+        first, second = UserFactory.create_batch(2)
+        other_url = reverse(
+            "creators:creator_public_view", args=[second.creator_profile.user.slug])
+        api_client.get(other_url)
+
+        first.creator_profile.bio = "Only this creator changed"
+        first.creator_profile.save()
+
+        with django_assert_num_queries(0):
+            response = api_client.get(other_url)
+        assert response.status_code == 200
+
+    def test_profile_update_refreshes_creator_list(self, api_client):
+        user = UserFactory()
+        profile = user.creator_profile
+        profile.verified = True
+        profile.save()
+        url = reverse("creators:creator_profiles_list")
+        api_client.get(url)
+
+        profile.bio = "Listed bio update"
+        profile.save()
+
+        response = api_client.get(url)
+        assert "Listed bio update" in response.content.decode()
+
+    def test_user_update_refreshes_public_view(self, api_client, user_factory):
+        user = user_factory.creator_profile.user
+        url = reverse("creators:creator_public_view", args=[user.slug])
+        api_client.get(url)
+
+        user.first_name = "Renamed"
+        user.save()
+
+        response = api_client.get(url)
+        assert "Renamed" in response.content.decode()
+
+    def test_deleted_profile_is_not_served_from_cache(self, api_client, user_factory):
+        profile = user_factory.creator_profile
+        url = reverse("creators:creator_public_view", args=[profile.user.slug])
+        assert api_client.get(url).status_code == 200
+
+        profile.delete()
+
+        assert api_client.get(url).status_code == 404
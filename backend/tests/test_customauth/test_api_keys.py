@@ -0,0 +1,128 @@
+"""
+Tests for cached API key resolution.
+"""
+import pytest
+from django.contrib.admin.sites import AdminSite
+from apps.customadmin.admin import APIClientAdmin
+from apps.customauth.api_keys import (
+    LocalLRUCache,
+    get_cache_key,
+    local_cache,
+    resolve_api_client,
+)
+from apps.customauth.models import APIClient
+from tests.factories import APIClientFactory
+
+
+@pytest.mark.django_db
+class TestResolveAPIClient:
+    """Test resolve_api_client."""
+
+    def test_resolves_active_client(self):
+        client = APIClientFactory(is_active=True)
+        assert resolve_api_client(client.api_key).id == client.id
+
+    def test_unknown_and_inactive_keys_resolve_to_none(self):
+        inactive = APIClientFactory(is_active=False)
+        assert resolve_api_client('sk_unknown') is None
+        assert resolve_api_client(inactive.api_key) is None
+        assert resolve_api_client('') is None
+
+    def test_repeat_lookups_hit_no_database(self, django_assert_num_queries):
+        client = APIClientFactory(is_active=True)
+        resolve_api_client(client.api_key)
+        resolve_api_client('sk_unknown')
+
+        with django_assert_num_queries(0):
+            assert resolve_api_client(client.api_key).id == client.id
+            assert resolve_api_client('sk_unknown') is None
+
+    def test_shared_cache_serves_other_processes(self, django_assert_num_queries):
+        client = APIClientFactory(is_active=True)
+        resolve_api_client(client.api_key)
+        # A fresh process starts with an empty local LRU
+        local_cache.clear()
+
+        with django_assert_num_queries(0):
+            assert resolve_api_client(client.api_key).id == client.id
+
+    def test_cache_key_does_not_contain_api_key(self):
+        client = APIClientFactory(is_active=True)
+        assert client.api_key not in get_cache_key(client.api_key)
+
+    def test_deactivation_via_save_invalidates(self):
+        client = APIClientFactory(is_active=True)
+        resolve_api_client(client.api_key)
+
+        client.is_active = False
+        client.save()
+
+        assert resolve_api_client(client.api_key) is None
+
+    def test_new_client_clears_negative_entry(self):
+        client = APIClientFactory.build(is_active=True, api_key='sk_new_key')
+        assert resolve_api_client('sk_new_key') is None
+
+        client.save()
+
+        assert resolve_api_client('sk_new_key').id == client.id
+
+    def test_regenerate_api_key_invalidates_old_key(self):
+        client = APIClientFactory(is_active=True)
+        old_key = client.api_key
+        resolve_api_client(old_key)
+
+        client.regenerate_api_key()
+
+        assert resolve_api_client(old_key) is None
+        assert resolve_api_client(client.api_key).id == client.id
+
+    def test_delete_invalidates(self):
+        client = APIClientFactory(is_active=True)
+        resolve_api_client(client.api_key)
+
+        client.delete()
+
+        assert resolve_api_client(client.api_key) is None
+
+    def test_admin_actions_invalidate(self, mocker):
+        client = APIClientFactory(is_active=True)
+        admin = APIClientAdmin(APIClient, AdminSite())
+        mocker.patch.object(admin, 'message_user')
+        resolve_api_client(client.api_key)
+
+        admin.deactivate_clients(None, APIClient.objects.filter(pk=client.pk))
+        assert resolve_api_client(client.api_key) is None
+
+        admin.activate_clients(None, APIClient.objects.filter(pk=client.pk))
+        assert resolve_api_client(client.api_key).id == client.id
+
+    def test_falls_back_to_database_when_cache_is_down(self, mocker):
+        client = APIClientFactory(is_active=True)
+        mocker.patch('apps.customauth.api_keys.cache.get', side_effect=Exception('down'))
+        mocker.patch('apps.customauth.api_keys.cache.set', side_effect=Exception('down'))
+
+        assert resolve_api_client(client.api_key).id == client.id
+
+
+class TestLocalLRUCache:
+    """Test the in-process LRU."""
+
+    def test_evicts_least_recently_used(self):
+        lru = LocalLRUCache(maxsize=2, ttl=60)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')
+        lru.set('c', 3)
+
+        assert lru.get('a') == (True, 1)
+        assert lru.get('b') == (False, None)
+        assert lru.get('c') == (True, 3)
+
+    def test_entries_expire(self, mocker):
+        mock_time = mocker.patch('apps.customauth.api_keys.time.monotonic', return_value=100)
+        lru = LocalLRUCache(maxsize=2, ttl=30)
+        lru.set('a', 1)
+
+        mock_time.return_value = 131
+        assert lru.get('a') == (False, None)
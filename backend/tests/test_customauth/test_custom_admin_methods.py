@@ -119,4 +119,53 @@ def test_override_save_preserves_case_for_display():
         password="testpassword",
         username="Test User"
     )
-    assert user.username == "Test-User"
\ No newline at end of file
+    assert user.username == "Test-User"
+
+
+def user_table_queries(captured):
+    return [q["sql"] for q in captured.captured_queries if "auth_customuser" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_save_with_unchanged_username_runs_no_username_query(django_assert_max_num_queries):
+    """Saves that don't touch the username are a single UPDATE of the user."""
+    CustomUser.objects.create_user(email="test@example.com", username="Test User")
+    user = CustomUser.objects.get(email="test@example.com")
+
+    with django_assert_max_num_queries(10) as captured:
+        user.first_name = "Renamed"
+        user.save()
+    with django_assert_max_num_queries(10) as captured_last_login:
+        user.save(update_fields=["last_login"])
+
+    assert [sql.split()[0] for sql in user_table_queries(captured)] == ["UPDATE"]
+    assert [sql.split()[0] for sql in user_table_queries(captured_last_login)] == ["UPDATE"]
+
+@pytest.mark.django_db
+def test_renaming_to_a_taken_username_appends_suffix():
+    """A rename onto another user's username (any case) gets random digits."""
+    CustomUser.objects.create_user(email="test1@example.com", username="Taken")
+    user = CustomUser.objects.create_user(email="test2@example.com", username="Free")
+
+    user.username = "TAKEN"
+    user.save()
+
+    assert user.username.startswith("TAKEN") and user.username[-4:].isdigit()
+    assert user.slug == "free"
+
+@pytest.mark.django_db
+def test_taken_slug_appends_suffix():
+    """A free username whose slug is taken also gets random digits."""
+    CustomUser.objects.create_user(email="test1@example.com", username="test user")
+    user = CustomUser.objects.create_user(email="test2@example.com", username="Test User!")
+
+    assert user.slug.startswith("test-user") and user.slug[-4:].isdigit()
+
+@pytest.mark.django_db
+def test_duplicate_email_is_not_retried():
+    """Only username and slug conflicts are retried with a suffix."""
+    from django.db import IntegrityError
+    CustomUser.objects.create_user(email="test@example.com", username="first")
+
+    with pytest.raises(IntegrityError):
+        CustomUser(email="test@example.com", username="second").save()
@@ -1,6 +1,7 @@
 """
 Tests for Firebase authentication with user_type support.
 """
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 from django.contrib.auth import get_user_model
@@ -241,3 +242,97 @@ class TestFirebaseAuthenticationUserType:
         assert hasattr(request, "firebase_user")
         assert request.firebase_user["username"] == "firebase_attach_123"
         assert hasattr(request, "firebase_picture")
+
+
+@pytest.mark.django_db
+class TestFirebaseAuthenticationCaching:
+    """Test the verified-token cache and the no-write fast path."""
+
+    def setup_method(self):
+        self.auth = FirebaseAuthentication()
+        self.factory = APIRequestFactory()
+
+    def create_mock_request(self, token="test_token"):
+        request = self.factory.get("/")
+        request.META["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+        return request
+
+    def claims(self, **overrides):
+        claims = {
+            "uid": "firebase-uid-1",
+            "name": "cached_user",
+            "email": "cached@example.com",
+            "role": "creator",
+            "exp": time.time() + 600,
+        }
+        claims.update(overrides)
+        return claims
+
+    @patch("utils.authentication.auth.verify_id_token")
+    def test_token_verified_once_until_expiry(self, mock_verify):
+        mock_verify.return_value = self.claims()
+
+        self.auth.authenticate(self.create_mock_request())
+        user, _ = self.auth.authenticate(self.create_mock_request())
+
+        assert mock_verify.call_count == 1
+        assert user.email == "cached@example.com"
+
+    @patch("utils.authentication.auth.verify_id_token")
+    def test_token_without_expiry_is_not_cached(self, mock_verify):
+        mock_verify.return_value = self.claims(exp=None)
+        mock_verify.return_value.pop("exp")
+
+        self.auth.authenticate(self.create_mock_request())
+        self.auth.authenticate(self.create_mock_request())
+
+        assert mock_verify.call_count == 2
+
+    @patch("utils.authentication.auth.verify_id_token")
+    def test_unchanged_claims_use_single_query(self, mock_verify, django_assert_num_queries):
+        mock_verify.return_value = self.claims()
+        self.auth.authenticate(self.create_mock_request())
+
+        with patch.object(User, "save") as mock_save:
+            with django_assert_num_queries(1):
+                user, _ = self.auth.authenticate(self.create_mock_request())
+
+        mock_save.assert_not_called()
+        assert user.username == "cached_user"
+
+    @patch("utils.authentication.auth.verify_id_token")
+    def test_changed_claims_are_synced(self, mock_verify):
+        mock_verify.return_value = self.claims()
+        self.auth.authenticate(self.create_mock_request("token_1"))
+
+        mock_verify.return_value = self.claims(name="renamed user", role="patron")
+        user, _ = self.auth.authenticate(self.create_mock_request("token_2"))
+
+        user.refresh_from_db()
+        assert user.username == "renamed-user"
+        assert user.user_type == "patron"
+        assert not CreatorProfile.objects.filter(user=user).exists()
+
+    @patch("utils.authentication.auth.verify_id_token")
+    def test_sync_keeps_username_unique(self, mock_verify):
+        User.objects.create_user(
+            username="taken", email="other@example.com", password="pass")
+        mock_verify.return_value = self.claims()
+        self.auth.authenticate(self.create_mock_request("token_1"))
+
+        mock_verify.return_value = self.claims(name="Taken")
+        user, _ = self.auth.authenticate(self.create_mock_request("token_2"))
+
+        assert user.username.startswith("Taken")
+        assert user.username != "Taken"
+
+    @patch("utils.authentication.auth.verify_id_token")
+    def test_user_type_change_to_creator_creates_profile(self, mock_verify):
+        mock_verify.return_value = self.claims(role="patron")
+        user, _ = self.auth.authenticate(self.create_mock_request("token_1"))
+        assert not CreatorProfile.objects.filter(user=user).exists()
+
+        mock_verify.return_value = self.claims(role="creator")
+        self.auth.authenticate(self.create_mock_request("token_2"))
+
+        assert CreatorProfile.objects.filter(user=user).exists()
@@ -0,0 +1,315 @@
+"""
+Tests for the bulk Firestore user sync and the sync_users_from_firestore
+command, run against a local fake of the Firestore stream.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from django.core.management import call_command
+from apps.creators.models import EmailDelivery
+from apps.customauth.models import CustomUser, SyncCheckpoint
+from apps.customauth.services.firestore_sync import FirestoreUserSyncService
+from apps.wallets.models import Wallet, WalletKYC, WalletPayoutAccount
+from tests.factories import UserFactory
+
+
+class FakeDocument:
+    """The parts of a Firestore DocumentSnapshot the sync reads"""
+
+    def __init__(self, doc_id, data):
+        self.id = doc_id
+        self._data = data
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeQuery:
+    """Ordered, paged queries over in-memory documents"""
+
+    def __init__(self, documents, orders=(), limit=None, position=None, streamed=None):
+        self.documents = documents
+        self.orders = list(orders)
+        self._limit = limit
+        self.position = position
+        # Start positions of the streamed pages, shared by derived queries
+        self.streamed = [] if streamed is None else streamed
+
+    def order_by(self, field):
+        return FakeQuery(self.documents, self.orders + [field], self._limit,
+                         streamed=self.streamed)
+
+    def limit(self, count):
+        return FakeQuery(self.documents, self.orders, count, streamed=self.streamed)
+
+    def start_after(self, position):
+        return FakeQuery(self.documents, self.orders, self._limit, position,
+                         streamed=self.streamed)
+
+    def key(self, document):
+        data = document.to_dict()
+        return tuple(document.id if f == "__name__" else data.get(f) for f in self.orders)
+
+    def stream(self):
+        # Documents missing an ordered field are left out, as in Firestore
+        documents = sorted(
+            (d for d in self.documents if None not in self.key(d)), key=self.key)
+        if self.position:
+            after = tuple(self.position[f] for f in self.orders)
+            documents = [d for d in documents if self.key(d) > after]
+        self.streamed.append(self.position)
+        return iter(documents[:self._limit])
+
+
+def make_documents(count, start=0):
+    return [
+        FakeDocument(f"doc{n:05d}", {
+            "email": f"Fan{n}@Example.com",
+            "username": f"fan{n}",
+            "firstName": "Fan",
+            "lastName": str(n),
+            "phoneNumber": "0970000000",
+            "updatedAt": datetime(2024, 1, 1, tzinfo=dt_timezone.utc) + timedelta(minutes=n),
+        })
+        for n in range(start, start + count)
+    ]
+
+
+@pytest.mark.django_db
+class TestFirestoreUserSyncService:
+
+    def test_creates_users_with_creator_rows(self):
+        counts = FirestoreUserSyncService.sync(make_documents(3), chunk_size=2)
+
+        assert counts["created"] == 3
+        user = CustomUser.objects.get(email="fan1@example.com")
+        assert (user.username, user.slug, user.last_name) == ("fan1", "fan1", "1")
+        assert not user.has_usable_password()
+        wallet = Wallet.objects.get(creator__user=user)
+        assert WalletKYC.objects.filter(wallet=wallet).exists()
+        assert WalletPayoutAccount.objects.filter(wallet=wallet).exists()
+        assert EmailDelivery.objects.filter(campaign="welcome").count() == 3
+
+    def test_query_count_does_not_grow_with_chunk_size(self, django_assert_max_num_queries):
+        # Constant per chunk, SQLite splits the wider inserts in two
+        with django_assert_max_num_queries(25):
+            FirestoreUserSyncService.sync(make_documents(100), chunk_size=100)
+
+        assert CustomUser.objects.count() == 100
+        assert Wallet.objects.count() == 100
+
+    def test_updates_changed_users_only(self):
+        FirestoreUserSyncService.sync(make_documents(2))
+        documents = make_documents(2)
+        documents[0]._data["firstName"] = "Renamed"
+
+        counts = FirestoreUserSyncService.sync(documents)
+
+        assert (counts["created"], counts["updated"], counts["unchanged"]) == (0, 1, 1)
+        assert CustomUser.objects.get(email="fan0@example.com").first_name == "Renamed"
+        assert Wallet.objects.count() == 2
+
+    def test_unchanged_documents_are_not_written(self, django_assert_max_num_queries):
+        FirestoreUserSyncService.sync(make_documents(3))
+
+        with django_assert_max_num_queries(10) as captured:
+            counts = FirestoreUserSyncService.sync(make_documents(3))
+
+        assert counts["unchanged"] == 3
+        user_queries = [q["sql"] for q in captured.captured_queries if "auth_customuser" in q["sql"]]
+        assert len(user_queries) == 1 and user_queries[0].startswith("SELECT")
+
+    def test_concurrent_signup_is_not_provisioned_twice(self, mocker):
+        assign_usernames = FirestoreUserSyncService.assign_usernames
+
+        def signup_meanwhile(rows, existing):
+            UserFactory(email="fan0@example.com", username="signup", slug="signup")
+            assign_usernames(rows, existing)
+
+        mocker.patch.object(
+            FirestoreUserSyncService, "assign_usernames", side_effect=signup_meanwhile)
+        welcome = EmailDelivery.objects.filter(campaign="welcome")
+        welcomed = welcome.count()
+
+        counts = FirestoreUserSyncService.sync(make_documents(2))
+
+        assert (counts["created"], counts["failed"]) == (1, 0)
+        assert welcome.count() == welcomed + 1
+        assert not welcome.filter(recipient="fan0@example.com").exists()
+        assert CustomUser.objects.get(email="fan0@example.com").username == "signup"
+
+        mocker.stopall()
+        counts = FirestoreUserSyncService.sync(make_documents(2))
+
+        assert (counts["updated"], counts["failed"]) == (1, 0)
+        assert Wallet.objects.filter(creator__user__email="fan0@example.com").count() == 1
+
+    def test_suffixed_username_is_kept_on_resync(self):
+        UserFactory(username="Fan0", slug="fan0")
+        FirestoreUserSyncService.sync(make_documents(1))
+        username = CustomUser.objects.get(email="fan0@example.com").username
+        documents = make_documents(1)
+        documents[0]._data["firstName"] = "Renamed"
+
+        FirestoreUserSyncService.sync(documents)
+
+        assert CustomUser.objects.get(email="fan0@example.com").username == username
+
+    def test_taken_username_gets_suffix(self):
+        UserFactory(username="Fan0", slug="fan0")
+
+        FirestoreUserSyncService.sync(make_documents(1))
+
+        user = CustomUser.objects.get(email="fan0@example.com")
+        assert user.username.startswith("fan0") and len(user.username) == 8
+        assert user.slug == user.username
+
+    def test_skips_documents_without_email(self):
+        documents = [FakeDocument("doc1", {"username": "nomail"})] + make_documents(1)
+
+        counts = FirestoreUserSyncService.sync(documents)
+
+        assert (counts["skipped"], counts["created"]) == (1, 1)
+
+    def test_dry_run_writes_nothing(self):
+        counts = FirestoreUserSyncService.sync(make_documents(2), dry_run=True)
+
+        assert counts["created"] == 2
+        assert not CustomUser.objects.exists()
+        assert not SyncCheckpoint.objects.exists()
+
+    def test_interrupted_sync_keeps_checkpoint(self):
+        def stream():
+            yield from make_documents(4)
+            raise ConnectionError("stream reset")
+
+        with pytest.raises(ConnectionError):
+            FirestoreUserSyncService.sync(stream(), chunk_size=2)
+
+        assert CustomUser.objects.count() == 4
+        assert FirestoreUserSyncService.get_checkpoint() == "doc00003"
+
+        FirestoreUserSyncService.sync(make_documents(2, start=4))
+        assert FirestoreUserSyncService.get_checkpoint() is None
+
+    def test_failed_first_chunk_stops_full_sync(self, mocker):
+        sync_chunk = mocker.patch.object(
+            FirestoreUserSyncService, "sync_chunk", side_effect=RuntimeError("db down"))
+
+        counts = FirestoreUserSyncService.sync(make_documents(4), chunk_size=2)
+
+        assert counts["failed"] == 2
+        assert sync_chunk.call_count == 1
+        assert not CustomUser.objects.exists()
+
+    def test_failure_after_first_chunk_keeps_checkpoint(self, mocker):
+        sync_chunk = FirestoreUserSyncService.sync_chunk
+        calls = []
+
+        def flaky(rows, dry_run=False):
+            calls.append(rows)
+            if len(calls) == 2:
+                raise RuntimeError("db down")
+            return sync_chunk(rows, dry_run=dry_run)
+
+        mocker.patch.object(FirestoreUserSyncService, "sync_chunk", side_effect=flaky)
+
+        counts = FirestoreUserSyncService.sync(make_documents(6), chunk_size=2)
+
+        assert (counts["created"], counts["failed"]) == (2, 2)
+        assert len(calls) == 2
+        assert FirestoreUserSyncService.get_checkpoint() == "doc00001"
+
+        mocker.stopall()
+        FirestoreUserSyncService.sync(make_documents(4, start=2), chunk_size=2)
+        assert CustomUser.objects.count() == 6
+        assert FirestoreUserSyncService.get_checkpoint() is None
+
+
+@pytest.mark.django_db
+class TestIncrementalFirestoreSync:
+
+    def test_pages_from_high_water_mark(self):
+        users_ref = FakeQuery(make_documents(5))
+
+        counts = FirestoreUserSyncService.sync_incremental(users_ref, page_size=2)
+
+        assert counts["created"] == 5
+        timestamp, cursor = FirestoreUserSyncService.get_high_water_mark()
+        assert (cursor, timestamp.minute) == ("doc00004", 4)
+
+        changed = make_documents(6)
+        changed[1]._data.update({"firstName": "Renamed",
+                                 "updatedAt": changed[5]._data["updatedAt"]})
+        users_ref = FakeQuery(changed)
+        counts = FirestoreUserSyncService.sync_incremental(users_ref, page_size=2)
+
+        assert (counts["created"], counts["updated"], counts["unchanged"]) == (1, 1, 0)
+        assert users_ref.streamed[0] == {"updatedAt": timestamp, "__name__": "doc00004"}
+        assert FirestoreUserSyncService.get_high_water_mark()[1] == "doc00005"
+
+    def test_failed_chunk_holds_the_mark(self, mocker):
+        sync_chunk = FirestoreUserSyncService.sync_chunk
+        mocker.patch.object(
+            FirestoreUserSyncService, "sync_chunk",
+            side_effect=[sync_chunk([]), RuntimeError("db down")])
+
+        counts = FirestoreUserSyncService.sync_incremental(
+            FakeQuery(make_documents(6)), page_size=2)
+
+        assert counts["failed"] == 2
+        assert FirestoreUserSyncService.get_high_water_mark()[1] == "doc00001"
+
+
+@pytest.mark.django_db
+class TestSyncFirestoreUsersTask:
+
+    def test_runs_incremental_sync(self, mocker):
+        from apps.customauth.tasks import sync_firestore_users_task
+        client = mocker.patch("apps.customauth.tasks.firestore.client")
+        client.return_value.collection.return_value = FakeQuery(make_documents(2))
+
+        result = sync_firestore_users_task.run()
+
+        assert result.startswith("Synced Firestore users: 2 created")
+
+    def test_skips_while_a_run_holds_the_lock(self, mocker):
+        from django.core.cache import cache
+        from apps.customauth.tasks import SYNC_LOCK_KEY, sync_firestore_users_task
+        sync = mocker.patch.object(FirestoreUserSyncService, "sync_incremental")
+        cache.add(SYNC_LOCK_KEY, 1)
+
+        try:
+            assert sync_firestore_users_task.run() == "Firestore sync already running"
+        finally:
+            cache.delete(SYNC_LOCK_KEY)
+        sync.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestSyncUsersFromFirestoreCommand:
+
+    @pytest.fixture
+    def users_query(self, mocker):
+        client = mocker.patch(
+            "apps.customauth.management.commands.sync_users_from_firestore.firestore.client")
+        query = client.return_value.collection.return_value.order_by.return_value
+        query.start_after.return_value = query
+        query.stream.return_value = iter(make_documents(3))
+        return query
+
+    def test_syncs_streamed_users(self, users_query):
+        out = StringIO()
+        call_command("sync_users_from_firestore", stdout=out)
+
+        assert CustomUser.objects.count() == 3
+        assert "Created: 3" in out.getvalue()
+        users_query.start_after.assert_not_called()
+
+    def test_resume_starts_after_checkpoint(self, users_query):
+        SyncCheckpoint.objects.create(
+            name=FirestoreUserSyncService.CHECKPOINT, cursor="doc00042")
+
+        call_command("sync_users_from_firestore", "--resume", stdout=StringIO())
+
+        users_query.start_after.assert_called_once_with({"__name__": "doc00042"})
@@ -41,3 +41,15 @@ class TestCheckFinalStatus:
         assert WebHook.objects.filter(
             payment=payment, event_type='deposit.completed').exists()
         mock_resend.assert_not_called()
+
+    def test_check_final_status_log_is_not_queued(self, payment_factory):
+        payment = payment_factory
+        payment.status = 'completed'
+        payment.save()
+
+        check_final_status(payment)
+
+        from apps.payments.models import PaymentWebhookLog as WebHook
+        log = WebHook.objects.get(payment=payment)
+        assert log.status == 'processed'
+        assert log.processed_at is not None
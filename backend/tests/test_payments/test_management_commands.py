@@ -0,0 +1,59 @@
+"""
+Tests for payment management commands.
+"""
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from django.core.management.base import CommandError
+from apps.payments.management.commands.benchmark_payment_indexes import PARTIAL_INDEXES
+from apps.payments.models import Payment, PaymentDailyStats
+from tests.factories import PaymentFactory
+
+
+@pytest.mark.django_db
+class TestBenchmarkPaymentIndexesCommand:
+
+    def test_benchmarks_the_partial_indexes(self):
+        assert PARTIAL_INDEXES == [
+            "payment_non_final_created_idx",
+            "payment_non_final_wallet_idx",
+            "payment_failed_created_idx",
+            "payment_live_wallet_idx",
+        ]
+
+    def test_requires_postgresql(self):
+        with pytest.raises(CommandError, match="PostgreSQL"):
+            call_command("benchmark_payment_indexes", rows=10)
+
+
+@pytest.mark.django_db
+class TestRollupPaymentStatsCommand:
+
+    def test_rolls_up_every_day_since_the_first_payment(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        old = PaymentFactory(wallet=wallet, status="completed", amount=Decimal("10.00"))
+        PaymentFactory(wallet=wallet, status="failed", amount=Decimal("5.00"))
+        Payment.objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=400))
+        Payment.objects.exclude(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=1))
+        out = StringIO()
+
+        call_command('rollup_payment_stats', stdout=out)
+
+        assert 'rows written: 2' in out.getvalue()
+        assert PaymentDailyStats.objects.get(status="completed").date == (
+            timezone.localdate() - timedelta(days=400))
+
+    def test_days_limits_the_backfill(self, user_factory):
+        payment = PaymentFactory(
+            wallet=user_factory.creator_profile.wallet, status="completed")
+        Payment.objects.filter(pk=payment.pk).update(
+            created_at=timezone.now() - timedelta(days=10))
+
+        call_command('rollup_payment_stats', '--days', '3', stdout=StringIO())
+
+        assert not PaymentDailyStats.objects.exists()
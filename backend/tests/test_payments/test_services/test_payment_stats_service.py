@@ -0,0 +1,133 @@
+from datetime import timedelta
+from decimal import Decimal
+import pytest
+from django.utils import timezone
+from apps.payments.models import Payment, PaymentDailyStats
+from apps.payments.services.payment_stats_service import PaymentDailyStatsService
+from tests.factories import PaymentFactory
+from utils.daily_rollup import get_day_start
+
+
+def make_payment(wallet, status, amount, days_ago=0, **fields):
+    payment = PaymentFactory(
+        wallet=wallet, status=status, amount=Decimal(amount),
+        provider_fee=Decimal("1.00"), **fields)
+    if days_ago:
+        Payment.objects.filter(pk=payment.pk).update(
+            created_at=timezone.now() - timedelta(days=days_ago))
+    return payment
+
+
+@pytest.fixture
+def payments(user_factory):
+    wallet = user_factory.creator_profile.wallet
+    make_payment(wallet, "completed", "100.00", days_ago=3)
+    make_payment(wallet, "captured", "50.00", days_ago=2, amount_captured=Decimal("50.00"))
+    make_payment(wallet, "failed", "30.00", days_ago=2)
+    make_payment(wallet, "refunded", "20.00", days_ago=1,
+                 amount_captured=Decimal("20.00"), amount_refunded=Decimal("20.00"))
+    make_payment(wallet, "completed", "10.00")
+    return wallet
+
+
+@pytest.mark.django_db
+class TestPaymentStats:
+
+    def test_payment_stats_in_one_query(self, payments, django_assert_num_queries):
+        now = timezone.now()
+
+        with django_assert_num_queries(1):
+            stats = Payment.objects.get_payment_stats(now - timedelta(days=7), now)
+
+        assert stats["total_payments"] == 5
+        assert stats["successful_payments"] == 3
+        assert stats["failed_payments"] == 1
+        assert stats["refunded_payments"] == 1
+        assert stats["success_rate"] == 60
+        assert stats["total_amount"] == Decimal("210.00")
+        assert stats["captured_amount"] == Decimal("50.00")
+        assert stats["refunded_amount"] == Decimal("20.00")
+        assert stats["net_amount"] == Decimal("30.00")
+
+    def test_pending_payments_are_non_final_oldest_first(self, payments):
+        newer = make_payment(payments, "processing", "5.00", days_ago=1)
+        older = make_payment(payments, "pending", "5.00", days_ago=2)
+        make_payment(payments, "expired", "5.00", days_ago=3)
+
+        assert list(Payment.objects.get_pending_payments()) == [older, newer]
+
+    def test_payment_stats_respects_range(self, payments):
+        now = timezone.now()
+
+        stats = Payment.objects.get_payment_stats(now - timedelta(hours=1), now)
+
+        assert stats["total_payments"] == 1
+        assert stats["total_amount"] == Decimal("10.00")
+
+    def test_revenue_by_currency(self, payments):
+        now = timezone.now()
+
+        revenue = Payment.objects.get_revenue_by_currency(now - timedelta(days=7), now)
+
+        assert revenue == [{
+            "currency": "ZMW",
+            "total_amount": Decimal("160.00"),
+            "total_fees": Decimal("3.00"),
+            "net_revenue": Decimal("157.00"),
+        }]
+
+    def test_closed_days_come_from_rollup(
+            self, payments, settings, django_assert_num_queries):
+        now = timezone.now()
+        start = get_day_start(timezone.localdate(now) - timedelta(days=7))
+        expected_stats = Payment.objects.get_payment_stats(start, now)
+        expected_revenue = Payment.objects.get_revenue_by_currency(start, now)
+        PaymentDailyStatsService.rollup_days(7)
+        settings.DASHBOARD_USE_DAILY_STATS = True
+        # Rows of closed days are no longer read from the payments table
+        Payment.objects.filter(created_at__lt=get_day_start(timezone.localdate(now))).update(
+            amount=Decimal("999.00"), provider_fee=Decimal("999.00"))
+
+        with django_assert_num_queries(2):
+            stats = Payment.objects.get_payment_stats(start, now)
+        revenue = Payment.objects.get_revenue_by_currency(start, now)
+
+        assert stats == expected_stats
+        assert revenue == expected_revenue
+
+    def test_partial_days_are_read_live(self, payments, settings):
+        settings.DASHBOARD_USE_DAILY_STATS = True
+        now = timezone.now()
+
+        # No rollup rows exist, so every figure must come from the live slice
+        stats = Payment.objects.get_payment_stats(now - timedelta(hours=1), now)
+
+        assert stats["total_payments"] == 1
+
+
+@pytest.mark.django_db
+class TestPaymentDailyStatsService:
+
+    def test_rollup_groups_by_currency_and_status(self, payments):
+        day = timezone.localdate(timezone.now() - timedelta(days=2))
+
+        assert PaymentDailyStatsService.rollup(day) == 2
+
+        captured = PaymentDailyStats.objects.get(date=day, status="captured")
+        assert captured.count == 1
+        assert captured.amount_total == Decimal("50.00")
+        assert captured.amount_captured_total == Decimal("50.00")
+        assert captured.provider_fee_total == Decimal("1.00")
+
+    def test_rollup_recent_includes_changed_days(self, payments):
+        old = make_payment(payments, "pending", "40.00", days_ago=10)
+        PaymentDailyStatsService.rollup_days(14)
+        old.refresh_from_db()
+        old.status = "completed"
+        old.save()
+
+        PaymentDailyStatsService.rollup_recent()
+
+        old_day = timezone.localdate(timezone.now() - timedelta(days=10))
+        assert list(PaymentDailyStats.objects.filter(date=old_day).values_list(
+            "status", flat=True)) == ["completed"]
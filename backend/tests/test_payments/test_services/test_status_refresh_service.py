@@ -0,0 +1,85 @@
+import pytest
+from decimal import Decimal
+from apps.payments.services.status_refresh_service import PaymentStatusRefreshService
+from apps.wallets.models import WalletTransaction
+from tests.factories import PaymentFactory
+
+PAWAPAY = "apps.payments.services.status_refresh_service.pawapay_request"
+
+
+def provider_status(status):
+    return ({"data": {"depositId": "test_id", "status": status}}, 200)
+
+
+@pytest.mark.django_db
+class TestPaymentStatusRefreshService:
+
+    def test_refresh_updates_multiple_pending_payments(self, wallet_factory, mocker):
+        mock_pawapay = mocker.patch(PAWAPAY, return_value=provider_status("COMPLETED"))
+        payments = PaymentFactory.create_batch(
+            3, wallet=wallet_factory, status="pending", amount=Decimal("100.00"))
+
+        updated = PaymentStatusRefreshService.refresh_wallet(wallet_factory)
+
+        assert updated == 3
+        assert mock_pawapay.call_count == 3
+        for payment in payments:
+            payment.refresh_from_db()
+            assert payment.status == "completed"
+        wallet_factory.refresh_from_db()
+        assert wallet_factory.balance == Decimal("270.00")
+
+    def test_only_non_final_payments_are_checked(self, wallet_factory, mocker):
+        mock_pawapay = mocker.patch(PAWAPAY, return_value=provider_status("FAILED"))
+        pending = PaymentFactory(wallet=wallet_factory, status="pending")
+        for status in ["completed", "failed", "rejected"]:
+            PaymentFactory(wallet=wallet_factory, status=status)
+
+        PaymentStatusRefreshService.refresh_wallet(wallet_factory)
+
+        mock_pawapay.assert_called_once_with("GET", f"/v2/deposits/{pending.id}")
+        pending.refresh_from_db()
+        assert pending.status == "failed"
+
+    def test_recently_checked_payments_are_skipped(self, wallet_factory, mocker):
+        mock_pawapay = mocker.patch(PAWAPAY, return_value=provider_status("PENDING"))
+        payment = PaymentFactory(wallet=wallet_factory, status="pending")
+
+        PaymentStatusRefreshService.refresh_wallet(wallet_factory)
+        PaymentStatusRefreshService.refresh_wallet(wallet_factory)
+
+        assert mock_pawapay.call_count == 1
+        assert PaymentStatusRefreshService.last_checked(payment.id) is not None
+
+    def test_in_flight_payment_is_not_claimed_twice(self, wallet_factory):
+        PaymentFactory(wallet=wallet_factory, status="pending")
+
+        first = PaymentStatusRefreshService.claim_payments(wallet_factory)
+        second = PaymentStatusRefreshService.claim_payments(wallet_factory)
+
+        assert len(first) == 1
+        assert second == []
+
+    def test_non_final_provider_status_keeps_payment(self, wallet_factory, mocker):
+        mocker.patch(PAWAPAY, return_value=provider_status("PROCESSING"))
+        payment = PaymentFactory(wallet=wallet_factory, status="accepted")
+
+        assert PaymentStatusRefreshService.refresh_wallet(wallet_factory) == 0
+        payment.refresh_from_db()
+        assert payment.status == "accepted"
+
+    def test_provider_error_leaves_payment_untouched(self, wallet_factory, mocker):
+        mocker.patch(PAWAPAY, return_value=({"status": "EXTERNAL_ERROR"}, 500))
+        payment = PaymentFactory(wallet=wallet_factory, status="pending")
+
+        assert PaymentStatusRefreshService.refresh_wallet(wallet_factory) == 0
+        payment.refresh_from_db()
+        assert payment.status == "pending"
+
+    def test_payment_finalised_meanwhile_is_not_overwritten(self, wallet_factory):
+        payment = PaymentFactory(wallet=wallet_factory, status="failed")
+
+        assert not PaymentStatusRefreshService.apply_status(payment.id, "completed")
+        payment.refresh_from_db()
+        assert payment.status == "failed"
+        assert not WalletTransaction.objects.filter(payment=payment).exists()
@@ -0,0 +1,158 @@
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from django.utils import timezone
+from apps.payments.models import PaymentWebhookLog as WebHook
+from apps.payments.services.status_refresh_service import PaymentStatusRefreshService
+from apps.payments.services.webhook_service import WebhookService
+from apps.wallets.models import WalletTransaction
+
+
+def record_event(payment, status="completed", external_id="EXT-EVENT", **kwargs):
+    return WebHook.objects.create(
+        raw_payload="{}",
+        parsed_payload={"status": status.upper()},
+        event_type=f"deposit.{status}",
+        payment=payment,
+        provider=payment.provider,
+        external_id=external_id,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestWebhookService:
+
+    def test_process_received_applies_events(self, payment_factory):
+        event = record_event(payment_factory)
+
+        assert WebhookService.process_received() == 1
+
+        event.refresh_from_db()
+        assert event.status == "processed"
+        assert event.processed_at is not None
+        assert event.processing_time_ms >= 0
+        payment_factory.refresh_from_db()
+        assert payment_factory.status == "completed"
+        payment_factory.wallet.refresh_from_db()
+        assert payment_factory.wallet.balance == Decimal("90.00")
+
+    def test_process_received_respects_batch_size(self, payment_factory):
+        for i in range(3):
+            record_event(payment_factory, status="pending", external_id=f"EXT-{i}")
+
+        assert WebhookService.process_received(batch_size=2) == 2
+        assert WebHook.objects.filter(status="received").count() == 1
+        assert WebhookService.process_received(batch_size=2) == 1
+        assert WebhookService.process_received(batch_size=2) == 0
+
+    def test_failed_event_does_not_block_batch(self, payment_factory, mocker):
+        bad = record_event(payment_factory, external_id="EXT-BAD")
+        good = record_event(payment_factory, status="failed", external_id="EXT-GOOD")
+        original = WebhookService.apply_event
+
+        def apply_event(webhook_log):
+            if webhook_log.pk == bad.pk:
+                raise Exception("boom")
+            return original(webhook_log)
+
+        mocker.patch.object(WebhookService, "apply_event", side_effect=apply_event)
+
+        WebhookService.process_received()
+
+        bad.refresh_from_db()
+        good.refresh_from_db()
+        assert bad.status == "failed"
+        assert bad.error_message == "boom"
+        assert bad.processed_at is not None
+        assert good.status == "processed"
+
+    def test_event_without_payment_is_ignored(self, payment_factory):
+        event = record_event(payment_factory)
+        WebHook.objects.filter(pk=event.pk).update(payment=None)
+
+        WebhookService.process_received()
+
+        event.refresh_from_db()
+        assert event.status == "ignored"
+
+    def test_non_final_status_keeps_payment_status(self, payment_factory):
+        payment_factory.status = "accepted"
+        payment_factory.save()
+        record_event(payment_factory, status="pending")
+
+        WebhookService.process_received()
+
+        payment_factory.refresh_from_db()
+        assert payment_factory.status == "accepted"
+        assert not WalletTransaction.objects.exists()
+
+    def test_stale_processing_events_are_reclaimed(self, payment_factory):
+        stale = record_event(payment_factory, external_id="EXT-STALE")
+        fresh = record_event(payment_factory, external_id="EXT-FRESH")
+        WebHook.objects.filter(pk=stale.pk).update(
+            status="processing",
+            updated_at=timezone.now() - WebhookService.STALE_AFTER - timedelta(minutes=1),
+        )
+        WebHook.objects.filter(pk=fresh.pk).update(status="processing")
+
+        ids = WebhookService.claim_batch()
+
+        assert ids == [stale.pk]
+
+    def test_processed_events_are_not_reclaimed(self, payment_factory):
+        event = record_event(payment_factory)
+        WebHook.objects.filter(pk=event.pk).update(
+            status="processed",
+            updated_at=timezone.now() - timedelta(days=1),
+        )
+        assert WebhookService.claim_batch() == []
+
+    def test_failed_events_are_retried_until_attempts_run_out(self, payment_factory):
+        event = record_event(payment_factory)
+        retry_at = timezone.now() - WebhookService.RETRY_AFTER - timedelta(minutes=1)
+        WebHook.objects.filter(pk=event.pk).update(
+            status="failed", attempts=1, updated_at=retry_at)
+
+        assert WebhookService.claim_batch() == [event.pk]
+        event.refresh_from_db()
+        assert event.attempts == 2
+
+        WebHook.objects.filter(pk=event.pk).update(
+            status="failed", attempts=WebhookService.MAX_ATTEMPTS, updated_at=retry_at)
+        assert WebhookService.claim_batch() == []
+
+    def test_recently_failed_events_wait_before_retry(self, payment_factory):
+        event = record_event(payment_factory)
+        WebHook.objects.filter(pk=event.pk).update(status="failed", attempts=1)
+
+        assert WebhookService.claim_batch() == []
+
+
+@pytest.mark.django_db
+class TestWebhookCashIn:
+
+    def cash_ins(self, payment):
+        return WalletTransaction.objects.filter(payment=payment, transaction_type="CASH_IN")
+
+    def test_callbacks_with_different_provider_ids_credit_once(self, payment_factory):
+        record_event(payment_factory, external_id="EXT-1")
+        record_event(payment_factory, external_id="EXT-2")
+
+        WebhookService.process_received()
+
+        assert self.cash_ins(payment_factory).count() == 1
+        payment_factory.wallet.refresh_from_db()
+        assert payment_factory.wallet.balance == Decimal("90.00")
+
+    def test_callback_after_status_refresh_credits_once(self, payment_factory):
+        payment_factory.status = "accepted"
+        payment_factory.save()
+        PaymentStatusRefreshService.apply_status(payment_factory.id, "completed")
+        event = record_event(payment_factory)
+
+        WebhookService.process_received()
+
+        event.refresh_from_db()
+        assert event.status == "processed"
+        assert self.cash_ins(payment_factory).get().reference == payment_factory.reference
@@ -3,6 +3,9 @@ from celery.exceptions import Retry
 from apps.payments.tasks import (
     resend_deposit_callback,
     resend_pending_deposits,
+    process_webhook_events_task,
+    refresh_wallet_payment_statuses_task,
+    rollup_payment_daily_stats_task,
 )
 from tests.factories import PaymentFactory
 @pytest.mark.django_db
@@ -62,4 +65,67 @@ class TestResendPendingDepositsBatchTask:
     def test_resend_pending_deposits_no_pending(self, mocker):
         mock_delay = mocker.patch("apps.payments.tasks.resend_deposit_callback.delay")
         resend_pending_deposits.run()
-        mock_delay.assert_not_called()
\ No newline at end of file
+        mock_delay.assert_not_called()
+
+@pytest.mark.django_db
+class TestProcessWebhookEventsTask:
+
+    def test_process_webhook_events(self, mocker):
+        mock_process = mocker.patch(
+            "apps.payments.tasks.WebhookService.process_received", return_value=3)
+        mock_delay = mocker.patch("apps.payments.tasks.process_webhook_events_task.delay")
+
+        result = process_webhook_events_task.run(batch_size=10)
+
+        assert result == "Processed 3 webhook events"
+        mock_process.assert_called_once_with(batch_size=10)
+        mock_delay.assert_not_called()
+
+    def test_process_webhook_events_requeues_full_batch(self, mocker):
+        mocker.patch(
+            "apps.payments.tasks.WebhookService.process_received", return_value=10)
+        mock_delay = mocker.patch("apps.payments.tasks.process_webhook_events_task.delay")
+
+        process_webhook_events_task.run(batch_size=10)
+
+        mock_delay.assert_called_once_with(10)
+
+
+@pytest.mark.django_db
+class TestRefreshWalletPaymentStatusesTask:
+
+    def test_refresh_wallet_payment_statuses(self, wallet_factory, mocker):
+        mock_refresh = mocker.patch(
+            "apps.payments.tasks.PaymentStatusRefreshService.refresh_wallet",
+            return_value=2)
+
+        result = refresh_wallet_payment_statuses_task.run(wallet_factory.id)
+
+        assert result == f"Updated 2 payments for wallet {wallet_factory.id}"
+        mock_refresh.assert_called_once_with(wallet_factory)
+
+    def test_refresh_missing_wallet(self, mocker):
+        mock_refresh = mocker.patch(
+            "apps.payments.tasks.PaymentStatusRefreshService.refresh_wallet")
+
+        result = refresh_wallet_payment_statuses_task.run(99999)
+
+        assert "not found" in result
+        mock_refresh.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestRollupPaymentDailyStatsTask:
+
+    def test_rolls_up_yesterday(self, payment_factory):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.payments.models import Payment, PaymentDailyStats
+
+        Payment.objects.filter(pk=payment_factory.pk).update(
+            created_at=timezone.now() - timedelta(days=1))
+
+        result = rollup_payment_daily_stats_task.run()
+
+        assert result == "Rolled up payment stats for 1 days"
+        assert PaymentDailyStats.objects.get().count == 1
@@ -2,14 +2,22 @@ import json
 import pytest
 import uuid
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from decimal import Decimal
-from apps.payments.models import PaymentWebhookLog
+from apps.payments.models import Payment, PaymentWebhookLog
+from apps.payments.tasks import process_webhook_events_task
 from apps.wallets.models import WalletTransaction
+from tests.factories import PaymentFactory
 
 User = get_user_model()
 
 
+def drain_webhooks():
+    """Run the webhook consumer the way the worker would after the ack"""
+    return process_webhook_events_task()
+
+
 @pytest.mark.django_db
 class TestPaymentStatusAPIView:
     def test_get_payment_status_completed(
@@ -70,6 +78,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response.status_code == 200
+        drain_webhooks()
         wallet.refresh_from_db()
         assert WalletTransaction.objects.filter(
             wallet=wallet, transaction_type="CASH_IN"
@@ -165,6 +174,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response.status_code == 200
+        drain_webhooks()
 
         payment_factory.refresh_from_db()
         assert payment_factory.status == "failed"
@@ -210,6 +220,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response1.status_code == 200
+        drain_webhooks()
 
         payment_factory.refresh_from_db()
         assert payment_factory.status == "completed"
@@ -252,6 +263,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response.status_code == 200
+        drain_webhooks()
 
         wallet.refresh_from_db()
         assert wallet.balance == Decimal("0.00")
@@ -356,6 +368,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response.status_code == 200
+        drain_webhooks()
 
         payment_factory.refresh_from_db()
         assert (
@@ -376,6 +389,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response.status_code == 200
+        drain_webhooks()
 
         payment_factory.refresh_from_db()
         assert payment_factory.status == "completed"
@@ -404,6 +418,7 @@ class TestPaymentWebhookView:
             content_type="application/json",
         )
         assert response.status_code == 200
+        drain_webhooks()
 
         wallet.refresh_from_db()
         fee = FeeService.calculate_cash_in_fee(payment_factory.amount)
@@ -434,3 +449,238 @@ class TestPaymentWebhookView:
         assert "Payment to creator #123" in webhook.parsed_payload.get(
             "customerMessage", ""
         )
+
+    def test_webhook_records_event_without_applying_it(
+        self, api_client, payment_factory
+    ):
+        """The endpoint only stores the callback, the consumer applies it"""
+        wallet = payment_factory.wallet
+        payload = {
+            "depositId": str(payment_factory.id),
+            "status": "COMPLETED",
+            "providerTransactionId": "QUEUED-TXN",
+        }
+
+        response = api_client.post(
+            reverse("payments:webhook"),
+            payload,
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+
+        webhook = PaymentWebhookLog.objects.get(external_id="QUEUED-TXN")
+        assert webhook.status == "received"
+        assert webhook.processed_at is None
+        payment_factory.refresh_from_db()
+        assert payment_factory.status == "pending"
+        assert not WalletTransaction.objects.filter(wallet=wallet).exists()
+
+        drain_webhooks()
+
+        webhook.refresh_from_db()
+        assert webhook.status == "processed"
+        assert webhook.processed_at is not None
+        assert webhook.processing_time_ms is not None
+        payment_factory.refresh_from_db()
+        assert payment_factory.status == "completed"
+
+    def test_webhook_enqueues_consumer_on_commit(
+        self, api_client, payment_factory, mocker, django_capture_on_commit_callbacks
+    ):
+        mock_delay = mocker.patch(
+            "apps.payments.webhooks.process_webhook_events_task.delay"
+        )
+        payload = {
+            "depositId": str(payment_factory.id),
+            "status": "COMPLETED",
+            "providerTransactionId": "ENQUEUE-TXN",
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("payments:webhook"),
+                payload,
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        mock_delay.assert_called_once_with()
+
+    def test_webhook_acknowledges_when_enqueue_fails(
+        self, api_client, payment_factory, mocker, django_capture_on_commit_callbacks
+    ):
+        """A broker outage must not lose the callback, it stays received"""
+        mocker.patch(
+            "apps.payments.webhooks.process_webhook_events_task.delay",
+            side_effect=Exception("broker down"),
+        )
+        payload = {
+            "depositId": str(payment_factory.id),
+            "status": "COMPLETED",
+            "providerTransactionId": "NO-BROKER-TXN",
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                reverse("payments:webhook"),
+                payload,
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        assert PaymentWebhookLog.objects.get(
+            external_id="NO-BROKER-TXN"
+        ).status == "received"
+
+    def test_webhook_resolves_payment_by_reference(self, api_client, payment_factory):
+        payload = {
+            "depositId": payment_factory.reference,
+            "status": "COMPLETED",
+            "providerTransactionId": "REF-TXN",
+        }
+
+        response = api_client.post(
+            reverse("payments:webhook"),
+            payload,
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        assert PaymentWebhookLog.objects.get(
+            external_id="REF-TXN"
+        ).payment == payment_factory
+
+    def test_webhook_unknown_reference_returns_404(self, api_client):
+        payload = {
+            "depositId": "NOT-A-UUID-REFERENCE",
+            "status": "COMPLETED",
+            "providerTransactionId": "UNKNOWN-REF",
+        }
+
+        response = api_client.post(
+            reverse("payments:webhook"),
+            payload,
+            content_type="application/json",
+        )
+
+        assert response.status_code == 404
+        assert not PaymentWebhookLog.objects.exists()
+
+    @pytest.mark.parametrize("by", ["id", "reference"])
+    def test_webhook_resolves_payment_in_one_lookup(
+        self, api_client, payment_factory, django_assert_max_num_queries, by
+    ):
+        payload = {
+            "depositId": str(getattr(payment_factory, by)),
+            "status": "COMPLETED",
+            "providerTransactionId": f"ONE-LOOKUP-{by}",
+        }
+
+        with django_assert_max_num_queries(10) as captured:
+            response = api_client.post(
+                reverse("payments:webhook"),
+                payload,
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        lookups = [
+            q["sql"] for q in captured.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "payments_payment"' in q["sql"]
+        ]
+        assert len(lookups) == 1
+
+
+    def test_status_change_with_same_transaction_id_is_recorded(
+        self, api_client, payment_factory
+    ):
+        for res_status in ("ACCEPTED", "COMPLETED"):
+            response = api_client.post(
+                reverse("payments:webhook"),
+                {
+                    "depositId": str(payment_factory.id),
+                    "status": res_status,
+                    "providerTransactionId": "SAME-TXN",
+                },
+                content_type="application/json",
+            )
+            assert response.json()["message"] == "Callback received"
+
+        assert PaymentWebhookLog.objects.filter(external_id="SAME-TXN").count() == 2
+
+    def test_webhook_storage_errors_are_not_masked(
+        self, api_client, payment_factory, mocker
+    ):
+        mocker.patch.object(
+            PaymentWebhookLog.objects, "record", side_effect=RuntimeError("db down")
+        )
+
+        with pytest.raises(RuntimeError):
+            api_client.post(
+                reverse("payments:webhook"),
+                {
+                    "depositId": str(payment_factory.id),
+                    "status": "COMPLETED",
+                    "providerTransactionId": "ERR-TXN",
+                },
+                content_type="application/json",
+            )
+
+
+@pytest.mark.django_db
+class TestPaymentWebhookLogRecord:
+
+    def record(self, payment, **fields):
+        return PaymentWebhookLog.objects.record(
+            raw_payload="{}",
+            event_type="deposit.completed",
+            payment=payment,
+            provider=payment.provider,
+            **fields,
+        )
+
+    def test_duplicate_is_absorbed_in_one_statement(
+        self, payment_factory, django_assert_num_queries
+    ):
+        log, created = self.record(payment_factory, external_id="TXN-1")
+        assert created
+        assert PaymentWebhookLog.objects.get(external_id="TXN-1") == log
+
+        with django_assert_num_queries(1):
+            _, created = self.record(payment_factory, external_id="TXN-1")
+
+        assert not created
+        assert PaymentWebhookLog.objects.filter(external_id="TXN-1").count() == 1
+
+    def test_events_without_external_id_are_always_recorded(self, payment_factory):
+        assert self.record(payment_factory, external_id="")[1]
+        assert self.record(payment_factory, external_id="")[1]
+
+        assert PaymentWebhookLog.objects.filter(external_id="").count() == 2
+
+    def test_unique_event_key(self, payment_factory):
+        self.record(payment_factory, external_id="TXN-2")
+
+        with pytest.raises(IntegrityError), transaction.atomic():
+            PaymentWebhookLog.objects.create(
+                raw_payload="{}",
+                event_type="deposit.completed",
+                payment=payment_factory,
+                provider=payment_factory.provider,
+                external_id="TXN-2",
+            )
+
+
+@pytest.mark.django_db
+class TestPaymentReference:
+
+    def test_generated_references_are_time_ordered(self):
+        references = [Payment.generate_reference() for _ in range(100)]
+
+        assert references == sorted(references)
+        assert len(set(references)) == 100
+        assert all(r.startswith("PAY-") and len(r) == 30 for r in references)
+
+    def test_reference_is_unique(self, payment_factory):
+        with pytest.raises(IntegrityError), transaction.atomic():
+            PaymentFactory(reference=payment_factory.reference)
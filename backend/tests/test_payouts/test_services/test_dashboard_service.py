@@ -0,0 +1,91 @@
+from datetime import timedelta
+from decimal import Decimal
+import pytest
+from django.utils import timezone
+from apps.payouts.services.dashboard_service import DashboardStatsService
+from apps.wallets.models import LedgerDailyStats
+from tests.factories import PaymentFactory, WalletTransactionFactory
+
+
+@pytest.mark.django_db
+class TestDashboardStatsService:
+
+    def make_payouts(self, wallet):
+        for status, amount in [("PENDING", "-10.00"), ("PENDING", "-5.00"),
+                               ("COMPLETED", "-20.00"), ("FAILED", "-7.00")]:
+            WalletTransactionFactory(
+                wallet=wallet, transaction_type="PAYOUT", status=status,
+                amount=Decimal(amount))
+
+    def test_payout_summary_in_one_query(self, user_factory, django_assert_num_queries):
+        self.make_payouts(user_factory.creator_profile.wallet)
+
+        with django_assert_num_queries(1):
+            summary = DashboardStatsService.get_payout_summary()
+
+        assert summary["pending_count"] == 2
+        assert summary["pending_total"] == Decimal("-15.00")
+        assert summary["completed_count"] == 1
+        assert summary["failed_total"] == Decimal("-7.00")
+        assert summary["total_count"] == 4
+        assert summary["total_payouts"] == Decimal("-42.00")
+        assert summary["recent_payouts_count"] == 4
+
+    def test_payout_summary_is_cached(self, user_factory, django_assert_num_queries):
+        wallet = user_factory.creator_profile.wallet
+        DashboardStatsService.get_payout_summary()
+        self.make_payouts(wallet)
+
+        with django_assert_num_queries(0):
+            summary = DashboardStatsService.get_payout_summary()
+
+        assert summary["total_count"] == 0
+
+    def test_platform_stats_one_query_per_table(
+            self, user_factory, django_assert_num_queries):
+        wallet = user_factory.creator_profile.wallet
+        WalletTransactionFactory(
+            wallet=wallet, transaction_type="CASH_IN", status="COMPLETED",
+            amount=Decimal("100.00"))
+        WalletTransactionFactory(
+            wallet=wallet, transaction_type="FEE", status="COMPLETED",
+            amount=Decimal("-3.00"))
+        PaymentFactory(wallet=wallet, status="completed", amount=Decimal("100.00"))
+        PaymentFactory(wallet=wallet, status="failed", amount=Decimal("40.00"))
+
+        with django_assert_num_queries(4):
+            stats = DashboardStatsService.get_platform_stats()
+
+        assert stats["total_creators"] == 1
+        assert stats["total_wallets"] == 1
+        assert stats["cash_in_count"] == 1
+        assert stats["cash_in_total"] == Decimal("100.00")
+        assert stats["total_fees"] == Decimal("3.00")
+        assert stats["total_payments"] == 2
+        assert stats["successful_payments"] == 1
+        assert stats["total_payment_amount"] == Decimal("100.00")
+        assert stats["total_failed_amount"] == Decimal("40.00")
+        assert stats["total_pending_amount"] == 0
+
+    def test_closed_days_come_from_rollup(self, user_factory, settings):
+        settings.DASHBOARD_USE_DAILY_STATS = True
+        wallet = user_factory.creator_profile.wallet
+        yesterday = timezone.localdate() - timedelta(days=1)
+        # Live rows before today are ignored in favour of the rollup
+        old = WalletTransactionFactory(
+            wallet=wallet, transaction_type="PAYOUT", status="COMPLETED",
+            amount=Decimal("-999.00"))
+        type(old).objects.filter(pk=old.pk).update(
+            created_at=timezone.now() - timedelta(days=2))
+        LedgerDailyStats.objects.create(
+            date=yesterday, transaction_type="PAYOUT", status="COMPLETED",
+            count=3, amount_total=Decimal("-30.00"), abs_amount_total=Decimal("30.00"))
+        WalletTransactionFactory(
+            wallet=wallet, transaction_type="PAYOUT", status="COMPLETED",
+            amount=Decimal("-5.00"))
+
+        summary = DashboardStatsService.get_payout_summary()
+
+        assert summary["completed_count"] == 4
+        assert summary["completed_total"] == Decimal("-35.00")
+        assert summary["recent_payouts_count"] == 4
@@ -0,0 +1,230 @@
+from decimal import Decimal
+from io import StringIO
+import pytest
+from django.core.management import call_command
+from apps.payouts.services.disbursement_service import (
+    LimopayDisbursementClient, PayoutDisbursementService)
+from apps.wallets.services.wallet_services import\
+    WalletTransactionService as WalletTxnService
+from tests.factories import UserFactory
+from utils.exceptions import DisbursementError
+from utils.gateway_client import GatewayUnavailable
+
+
+class FakeDisbursementClient:
+    """Records submitted batches and answers with preset outcomes"""
+
+    def __init__(self, outcomes=None, failing_providers=(), unsent_providers=()):
+        self.outcomes = outcomes or {}
+        self.failing_providers = failing_providers
+        self.unsent_providers = unsent_providers
+        self.batches = []
+
+    def submit(self, provider, items):
+        if provider in self.unsent_providers:
+            raise GatewayUnavailable("circuit open")
+        self.batches.append((provider, [item["reference"] for item in items]))
+        if provider in self.failing_providers:
+            raise DisbursementError("gateway down")
+        return {item["reference"]: self.outcomes.get(item["reference"], True)
+                for item in items}
+
+    def lookup(self, reference):
+        return self.outcomes.get(reference, True)
+
+
+def make_pending_payout(provider="MTN_MOMO_ZMB", amount="100.00"):
+    wallet = UserFactory().creator_profile.wallet
+    account = wallet.payout_account
+    account.provider = provider
+    account.phone_number = "0971234567"
+    account.account_name = "Test Creator"
+    account.save()
+    WalletTxnService.cash_in(
+        wallet=wallet, amount=Decimal(amount), payment=None,
+        reference=f"CASHIN-DISBURSE-{wallet.id}")
+    wallet.refresh_from_db()
+    return WalletTxnService.payout(
+        wallet=wallet, amount=wallet.balance, correlation_id=f"PAYOUT-{wallet.id}")
+
+
+@pytest.mark.django_db
+class TestPayoutDisbursementService:
+
+    def test_payouts_are_grouped_by_provider(self, admin_user):
+        mtn = [make_pending_payout("MTN_MOMO_ZMB") for _ in range(3)]
+        airtel = make_pending_payout("AIRTEL_OAPI_ZMB")
+        client = FakeDisbursementClient()
+
+        result = PayoutDisbursementService.disburse(
+            approved_by=admin_user, client=client, batch_size=2)
+
+        assert result["batches"] == 3
+        assert result["completed"] == 4
+        submitted = {}
+        for provider, refs in client.batches:
+            assert len(refs) <= 2
+            submitted.setdefault(provider, set()).update(refs)
+        assert submitted == {
+            "MTN_MOMO_ZMB": {tx.reference for tx in mtn},
+            "AIRTEL_OAPI_ZMB": {airtel.reference},
+        }
+
+    def test_outcomes_are_finalized(self, admin_user):
+        paid = make_pending_payout()
+        rejected = make_pending_payout()
+        processing = make_pending_payout()
+        client = FakeDisbursementClient(outcomes={
+            rejected.reference: False, processing.reference: None})
+
+        result = PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        for payout_tx in (paid, rejected, processing):
+            payout_tx.refresh_from_db()
+        assert (paid.status, rejected.status, processing.status) == (
+            "COMPLETED", "FAILED", "PENDING")
+        assert paid.approved_by == admin_user
+        assert paid.wallet.__class__.objects.get(pk=paid.wallet_id).balance == Decimal("0.00")
+        assert (result["completed"], result["failed"], result["pending"]) == (1, 1, 1)
+
+    def test_rejected_batch_stays_submitted(self, admin_user):
+        failing = make_pending_payout("AIRTEL_OAPI_ZMB")
+        paid = make_pending_payout("MTN_MOMO_ZMB")
+        client = FakeDisbursementClient(failing_providers=("AIRTEL_OAPI_ZMB",))
+
+        result = PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+        PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        failing.refresh_from_db()
+        paid.refresh_from_db()
+        assert (failing.status, failing.disbursement_status) == ("PENDING", "SUBMITTED")
+        assert paid.status == "COMPLETED"
+        assert result["errored"] == 1
+        assert len(client.batches) == 2
+
+    def test_unsent_batch_is_released(self, admin_user):
+        payout_tx = make_pending_payout("AIRTEL_OAPI_ZMB")
+        client = FakeDisbursementClient(unsent_providers=("AIRTEL_OAPI_ZMB",))
+
+        result = PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        payout_tx.refresh_from_db()
+        assert result["unsent"] == 1
+        assert (payout_tx.disbursement_status, payout_tx.submitted_at) == ("UNSENT", None)
+
+    def test_payouts_without_account_are_skipped(self, admin_user):
+        payout_tx = make_pending_payout()
+        payout_tx.wallet.payout_account.__class__.objects.filter(
+            wallet_id=payout_tx.wallet_id).update(phone_number="")
+        client = FakeDisbursementClient()
+
+        result = PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        assert result["no_account"] == 1
+        assert client.batches == []
+
+        payout_tx.refresh_from_db()
+        assert (payout_tx.disbursement_status, payout_tx.submitted_at) == ("UNSENT", None)
+
+    def test_claimed_payouts_are_not_sent_twice(self, admin_user):
+        payout_tx = make_pending_payout()
+        client = FakeDisbursementClient(outcomes={payout_tx.reference: None})
+
+        PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+        PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        assert client.batches == [("MTN_MOMO_ZMB", [payout_tx.reference])]
+
+    def test_submitted_payouts_are_reconciled_from_the_gateway(self, admin_user):
+        paid = make_pending_payout()
+        processing = make_pending_payout()
+        client = FakeDisbursementClient(outcomes={
+            paid.reference: None, processing.reference: None})
+        PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        client.outcomes[paid.reference] = True
+        result = PayoutDisbursementService.reconcile(approved_by=admin_user, client=client)
+
+        paid.refresh_from_db()
+        processing.refresh_from_db()
+        assert (paid.status, processing.status) == ("COMPLETED", "PENDING")
+        assert (result["completed"], result["pending"]) == (1, 1)
+        assert len(client.batches) == 1
+
+    def test_released_payouts_are_sent_again(self, admin_user):
+        payout_tx = make_pending_payout()
+        client = FakeDisbursementClient(failing_providers=("MTN_MOMO_ZMB",))
+        PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        call_command("release_payouts", payout_tx.reference, stdout=StringIO())
+        client.failing_providers = ()
+        result = PayoutDisbursementService.disburse(approved_by=admin_user, client=client)
+
+        assert result["completed"] == 1
+        assert len(client.batches) == 2
+
+    def test_failed_finalize_keeps_other_batches(self, admin_user, mocker):
+        broken = make_pending_payout("AIRTEL_OAPI_ZMB")
+        paid = make_pending_payout("MTN_MOMO_ZMB")
+        finalize_batch = PayoutDisbursementService.finalize_batch
+
+        def finalize(payouts, outcomes, approved_by):
+            if payouts[0].pk == broken.pk:
+                raise RuntimeError("db down")
+            return finalize_batch(payouts, outcomes, approved_by)
+
+        mocker.patch.object(
+            PayoutDisbursementService, "finalize_batch", side_effect=finalize)
+
+        result = PayoutDisbursementService.disburse(
+            approved_by=admin_user, client=FakeDisbursementClient())
+
+        paid.refresh_from_db()
+        broken.refresh_from_db()
+        assert paid.status == "COMPLETED"
+        assert (result["completed"], result["unrecorded"]) == (1, 1)
+        assert (broken.status, broken.disbursement_status) == ("PENDING", "SUBMITTED")
+
+
+class TestLimopayDisbursementClient:
+
+    def test_maps_gateway_statuses(self, mocker):
+        mocker.patch(
+            "apps.payouts.services.disbursement_service.limopay_request",
+            return_value=({"results": [
+                {"reference": "A", "status": "SUCCESS"},
+                {"reference": "B", "status": "FAILED"},
+                {"reference": "C", "status": "PROCESSING"},
+            ]}, 200),
+        )
+
+        outcomes = LimopayDisbursementClient().submit("MTN_MOMO_ZMB", [])
+
+        assert outcomes == {"A": True, "B": False, "C": None}
+
+    def test_raises_on_gateway_error(self, mocker):
+        mocker.patch(
+            "apps.payouts.services.disbursement_service.limopay_request",
+            return_value=({"status": "EXTERNAL_ERROR"}, 500),
+        )
+
+        with pytest.raises(DisbursementError):
+            LimopayDisbursementClient().submit("MTN_MOMO_ZMB", [])
+
+    def test_lookup_maps_gateway_status(self, mocker):
+        request = mocker.patch(
+            "apps.payouts.services.disbursement_service.limopay_request",
+            return_value=({"reference": "A", "status": "SUCCESS"}, 200),
+        )
+
+        assert LimopayDisbursementClient().lookup("A") is True
+        request.assert_called_once_with("GET", "/api/v1/disbursements/A/")
+
+    def test_circuit_open_means_not_sent(self, mocker):
+        mocker.patch(
+            "apps.payouts.services.disbursement_service.limopay_request",
+            return_value=({"status": "GATEWAY_UNAVAILABLE"}, 503),
+        )
+
+        with pytest.raises(GatewayUnavailable):
+            LimopayDisbursementClient().submit("MTN_MOMO_ZMB", [])
@@ -1,4 +1,7 @@
-from apps.payouts.tasks import auto_payout_wallets
+from apps.payouts.models import PayoutBatch
+from apps.payouts.services.payout_batch_service import PayoutBatchService
+from apps.payouts.tasks import (
+    auto_payout_wallets, fail_payout_batch_task, process_payout_chunk_task)
 from apps.wallets.models import Wallet
 from apps.wallets.services.wallet_services import WalletTransactionService as WalletTxnService
 import pytest
@@ -6,6 +9,16 @@ from decimal import Decimal
 from tests.factories import UserFactory
 
 
+@pytest.fixture(autouse=True)
+def celery_eager():
+    """Run the payout chunk chord inline"""
+    from config.celery import app
+    always_eager = app.conf.task_always_eager
+    app.conf.task_always_eager = True
+    yield
+    app.conf.task_always_eager = always_eager
+
+
 @pytest.mark.django_db
 class TestPayoutTasks:
 
@@ -69,8 +82,14 @@ class TestPayoutTasks:
             correlation_id="TEST-PAYOUT-PENDING",
         )
 
-        with pytest.raises(Exception, match="A payout is already pending for this wallet"):
-            auto_payout_wallets()
+        batch = PayoutBatch.objects.get(pk=auto_payout_wallets())
+
+        # The failure is recorded on the batch instead of aborting the run
+        assert batch.failed == 1
+        assert batch.errors == [{
+            "wallet_id": str(wallet.id),
+            "error": "A payout is already pending for this wallet",
+        }]
 
 
     def test_auto_payout_multiple_wallets(self, admin_user):
@@ -160,4 +179,111 @@ class TestPayoutTasks:
         assert payout_tx_with_balance.amount == Decimal("-90.00")
 
         payout_tx_without_balance = wallet_without_balance.transactions.filter(transaction_type="PAYOUT").first()
-        assert payout_tx_without_balance is None
\ No newline at end of file
+        assert payout_tx_without_balance is None
+
+
+@pytest.mark.django_db
+class TestPayoutBatch:
+
+    def fund_wallet(self, wallet, amount="100.00"):
+        wallet.is_verified = True
+        wallet.save()
+        WalletTxnService.cash_in(
+            wallet=wallet,
+            amount=Decimal(amount),
+            payment=None,
+            reference=f"CASHIN-BATCH-{wallet.id}",
+        )
+
+    def test_batch_records_counts_and_totals(self, admin_user, settings):
+        settings.PAYOUT_BATCH_CHUNK_SIZE = 2
+        UserFactory.create_batch(3)
+        for wallet in Wallet.objects.all():
+            self.fund_wallet(wallet)
+
+        batch = PayoutBatch.objects.get(pk=auto_payout_wallets())
+
+        assert batch.status == "completed"
+        assert batch.wallet_count == 3
+        assert batch.chunk_count == 2
+        assert batch.chunks_done == 2
+        assert batch.succeeded == 3
+        assert batch.failed == 0
+        assert batch.total_amount == Decimal("270.00")
+        assert batch.duration is not None
+
+    def test_failing_wallet_does_not_abort_batch(self, admin_user):
+        blocked, paid = [UserFactory().creator_profile.wallet for _ in range(2)]
+        self.fund_wallet(blocked)
+        self.fund_wallet(paid)
+        WalletTxnService.payout(
+            wallet=blocked,
+            amount=Decimal("10.00"),
+            correlation_id="TEST-BATCH-PENDING",
+        )
+
+        batch = PayoutBatch.objects.get(pk=auto_payout_wallets())
+
+        assert batch.succeeded == 1
+        assert batch.failed == 1
+        assert batch.errors[0]["wallet_id"] == str(blocked.id)
+        assert paid.transactions.filter(
+            transaction_type="PAYOUT", status="PENDING").count() == 1
+
+    def test_unexpected_wallet_error_is_recorded(self, admin_user, mocker):
+        broken, paid = [UserFactory().creator_profile.wallet for _ in range(2)]
+        self.fund_wallet(broken)
+        self.fund_wallet(paid)
+        payout_wallet = PayoutBatchService.payout_wallet
+
+        def payout(wallet_id, initiated_by):
+            if wallet_id == str(broken.id):
+                raise RuntimeError("db down")
+            return payout_wallet(wallet_id, initiated_by)
+
+        mocker.patch.object(PayoutBatchService, "payout_wallet", side_effect=payout)
+
+        batch = PayoutBatch.objects.get(pk=auto_payout_wallets())
+
+        assert batch.status == "completed"
+        assert (batch.succeeded, batch.failed) == (1, 1)
+        assert batch.errors == [{"wallet_id": str(broken.id), "error": "db down"}]
+
+    def test_chord_failure_is_linked_to_fail_task(self, admin_user, mocker):
+        self.fund_wallet(UserFactory().creator_profile.wallet)
+        chord = mocker.patch("apps.payouts.tasks.chord")
+
+        batch_id = auto_payout_wallets()
+
+        errback = chord.return_value.link_error.call_args.args[0]
+        assert errback.task == fail_payout_batch_task.name
+        assert errback.args == (batch_id,)
+        chord.return_value.delay.assert_called_once_with()
+
+    def test_fail_task_closes_batch_as_failed(self):
+        batch = PayoutBatch.objects.create(wallet_count=2, chunk_count=2)
+
+        fail_payout_batch_task.run(None, RuntimeError("worker lost"), None, batch.id)
+
+        batch.refresh_from_db()
+        assert batch.status == "failed"
+        assert batch.finished_at is not None
+
+    def test_chunk_skips_wallets_no_longer_eligible(self, admin_user, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        self.fund_wallet(wallet)
+        batch = PayoutBatch.objects.create(wallet_count=1, chunk_count=1)
+        Wallet.objects.filter(pk=wallet.pk).update(is_verified=False)
+
+        result = process_payout_chunk_task(batch.id, [str(wallet.id)], admin_user.id)
+
+        assert result["skipped"] == 1
+        batch.refresh_from_db()
+        assert batch.skipped == 1
+        assert not wallet.transactions.filter(transaction_type="PAYOUT").exists()
+
+    def test_empty_run_is_completed(self, admin_user):
+        batch = PayoutBatch.objects.get(pk=auto_payout_wallets())
+
+        assert batch.status == "completed"
+        assert batch.wallet_count == 0
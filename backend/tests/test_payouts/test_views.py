@@ -414,3 +414,77 @@ class TestFinaliseWalletPayout:
 
         with pytest.raises(InvalidTransaction, match="Only pending payouts can be finalized"):
             PayoutOrchestrator.finalize(payout_tx=payout_tx, success=True)
+
+
+@pytest.mark.django_db
+class TestDisbursePendingPayouts:
+    """Tests for disburse_pending_payouts view"""
+
+    def test_requires_superuser(self, mocker):
+        """Test that staff users cannot start a disbursement"""
+        client = Client()
+        user = UserFactory(is_staff=True, is_superuser=False)
+        mock_task = mocker.patch(
+            "apps.payouts.tasks.disburse_pending_payouts_task.delay")
+
+        client.force_login(user)
+        response = client.post(reverse("payouts:disburse_pending_payouts"))
+
+        assert response.status_code == 302
+        mock_task.assert_not_called()
+
+    def test_get_not_allowed(self):
+        """Test that the disbursement can only be started with POST"""
+        client = Client()
+        user = UserFactory(is_staff=True, is_superuser=True)
+
+        client.force_login(user)
+        response = client.get(reverse("payouts:disburse_pending_payouts"))
+
+        assert response.status_code == 405
+
+    def test_post_enqueues_disbursement(self, mocker, django_capture_on_commit_callbacks):
+        """Test that POST starts the background disbursement"""
+        client = Client()
+        user = UserFactory(is_staff=True, is_superuser=True)
+        mock_task = mocker.patch(
+            "apps.payouts.tasks.disburse_pending_payouts_task.delay")
+
+        client.force_login(user)
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.post(reverse("payouts:disburse_pending_payouts"))
+
+        assert response.status_code == 302
+        assert response.url == reverse("payouts:payout_summary")
+        mock_task.assert_called_once_with(user.id)
+
+
+@pytest.mark.django_db
+class TestDashboards:
+    """Tests for the payout_summary and stats views"""
+
+    def test_payout_summary_renders(self):
+        """Test that the payout summary shows the aggregated figures"""
+        client = Client()
+        user = UserFactory(is_staff=True, is_superuser=True)
+        WalletTransactionFactory(
+            wallet=user.creator_profile.wallet, transaction_type="PAYOUT",
+            status="PENDING", amount=Decimal("-25.00"))
+
+        client.force_login(user)
+        response = client.get(reverse("payouts:payout_summary"))
+
+        assert response.status_code == 200
+        assert response.context["pending_count"] == 1
+        assert len(response.context["pending_payouts"]) == 1
+
+    def test_stats_renders(self):
+        """Test that the stats page shows the platform figures"""
+        client = Client()
+        user = UserFactory(is_staff=True, is_superuser=True)
+
+        client.force_login(user)
+        response = client.get(reverse("payouts:stats"))
+
+        assert response.status_code == 200
+        assert response.context["total_creators"] == 1
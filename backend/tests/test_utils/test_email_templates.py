@@ -0,0 +1,69 @@
+"""
+Tests for the email body templates rendered by utils/send_emails.py
+"""
+import pytest
+from utils import send_emails
+from utils.send_emails import render_email, render_emails
+
+
+class TestRenderEmails:
+    """Tests for render_email and render_emails."""
+
+    def test_batch_looks_up_templates_once(self, mocker):
+        spy = mocker.spy(send_emails, 'get_template')
+
+        rendered = render_emails("welcome", [{"name": f"creator{n}"} for n in range(5)])
+
+        assert spy.call_count == 2
+        assert len(rendered) == 5
+        assert "Hello creator3," in rendered[3][0]
+        assert "Hello creator3," in rendered[3][1]
+
+    def test_text_only_render(self):
+        message, html_message = render_email("share_creator_link", {"name": "Bob"}, html=False)
+
+        assert html_message is None
+        assert message == (
+            "Hello Bob,\n"
+            "We noticed that you've received some tips, but you haven't shared your\n"
+            "creator link yet. Sharing your link is the best way to get more support\n"
+            "from your audience!\n"
+            "Here's how to share your creator link:\n"
+            "1. Log into your creator dashboard\n"
+            "2. Copy your unique creator link\n"
+            "3. Share it on your social media, website, or with your fans\n"
+            "The more you share, the more tips you can receive! If you need any help,\n"
+            "feel free to reach out to our support team.\n"
+            "Best regards,\n"
+            "The TipZed Team\n\n"
+        )
+
+    def test_html_escapes_user_content_text_does_not(self):
+        context = {
+            "patron_name": "O'Brien",
+            "creator_name": "Creator",
+            "reference": "REF1",
+            "amount": "10.00",
+            "currency": "ZMW",
+            "status_display": "Completed",
+            "status_color": "#4CAF50",
+            "created_at_display": "January 01, 2026 at 10:00 AM",
+            "patron_message": "<script>alert(1)</script>",
+        }
+
+        message, html_message = render_email("transaction_receipt", context)
+
+        assert "Hello O'Brien," in message
+        assert "<script>alert(1)</script>" in message
+        assert "<script>" not in html_message
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html_message
+
+    @pytest.mark.parametrize("template_name", [
+        "missing_payout_account", "transaction_receipt", "earnings_summary", "welcome",
+        "early_adopter_welcome", "complete_profile_reminder",
+    ])
+    def test_templates_render_without_context(self, template_name):
+        message, html_message = render_email(template_name, {})
+
+        assert message.strip()
+        assert html_message.strip().startswith("<html>")
@@ -1,4 +1,14 @@
-from utils.external_requests import pawapay_request, requests
+import pytest
+from utils.external_requests import pawapay_request, limopay_request, requests
+from utils.gateway_client import gateway
+
+
+@pytest.fixture(autouse=True)
+def reset_gateway_breaker():
+    gateway.breaker.reset()
+    yield
+    gateway.breaker.reset()
+
 
 class TestPawapayRequest:
     # ---------------------------------------------------------
@@ -8,12 +18,12 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"status": "OK"}
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         data, status = pawapay_request("GET", "/deposit/")
         assert status == 200
         assert data == {"status": "OK"}
-        requests.request.assert_called_once()
+        requests.Session.request.assert_called_once()
 
     # ---------------------------------------------------------
     # Test successful non-JSON response (text fallback)
@@ -24,7 +34,7 @@ class TestPawapayRequest:
         mock_response.json.side_effect = ValueError("not json")
         mock_response.text = "raw-response"
         mock_response.status_code = 200
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         data, status = pawapay_request("GET", "/deposit/")
 
@@ -39,7 +49,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.side_effect = Exception("Network down")
         
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         payload = {"amount": 100}
         data, status = pawapay_request("POST", "/deposit/", payload=payload)
@@ -57,7 +67,7 @@ class TestPawapayRequest:
         mock_response.status_code = 201
         
         payload = {"amount": 100}
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mock_request = mocker.patch(patch_path, return_value=mock_response)
         pawapay_request("POST", "/deposits/", headers=None, payload=payload)
 
@@ -67,7 +77,7 @@ class TestPawapayRequest:
         assert call_args[0] == ("POST", "https://sandbox.lipila.tech/deposits/")
         assert "Authorization" in call_args[1]["headers"]
         assert call_args[1]["json"] == payload
-        assert call_args[1]["timeout"] == 10
+        assert call_args[1]["timeout"] == (3.05, 10)
 
     # ---------------------------------------------------------
     # Test non-200 status response with JSON
@@ -77,7 +87,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"error": "bad request"}
         mock_response.status_code = 400
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         data, status = pawapay_request("GET", "/deposit/")
 
@@ -91,14 +101,14 @@ class TestPawapayRequest:
     def test_post_without_payload_raises_error(self, mocker):
         """POST requests without payload should raise AttributeError"""
         mock_response = mocker.Mock()
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         data, status = pawapay_request("POST", "/deposit/", payload=None)
 
         assert status == 400
         assert data is not None
         # Should not call requests.request since it fails before that
-        requests.request.assert_not_called()
+        requests.Session.request.assert_not_called()
 
     # ---------------------------------------------------------
     # Test GET request with payload (allowed)
@@ -109,7 +119,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"data": "retrieved"}
         mock_response.status_code = 200
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
 
         payload = {"filter": "active"}
@@ -117,7 +127,7 @@ class TestPawapayRequest:
 
         assert status == 200
         assert data == {"data": "retrieved"}
-        requests.request.assert_called_once()
+        requests.Session.request.assert_called_once()
 
     # ---------------------------------------------------------
     # Test requests.RequestException (network errors)
@@ -131,7 +141,7 @@ class TestPawapayRequest:
         mock_response.json.side_effect = requests.exceptions.ConnectionError(
             "Connection refused"
         )
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         data, status = pawapay_request("GET", "/deposit/")
         assert status == 500
@@ -148,7 +158,7 @@ class TestPawapayRequest:
 
         mock_response.json.side_effect = requests.exceptions.Timeout(
             "Request timed out")
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
         data, status = pawapay_request("GET", "/deposit/")
 
@@ -164,7 +174,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"error": "Internal Server Error"}
         mock_response.status_code = 500
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
 
         data, status = pawapay_request("GET", "/deposit/")
@@ -181,7 +191,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"error": "Unauthorized"}
         mock_response.status_code = 401
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
 
         data, status = pawapay_request("GET", "/deposit/")
@@ -198,7 +208,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"error": "Not Found"}
         mock_response.status_code = 404
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
 
         data, status = pawapay_request("GET", "/deposit/")
@@ -216,7 +226,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {}
         mock_response.status_code = 200
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mock_request = mocker.patch(patch_path, return_value=mock_response)
 
         pawapay_request("GET", "/deposit/")
@@ -231,15 +241,15 @@ class TestPawapayRequest:
         assert "Bearer" in  headers["Authorization"]
 
     # ---------------------------------------------------------
-    # Test timeout parameter is always 10
+    # Test connect/read timeouts are always set
     # ---------------------------------------------------------
     
-    def test_timeout_always_10(self, mocker):
-        """Verify timeout is always set to 10 seconds"""
+    def test_timeout_always_set(self, mocker):
+        """Verify split connect/read timeouts are always set"""
         mock_response = mocker.Mock()
         mock_response.json.return_value = {}
         mock_response.status_code = 200
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mock_request = mocker.patch(patch_path, return_value=mock_response)
 
         for method in ["GET", "POST", "PUT", "DELETE"]:
@@ -248,7 +258,7 @@ class TestPawapayRequest:
             pawapay_request(method, "/deposit/", payload=payload)
 
             call_kwargs = mock_request.call_args[1]
-            assert call_kwargs["timeout"] == 10
+            assert call_kwargs["timeout"] == (3.05, 10)
 
     # ---------------------------------------------------------
     # Test empty JSON response
@@ -259,7 +269,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {}
         mock_response.status_code = 200
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mocker.patch(patch_path, return_value=mock_response)
 
         data, status = pawapay_request("GET", "/deposit/")
@@ -276,7 +286,7 @@ class TestPawapayRequest:
         mock_response = mocker.Mock()
         mock_response.json.return_value = {"success": True}
         mock_response.status_code = 201
-        patch_path = "utils.external_requests.requests.request"
+        patch_path = "utils.gateway_client.requests.Session.request"
         mock_request = mocker.patch(patch_path, return_value=mock_response)
 
         # Create a large payload with multiple nested fields
@@ -290,3 +300,20 @@ class TestPawapayRequest:
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["json"] == large_payload
         assert data is not None
+
+    # ---------------------------------------------------------
+    # Test open circuit fails fast
+    # ---------------------------------------------------------
+
+    def test_open_circuit_returns_503(self, mocker):
+        """Calls are not sent while the gateway circuit is open"""
+        patch_path = "utils.gateway_client.requests.Session.request"
+        mock_request = mocker.patch(patch_path)
+        gateway.breaker.state = gateway.breaker.OPEN
+        gateway.breaker.opened_at = float("inf")
+
+        data, status = limopay_request("GET", "/payments/REF/")
+
+        assert status == 503
+        assert data == {"status": "GATEWAY_UNAVAILABLE"}
+        mock_request.assert_not_called()
@@ -0,0 +1,161 @@
+import pytest
+import requests
+from utils.gateway_client import CircuitBreaker, GatewayClient, GatewayUnavailable
+
+SESSION_REQUEST = "utils.gateway_client.requests.Session.request"
+
+
+def make_response(mocker, status_code):
+    response = mocker.Mock()
+    response.status_code = status_code
+    return response
+
+
+@pytest.fixture
+def client(mocker):
+    mocker.patch("utils.gateway_client.time.sleep")
+    return GatewayClient(
+        pool_size=4, connect_timeout=1, read_timeout=5, max_retries=2,
+        backoff=0.1, failure_threshold=3, reset_timeout=30,
+    )
+
+
+class TestGatewayClient:
+
+    def test_session_is_reused(self, client):
+        assert client.session is client.session
+
+    def test_session_uses_configured_pool(self, client):
+        adapter = client.session.get_adapter("https://sandbox.lipila.tech/")
+        assert adapter._pool_maxsize == 4
+
+    def test_session_rebuilt_after_fork(self, client, mocker):
+        session = client.session
+        mocker.patch("utils.gateway_client.os.getpid", return_value=-1)
+        assert client.session is not session
+
+    def test_split_timeouts_passed(self, client, mocker):
+        mock_request = mocker.patch(SESSION_REQUEST, return_value=make_response(mocker, 200))
+
+        client.request("GET", "https://gateway/x")
+
+        assert mock_request.call_args[1]["timeout"] == (1, 5)
+
+    def test_get_retried_on_connection_error(self, client, mocker):
+        ok = make_response(mocker, 200)
+        mock_request = mocker.patch(
+            SESSION_REQUEST,
+            side_effect=[requests.exceptions.ConnectionError("down"), ok],
+        )
+
+        assert client.request("GET", "https://gateway/x") is ok
+        assert mock_request.call_count == 2
+
+    def test_get_retried_on_gateway_error_status(self, client, mocker):
+        mock_request = mocker.patch(
+            SESSION_REQUEST,
+            side_effect=[make_response(mocker, 503), make_response(mocker, 200)],
+        )
+
+        assert client.request("GET", "https://gateway/x").status_code == 200
+        assert mock_request.call_count == 2
+
+    def test_get_gives_up_after_max_retries(self, client, mocker):
+        mock_request = mocker.patch(
+            SESSION_REQUEST, side_effect=requests.exceptions.Timeout("slow"))
+
+        with pytest.raises(requests.exceptions.Timeout):
+            client.request("GET", "https://gateway/x")
+        assert mock_request.call_count == 3
+
+    def test_post_is_not_retried(self, client, mocker):
+        mock_request = mocker.patch(
+            SESSION_REQUEST, side_effect=requests.exceptions.ConnectionError("down"))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.request("POST", "https://gateway/x", json={})
+        assert mock_request.call_count == 1
+
+    def test_backoff_is_jittered_and_bounded(self, client):
+        delays = [client.backoff_delay(2) for _ in range(50)]
+        assert all(0 <= d <= 0.4 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_circuit_opens_and_fails_fast(self, client, mocker):
+        mock_request = mocker.patch(SESSION_REQUEST, return_value=make_response(mocker, 500))
+
+        for _ in range(3):
+            client.request("POST", "https://gateway/x", json={})
+        with pytest.raises(GatewayUnavailable):
+            client.request("POST", "https://gateway/x", json={})
+        assert mock_request.call_count == 3
+
+    def test_client_errors_do_not_open_circuit(self, client, mocker):
+        mocker.patch(SESSION_REQUEST, return_value=make_response(mocker, 404))
+
+        for _ in range(5):
+            client.request("GET", "https://gateway/x")
+        assert client.breaker.state == CircuitBreaker.CLOSED
+
+    def test_other_request_errors_are_not_retried(self, client, mocker):
+        mock_request = mocker.patch(
+            SESSION_REQUEST, side_effect=requests.exceptions.TooManyRedirects("loop"))
+
+        with pytest.raises(requests.exceptions.TooManyRedirects):
+            client.request("GET", "https://gateway/x")
+        assert mock_request.call_count == 1
+        assert client.breaker.failures == 1
+
+    def test_failed_trial_call_reopens_circuit(self, client, mocker):
+        mock_time = mocker.patch("utils.gateway_client.time.monotonic", return_value=100)
+        client.breaker.state = CircuitBreaker.OPEN
+        client.breaker.opened_at = 60
+        mocker.patch(
+            SESSION_REQUEST, side_effect=requests.exceptions.InvalidHeader("bad"))
+
+        with pytest.raises(requests.exceptions.InvalidHeader):
+            client.request("POST", "https://gateway/x", json={})
+
+        assert client.breaker.state == CircuitBreaker.OPEN
+        mock_time.return_value = 131
+        assert client.breaker.allow_request()
+
+
+class TestCircuitBreaker:
+
+    def test_half_open_after_reset_timeout(self, mocker):
+        mock_time = mocker.patch("utils.gateway_client.time.monotonic", return_value=100)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        mock_time.return_value = 131
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        # Only one trial call is let through
+        assert not breaker.allow_request()
+
+    def test_trial_success_closes_circuit(self, mocker):
+        mock_time = mocker.patch("utils.gateway_client.time.monotonic", return_value=100)
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        mock_time.return_value = 131
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    def test_trial_failure_reopens_circuit(self, mocker):
+        mock_time = mocker.patch("utils.gateway_client.time.monotonic", return_value=100)
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        for _ in range(3):
+            breaker.record_failure()
+        mock_time.return_value = 131
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
@@ -7,12 +7,18 @@ from datetime import timedelta
 from decimal import Decimal
 
 from django.conf import settings
+from django.core import mail
+from django.core.mail import get_connection
+from django.core.mail.backends import locmem
 from utils.send_emails import (
     send_missing_payout_account_email,
     send_transaction_receipt_email,
     send_daily_weekly_summary_email,
+    send_daily_weekly_summary_emails,
     send_welcome_email,
     send_reminder_to_share_creator_link_email,
+    welcome_early_adopter_email,
+    send_reminder_to_complete_profile,
 )
 from tests.factories import (
     UserFactory,
@@ -766,29 +772,99 @@ class TestSendWelcomeEmail:
         assert from_email == settings.DEFAULT_FROM_EMAIL
 
 
+@pytest.mark.django_db
+class TestSendDailyWeeklySummaryEmails:
+    """Tests for the bulk send_daily_weekly_summary_emails function."""
+
+    @pytest.fixture
+    def send_summaries(self, mocker, django_capture_on_commit_callbacks):
+        """Queue the summaries and run the dispatched batch tasks inline."""
+        from apps.creators.services.email_delivery import EmailDeliveryService
+        mocker.patch(
+            'apps.creators.tasks.send_email_batch_task.delay',
+            side_effect=EmailDeliveryService.send,
+        )
+
+        def _send(wallets, period='daily'):
+            with django_capture_on_commit_callbacks(execute=True):
+                return send_daily_weekly_summary_emails(wallets, period=period)
+        return _send
+
+    def test_sends_one_summary_per_wallet(self, send_summaries, user_factory):
+        """Each creator gets their own figures."""
+        wallet = user_factory.creator_profile.wallet
+        other = UserFactory().creator_profile.wallet
+        WalletTransactionFactory(
+            wallet=wallet, transaction_type='CASH_IN', status='COMPLETED',
+            amount=Decimal('120.00'), fee=Decimal('6.00'),
+        )
+        wallets = wallet.__class__.objects.filter(id__in=[wallet.id, other.id])
+
+        queued = send_summaries(wallets, period='weekly')
+
+        assert queued == 2
+        by_recipient = {message.to[0]: message for message in mail.outbox}
+        assert set(by_recipient) == {wallet.creator.user.email, other.creator.user.email}
+        assert '120.00' in by_recipient[wallet.creator.user.email].body
+        assert '120.00' not in by_recipient[other.creator.user.email].body
+        assert 'This Week' in by_recipient[other.creator.user.email].subject
+
+    def test_records_deliveries_under_period_campaign(self, send_summaries, user_factory):
+        """Deliveries are tracked so failed sends can be retried."""
+        from apps.creators.models import EmailDelivery
+        wallet = user_factory.creator_profile.wallet
+
+        send_summaries(wallet.__class__.objects.filter(id=wallet.id))
+
+        delivery = EmailDelivery.objects.get(campaign='daily_summary')
+        assert delivery.status == 'sent'
+        assert delivery.html_message
+
+    def test_no_wallets(self, send_summaries):
+        """An empty queryset queues nothing."""
+        from apps.wallets.models import Wallet
+
+        assert send_summaries(Wallet.objects.none()) == 0
+        assert len(mail.outbox) == 0
+
+
 @pytest.mark.django_db
 class TestSendReminderToShareCreatorLinkEmail:
     """Tests for send_reminder_to_share_creator_link_email function."""
 
-    def test_send_reminder_single_wallet_success(self, mocker, user_factory):
+    @pytest.fixture
+    def send_reminders(self, mocker, django_capture_on_commit_callbacks):
+        """Queue the reminders and run the dispatched batch tasks inline."""
+        from apps.creators.services.email_delivery import EmailDeliveryService
+        mock_delay = mocker.patch(
+            'apps.creators.tasks.send_email_batch_task.delay',
+            side_effect=EmailDeliveryService.send,
+        )
+
+        def _send(wallets):
+            with django_capture_on_commit_callbacks(execute=True):
+                queued = send_reminder_to_share_creator_link_email(wallets)
+            return queued, mock_delay
+        return _send
+
+    def test_send_reminder_single_wallet_success(self, send_reminders, user_factory):
         """Test successful sending of reminder email to single wallet."""
         # Arrange
         wallet = user_factory.creator_profile.wallet
         wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        queued, _ = send_reminders(wallets)
         
         # Assert
-        mock_send_mail.assert_called_once()
-        call_kwargs = mock_send_mail.call_args[1]
-        
-        assert 'Share Your Creator Link' in call_kwargs['subject']
-        assert wallet.creator.user.email in call_kwargs['recipient_list']
-        assert 'creator link' in call_kwargs['message'].lower()
+        assert queued == 1
+        assert len(mail.outbox) == 1
+        email = mail.outbox[0]
+        assert 'Share Your Creator Link' in email.subject
+        assert wallet.creator.user.email in email.to
+        assert 'creator link' in email.body.lower()
 
-    def test_send_reminder_multiple_wallets_success(self, mocker):
+    def test_send_reminder_multiple_wallets_success(self, send_reminders):
         """Test sending reminder emails to multiple wallets."""
         # Arrange
         from apps.wallets.models import Wallet
@@ -797,215 +873,152 @@ class TestSendReminderToShareCreatorLinkEmail:
         wallet1 = user1.creator_profile.wallet
         wallet2 = user2.creator_profile.wallet
         wallets = Wallet.objects.filter(id__in=[wallet1.id, wallet2.id])
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        send_reminders(wallets)
         
         # Assert
-        assert mock_send_mail.call_count == 2
-        
-        # Check that both emails were sent to correct recipients
-        call_args_list = mock_send_mail.call_args_list
-        recipients = [call[1]['recipient_list'][0] for call in call_args_list]
-        
+        recipients = [email.to[0] for email in mail.outbox]
+        assert len(recipients) == 2
         assert user1.email in recipients
         assert user2.email in recipients
 
-    def test_send_reminder_includes_creator_name(self, mocker):
+    def test_send_reminder_includes_creator_name(self, send_reminders):
         """Test that reminder email includes creator's name."""
         # Arrange
         wallet = UserFactory(first_name='Bob', username='bobcreator').creator_profile.wallet
         wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        send_reminders(wallets)
         
         # Assert
-        call_kwargs = mock_send_mail.call_args[1]
-        message = call_kwargs['message']
-        
-        assert 'Hello Bob' in message
+        assert 'Hello Bob' in mail.outbox[0].body
 
-    def test_send_reminder_includes_instructions(self, mocker, user_factory):
+    def test_send_reminder_includes_instructions(self, send_reminders, user_factory):
         """Test that reminder email includes sharing instructions."""
         # Arrange
         wallet = user_factory.creator_profile.wallet
         wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        send_reminders(wallets)
         
         # Assert
-        call_kwargs = mock_send_mail.call_args[1]
-        message = call_kwargs['message']
-        
+        message = mail.outbox[0].body
         assert 'creator dashboard' in message.lower()
         assert 'social media' in message.lower()
         assert 'creator link' in message.lower()
+        assert 'tips' in message.lower()
+        assert 'support' in message.lower()
 
-    def test_send_reminder_fallback_username(self, mocker):
+    def test_send_reminder_fallback_username(self, send_reminders):
         """Test that reminder uses username when first_name is empty."""
         # Arrange
         wallet = UserFactory(first_name='', username='testcreator99').creator_profile.wallet
         wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        send_reminders(wallets)
         
         # Assert
-        call_kwargs = mock_send_mail.call_args[1]
-        message = call_kwargs['message']
-        
-        assert 'Hello testcreator99' in message
+        assert 'Hello testcreator99' in mail.outbox[0].body
 
-    def test_send_reminder_empty_queryset(self, mocker):
+    def test_send_reminder_empty_queryset(self, send_reminders):
         """Test that function handles empty queryset gracefully."""
         # Arrange
         from apps.wallets.models import Wallet
         wallets = Wallet.objects.none()
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        queued, mock_delay = send_reminders(wallets)
         
         # Assert
-        mock_send_mail.assert_not_called()
+        assert queued == 0
+        mock_delay.assert_not_called()
+        assert mail.outbox == []
 
-    def test_send_reminder_uses_correct_from_email(self, mocker, user_factory):
+    def test_send_reminder_uses_correct_from_email(self, send_reminders, user_factory):
         """Test that reminder email uses configured FROM email."""
         # Arrange
         wallet = user_factory.creator_profile.wallet
         wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        send_reminders(wallets)
         
         # Assert
-        call_kwargs = mock_send_mail.call_args[1]
-        from_email = call_kwargs['from_email']
-        
-        assert from_email == settings.DEFAULT_FROM_EMAIL
+        assert mail.outbox[0].from_email == settings.DEFAULT_FROM_EMAIL
 
-    def test_send_reminder_exception_handling(self, mocker, user_factory):
-        """Test exception handling during reminder email send."""
+    def test_send_reminder_batches_share_one_connection(
+            self, send_reminders, mocker, settings):
+        """Test that recipients are chunked and each batch reuses one connection."""
         # Arrange
-        wallet = user_factory.creator_profile.wallet
-        wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch(
-            'utils.send_emails.send_mail',
-            side_effect=Exception("Email service error")
-        )
-        mock_logger = mocker.patch('utils.send_emails.logger')
+        from apps.wallets.models import Wallet
+        settings.EMAIL_BATCH_SIZE = 2
+        users = UserFactory.create_batch(5)
+        wallets = Wallet.objects.filter(creator__user__in=users)
+        mock_connection = mocker.patch(
+            'utils.send_emails.get_connection', wraps=get_connection)
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        queued, mock_delay = send_reminders(wallets)
         
         # Assert
-        mock_logger.error.assert_called_once()
-        assert 'Failed to send reminder email' in mock_logger.error.call_args[0][0]
+        assert queued == 5
+        assert mock_delay.call_count == 3
+        assert mock_connection.call_count == 3
+        assert len(mail.outbox) == 5
 
-    def test_send_reminder_partial_failure_continues(self, mocker):
-        """Test that function continues even if one email fails."""
+    def test_send_reminder_partial_failure_is_recorded(self, send_reminders, mocker):
+        """Test that a failed message is recorded and the rest of the batch is sent."""
         # Arrange
         from apps.wallets.models import Wallet
+        from apps.creators.models import EmailDelivery
         user1 = UserFactory(first_name='User1')
         user2 = UserFactory(first_name='User2')
-        wallet1 = user1.creator_profile.wallet
-        wallet2 = user2.creator_profile.wallet
-        wallets = Wallet.objects.filter(id__in=[wallet1.id, wallet2.id]).order_by('id')
-        
-        # Mock send_mail to fail on first call, succeed on second
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
-        mock_send_mail.side_effect = [Exception("First email failed"), None]
-        mock_logger = mocker.patch('utils.send_emails.logger')
-        
-        # Act
-        send_reminder_to_share_creator_link_email(wallets)
-        
-        # Assert
-        # Should attempt to send both emails, failing only on the first
-        assert mock_send_mail.call_count == 2
-        # Logger should have error for the failed email
-        mock_logger.error.assert_called()
+        wallets = Wallet.objects.filter(
+            creator__user__in=[user1, user2]).order_by('id')
+        original_send = locmem.EmailBackend.send_messages
 
-    def test_send_reminder_includes_encouragement(self, mocker, user_factory):
-        """Test that reminder email includes encouragement about tips."""
-        # Arrange
-        wallet = user_factory.creator_profile.wallet
-        wallets = wallet.__class__.objects.filter(id=wallet.id)
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
+        def flaky_send(backend, messages):
+            if messages[0].to == [user1.email]:
+                raise Exception("First email failed")
+            return original_send(backend, messages)
+        mocker.patch.object(locmem.EmailBackend, 'send_messages', flaky_send)
         
         # Act
-        send_reminder_to_share_creator_link_email(wallets)
+        send_reminders(wallets)
         
         # Assert
-        call_kwargs = mock_send_mail.call_args[1]
-        message = call_kwargs['message']
-        
-        assert 'tips' in message.lower()
-        assert 'share' in message.lower()
+        assert [email.to for email in mail.outbox] == [[user2.email]]
+        failed = EmailDelivery.objects.get(recipient=user1.email)
+        assert failed.status == 'failed'
+        assert failed.error == "First email failed"
+        assert failed.attempts == 1
+        assert EmailDelivery.objects.get(recipient=user2.email).status == 'sent'
 
-    def test_send_reminder_multiple_wallets_independent_emails(self, mocker):
-        """Test that each wallet receives an independent email with correct personalization."""
-        # Arrange
-        from apps.wallets.models import Wallet
-        user1 = UserFactory(first_name='Alice', username='alice')
-        user2 = UserFactory(first_name='Bob', username='bob')
-        wallet1 = user1.creator_profile.wallet
-        wallet2 = user2.creator_profile.wallet
-        wallets = Wallet.objects.filter(id__in=[wallet1.id, wallet2.id]).order_by('id')
-        mock_send_mail = mocker.patch('utils.send_emails.send_mail')
-        
-        # Act
-        send_reminder_to_share_creator_link_email(wallets)
-        
-        # Assert
-        assert mock_send_mail.call_count == 2
-        
-        call_args_list = mock_send_mail.call_args_list
-        messages = [call[1]['message'] for call in call_args_list]
-        
-        # Check that each message is personalized
-        assert any('Hello Alice' in msg for msg in messages)
-        assert any('Hello Bob' in msg for msg in messages)
 
-    def test_send_reminder_includes_support_info(self, mocker, user_factory):
-        """Test that reminder email includes support team contact."""
-        # Arrange
-        wallet = user_factory.creator_profile.wallet
-        wallets = wallet.__class__.objects.filter(id=wallet.id)
+class TestTemplatedCreatorEmails:
+    """Tests for welcome_early_adopter_email and send_reminder_to_complete_profile."""
+
+    def test_welcome_early_adopter_email(self, mocker):
+        """Test that the early adopter email is rendered from its templates."""
         mock_send_mail = mocker.patch('utils.send_emails.send_mail')
-        
-        # Act
-        send_reminder_to_share_creator_link_email(wallets)
-        
-        # Assert
+
+        assert welcome_early_adopter_email('early@example.com') is True
+
         call_kwargs = mock_send_mail.call_args[1]
-        message = call_kwargs['message']
-        
-        assert 'support' in message.lower()
+        assert call_kwargs['recipient_list'] == ['early@example.com']
+        assert call_kwargs['message'].startswith('\nHello,\n\nWelcome to TipZed!')
+        assert 'Priority Support' in call_kwargs['html_message']
 
-    def test_send_reminder_contains_action_steps(self, mocker, user_factory):
-        """Test that email contains clear action steps."""
-        # Arrange
-        wallet = user_factory.creator_profile.wallet
-        wallets = wallet.__class__.objects.filter(id=wallet.id)
+    def test_send_reminder_to_complete_profile(self, mocker):
+        """Test that the profile reminder is rendered from its templates."""
         mock_send_mail = mocker.patch('utils.send_emails.send_mail')
-        
-        # Act
-        send_reminder_to_share_creator_link_email(wallets)
-        
-        # Assert
-        call_kwargs = mock_send_mail.call_args[1]
-        message = call_kwargs['message']
-        
-        # Should have numbered steps or clear instructions
-        assert '1.' in message or 'Log into' in message
-        assert '2.' in message or 'Copy' in message or 'Copy' in message
-        assert '3.' in message or 'Share' in message
 
+        assert send_reminder_to_complete_profile('creator@example.com') is True
+
+        call_kwargs = mock_send_mail.call_args[1]
+        assert '1. Log into your creator dashboard' in call_kwargs['message']
+        assert '<html>' in call_kwargs['html_message']
@@ -0,0 +1,68 @@
+import pytest
+import threading
+import time
+from utils import ulid
+from utils.ulid import CROCKFORD_ALPHABET, new_ulid, ulid_timestamp_ms
+
+
+@pytest.fixture(autouse=True)
+def fresh_generator():
+    # Ids generated earlier against the real clock would be ahead of the mocks
+    ulid._reset_after_fork()
+
+
+def test_ulid_shape():
+    value = new_ulid()
+
+    assert len(value) == 26
+    assert set(value) <= set(CROCKFORD_ALPHABET)
+
+
+def test_ulids_are_monotonic_within_a_millisecond(mocker):
+    mocker.patch("utils.ulid.time.time_ns", return_value=1_700_000_000_000 * 1_000_000)
+
+    values = [new_ulid() for _ in range(1000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == 1000
+    assert {ulid_timestamp_ms(v) for v in values} == {1_700_000_000_000}
+
+
+def test_clock_stepping_back_keeps_order(mocker):
+    clock = mocker.patch("utils.ulid.time.time_ns")
+    clock.return_value = 1_700_000_000_500 * 1_000_000
+    first = new_ulid()
+    clock.return_value = 1_700_000_000_000 * 1_000_000
+
+    assert new_ulid() > first
+
+
+def test_random_overflow_moves_to_next_millisecond(mocker):
+    mocker.patch("utils.ulid.time.time_ns", return_value=1_700_000_000_000 * 1_000_000)
+    new_ulid()
+    ulid._last_random = ulid.RANDOM_MAX
+
+    assert ulid_timestamp_ms(new_ulid()) == 1_700_000_000_001
+
+
+def test_ulids_are_unique_across_threads():
+    values = []
+
+    def generate():
+        values.extend(new_ulid() for _ in range(500))
+
+    threads = [threading.Thread(target=generate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(values)) == 4000
+
+
+def test_timestamp_tracks_the_clock():
+    before = time.time_ns() // 1_000_000
+
+    timestamp = ulid_timestamp_ms(new_ulid())
+
+    assert before <= timestamp <= time.time_ns() // 1_000_000 + 1
@@ -0,0 +1,75 @@
+"""
+Tests for wallet management commands.
+"""
+import pytest
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from apps.wallets.models import WalletSummary
+from apps.wallets.services.wallet_services import WalletTransactionService
+
+
+@pytest.mark.django_db
+class TestRebuildWalletSummariesCommand:
+    """Test rebuild_wallet_summaries management command."""
+
+    def test_rebuild_all_wallets(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTransactionService.cash_in(
+            wallet=wallet, amount=Decimal("50.00"), payment=None, reference="CMD-1")
+        WalletSummary.objects.all().delete()
+        out = StringIO()
+
+        call_command('rebuild_wallet_summaries', stdout=out)
+
+        summary = WalletSummary.objects.get(pk=wallet.pk)
+        assert summary.cash_in_total == Decimal("45.00")
+        assert summary.fee_total == Decimal("5.00")
+        assert 'Total WalletSummaries rebuilt' in out.getvalue()
+
+    def test_rebuild_single_wallet(self, user_factory):
+        from tests.factories import UserFactory
+        wallet = user_factory.creator_profile.wallet
+        other = UserFactory().creator_profile.wallet
+        out = StringIO()
+
+        call_command('rebuild_wallet_summaries', '--wallet', str(wallet.pk), stdout=out)
+
+        assert WalletSummary.objects.filter(pk=wallet.pk).exists()
+        assert not WalletSummary.objects.filter(pk=other.pk).exists()
+        assert 'Total WalletSummaries rebuilt: 1' in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestRollupLedgerStatsCommand:
+
+    def test_rolls_up_closed_days(self, user_factory):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.wallets.models import LedgerDailyStats, WalletTransaction
+
+        wallet = user_factory.creator_profile.wallet
+        WalletTransactionService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"), payment=None, reference="ROLLUP-1")
+        WalletTransaction.objects.update(created_at=timezone.now() - timedelta(days=1))
+        out = StringIO()
+
+        call_command('rollup_ledger_stats', '--days', '3', stdout=out)
+
+        assert 'rows written: 2' in out.getvalue()
+        assert LedgerDailyStats.objects.filter(transaction_type="CASH_IN").get().count == 1
+
+    def test_rolls_up_every_day_since_the_first_transaction(self, user_factory):
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.wallets.models import LedgerDailyStats, WalletTransaction
+
+        wallet = user_factory.creator_profile.wallet
+        WalletTransactionService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"), payment=None, reference="ROLLUP-2")
+        WalletTransaction.objects.update(created_at=timezone.now() - timedelta(days=90))
+
+        call_command('rollup_ledger_stats', stdout=StringIO())
+
+        assert LedgerDailyStats.objects.filter(transaction_type="CASH_IN").get().date == (
+            timezone.localdate() - timedelta(days=90))
@@ -1,14 +1,17 @@
 import pytest
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from django.utils import timezone
+from apps.wallets.models import WalletSummary, LedgerDailyStats, WalletDailyEarnings
 from apps.wallets.services.wallet_services import (
-    WalletService, PayoutScheduleService)
+    WalletService, PayoutScheduleService, WalletSummaryService,
+    EarningsSummaryService, LedgerDailyStatsService, WalletAnalyticsService)
 from apps.wallets.services.wallet_services import\
     WalletTransactionService as WalletTxnService
 from utils.exceptions import (
     InsufficientBalance, DuplicateTransaction,
     InvalidTransaction,WalletNotFound, WalletError)
-from tests.factories import UserFactory
+from tests.factories import UserFactory, PaymentFactory, WalletTransactionFactory
 
 
 class TestPayoutScheduleService:
@@ -343,6 +346,83 @@ class TestWalletTransactionService:
                 amount=Decimal("-5.00"), correlation_id="NEGATIVE"
             )
 
+    def test_cash_in_records_running_balance(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        first = WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"),
+            payment=None, reference="RUNNING-1"
+        )
+        second = WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("20.00"),
+            payment=None, reference="RUNNING-2"
+        )
+
+        assert first.balance_after == Decimal("9.00")
+        assert second.balance_after == Decimal("27.00")
+        fee_tx = second.related_fees.first()
+        assert fee_tx.balance_after is None
+
+    def test_cash_in_does_not_rescan_ledger(self, user_factory, mocker):
+        spy = mocker.spy(WalletService, "get_ledger_balance")
+        WalletTxnService.cash_in(
+            wallet=user_factory.creator_profile.wallet,
+            amount=Decimal("10.00"), payment=None, reference="NO-SCAN"
+        )
+        spy.assert_not_called()
+
+    def test_cash_in_uses_stored_balance_not_stale_instance(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"),
+            payment=None, reference="STALE-1"
+        )
+        stale = type(wallet).objects.get(pk=wallet.pk)
+        stale.balance = Decimal("0.00")
+
+        tx = WalletTxnService.cash_in(
+            wallet=stale, amount=Decimal("10.00"),
+            payment=None, reference="STALE-2"
+        )
+
+        assert tx.balance_after == Decimal("18.00")
+        wallet.refresh_from_db()
+        assert wallet.balance == Decimal("18.00")
+
+    def test_finalize_payout_records_running_balance(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("50.00"),
+            payment=None, reference="RUNNING-PAYOUT"
+        )
+        payout_tx = WalletTxnService.payout(
+            wallet=wallet, amount=Decimal("30.00"),
+            correlation_id="RUNNING-PAYOUT"
+        )
+        assert payout_tx.balance_after is None
+
+        WalletTxnService.finalize_payout(payout_tx=payout_tx, success=True)
+
+        payout_tx.refresh_from_db()
+        assert payout_tx.balance_after == Decimal("15.00")
+
+    def test_finalize_payout_twice_with_stale_instance(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("50.00"),
+            payment=None, reference="CASHIN-STALE-PAYOUT"
+        )
+        payout_tx = WalletTxnService.payout(
+            wallet=wallet, amount=Decimal("20.00"),
+            correlation_id="STALE-PAYOUT"
+        )
+        stale_tx = type(payout_tx).objects.get(pk=payout_tx.pk)
+
+        WalletTxnService.finalize_payout(payout_tx=payout_tx, success=True)
+        WalletTxnService.finalize_payout(payout_tx=stale_tx, success=True)
+
+        wallet.refresh_from_db()
+        assert wallet.balance == Decimal("25.00")
+
     def test_finalize_non_payout_raises(self, user_factory):
         tx = WalletTxnService.cash_in(
             wallet=user_factory.creator_profile.wallet,
@@ -415,4 +495,367 @@ class TestWalletService:
             amount=Decimal('10'), status="COMPLETED")
         with pytest.raises(WalletError):
             WalletService.recalculate_wallet_balance('not-wallet')
-        
\ No newline at end of file
+        
+    def test_verify_wallet_balance_in_sync(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"),
+            payment=None, reference="VERIFY-1"
+        )
+        assert WalletService.verify_wallet_balance(wallet) == Decimal("0")
+
+    def test_verify_wallet_balance_flags_and_repairs_drift(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"),
+            payment=None, reference="VERIFY-2"
+        )
+        type(wallet).objects.filter(pk=wallet.pk).update(balance=Decimal("50"))
+
+        drift = WalletService.verify_wallet_balance(wallet)
+        assert drift == Decimal("-41.00")
+        wallet.refresh_from_db()
+        assert wallet.balance == Decimal("50.00")
+
+        WalletService.verify_wallet_balance(wallet, repair=True)
+        wallet.refresh_from_db()
+        assert wallet.balance == Decimal("9.00")
+
+    def test_find_balance_drift_only_reports_drifted_wallets(self, user_factory):
+        in_sync = UserFactory().creator_profile.wallet
+        drifted = user_factory.creator_profile.wallet
+        for wallet, ref in ((in_sync, "SYNC"), (drifted, "DRIFT")):
+            WalletTxnService.cash_in(
+                wallet=wallet, amount=Decimal("10.00"),
+                payment=None, reference=ref
+            )
+        type(drifted).objects.filter(pk=drifted.pk).update(balance=Decimal("1"))
+
+        result = WalletService.find_balance_drift()
+
+        assert result == {drifted.pk: Decimal("8.00")}
+
+
+@pytest.mark.django_db
+class TestWalletSummaryService:
+    """Test the materialized wallet summary stays in step with the ledger"""
+
+    SUMMARY_FIELDS = [
+        "cash_in_total", "cash_out_total", "fee_total",
+        "total_outgoing", "transaction_count", "last_payout_at",
+    ]
+
+    def snapshot(self, wallet):
+        summary = WalletSummary.objects.get(pk=wallet.pk)
+        return {field: getattr(summary, field) for field in self.SUMMARY_FIELDS}
+
+    def test_summary_tracks_ledger_movements(self, user_factory, mocker):
+        mocker.patch(
+            "apps.wallets.services.wallet_services.FeeService.payout_fee",
+            return_value=Decimal("2.00"))
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("100.00"), payment=None, reference="S-1")
+        paid = WalletTxnService.payout(
+            wallet=wallet, amount=Decimal("30.00"), correlation_id="S-2")
+        WalletTxnService.finalize_payout(payout_tx=paid, success=True)
+        failed = WalletTxnService.payout(
+            wallet=wallet, amount=Decimal("20.00"), correlation_id="S-3")
+        WalletTxnService.finalize_payout(payout_tx=failed, success=False)
+        WalletTxnService.payout(
+            wallet=wallet, amount=Decimal("5.00"), correlation_id="S-4")
+
+        summary = WalletSummary.objects.get(pk=wallet.pk)
+        # cash-in net 90 plus the 2.00 payout fee reversal
+        assert summary.cash_in_total == Decimal("92.00")
+        assert summary.cash_out_total == Decimal("30.00")
+        # 10 cash-in fee and three 2.00 payout fees
+        assert summary.fee_total == Decimal("16.00")
+        # payouts of any status
+        assert summary.total_outgoing == Decimal("55.00")
+        assert summary.transaction_count == 9
+
+        incremental = self.snapshot(wallet)
+        WalletSummaryService.rebuild([wallet.pk])
+        assert self.snapshot(wallet) == incremental
+
+    def test_summary_built_from_ledger_when_missing(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"), payment=None, reference="S-5")
+        WalletSummary.objects.filter(pk=wallet.pk).delete()
+
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("20.00"), payment=None, reference="S-6")
+
+        summary = WalletSummary.objects.get(pk=wallet.pk)
+        assert summary.cash_in_total == Decimal("27.00")
+        assert summary.transaction_count == 4
+
+    def test_get_summary_reads_existing_row(self, user_factory, django_assert_num_queries):
+        wallet = user_factory.creator_profile.wallet
+        WalletSummaryService.rebuild([wallet.pk])
+        wallet = type(wallet).objects.get(pk=wallet.pk)
+
+        with django_assert_num_queries(1):
+            WalletSummaryService.get_summary(wallet)
+            WalletSummaryService.get_summary(wallet)
+
+    def test_get_summary_for_empty_wallet(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+
+        summary = WalletSummaryService.get_summary(wallet)
+
+        assert summary.cash_in_total == Decimal("0")
+        assert summary.transaction_count == 0
+        assert summary.last_payout_at is None
+
+    def test_rebuild_repairs_stale_summaries(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        other = UserFactory().creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("10.00"), payment=None, reference="S-7")
+        WalletSummary.objects.filter(pk=wallet.pk).update(
+            cash_in_total=Decimal("999"), transaction_count=42)
+
+        assert WalletSummaryService.rebuild() >= 2
+
+        summary = WalletSummary.objects.get(pk=wallet.pk)
+        assert summary.cash_in_total == Decimal("9.00")
+        assert summary.transaction_count == 2
+        assert WalletSummary.objects.filter(pk=other.pk).exists()
+
+
+@pytest.mark.django_db
+class TestEarningsSummaryService:
+
+    def test_get_period(self):
+        now = datetime(2024, 1, 8, 12, 0)
+
+        assert EarningsSummaryService.get_period("daily", now) == (
+            now - timedelta(days=1), "Today")
+        assert EarningsSummaryService.get_period("weekly", now) == (
+            now - timedelta(days=7), "This Week")
+        assert EarningsSummaryService.get_period("custom", now)[1] == "Custom Period"
+
+    def test_get_summaries_groups_by_wallet(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        other = UserFactory().creator_profile.wallet
+        for amount, fee in [("100.00", "5.00"), ("50.00", "2.50")]:
+            WalletTransactionFactory(
+                wallet=wallet, transaction_type="CASH_IN", status="COMPLETED",
+                amount=Decimal(amount), fee=Decimal(fee))
+        WalletTransactionFactory(
+            wallet=wallet, transaction_type="CASH_IN", status="PENDING",
+            amount=Decimal("999.00"))
+        WalletTransactionFactory(
+            wallet=other, transaction_type="CASH_IN", status="COMPLETED",
+            amount=Decimal("20.00"), fee=Decimal("1.00"))
+        start_date, _ = EarningsSummaryService.get_period("daily")
+
+        summaries = EarningsSummaryService.get_summaries([wallet.pk, other.pk], start_date)
+
+        assert summaries[wallet.pk]["total_earnings"] == Decimal("150.00")
+        assert summaries[wallet.pk]["total_fees"] == Decimal("7.50")
+        assert summaries[wallet.pk]["total_tips"] == 2
+        assert summaries[wallet.pk]["average_tip"] == Decimal("75.00")
+        assert summaries[other.pk]["total_earnings"] == Decimal("20.00")
+        assert summaries[other.pk]["total_tips"] == 1
+
+    def test_get_summaries_for_wallet_without_activity(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        start_date, _ = EarningsSummaryService.get_period("daily")
+
+        summary = EarningsSummaryService.get_summary(wallet, start_date)
+
+        assert summary["total_earnings"] == Decimal("0.00")
+        assert summary["total_tips"] == 0
+        assert summary["average_tip"] == Decimal("0.00")
+        assert summary["recent_tips"] == []
+
+    def test_recent_tips_are_limited_per_wallet(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        other = UserFactory().creator_profile.wallet
+        for _ in range(EarningsSummaryService.RECENT_TIPS_LIMIT + 2):
+            PaymentFactory(wallet=wallet, status="completed")
+        PaymentFactory(wallet=other, status="captured")
+        PaymentFactory(wallet=other, status="pending")
+        start_date, _ = EarningsSummaryService.get_period("daily")
+
+        summaries = EarningsSummaryService.get_summaries([wallet.pk, other.pk], start_date)
+
+        tips = summaries[wallet.pk]["recent_tips"]
+        assert len(tips) == EarningsSummaryService.RECENT_TIPS_LIMIT
+        assert [tip.created_at for tip in tips] == sorted(
+            (tip.created_at for tip in tips), reverse=True)
+        assert len(summaries[other.pk]["recent_tips"]) == 1
+
+    def test_get_summaries_query_count_is_constant(
+            self, user_factory, django_assert_num_queries):
+        wallets = [user_factory.creator_profile.wallet] + [
+            UserFactory().creator_profile.wallet for _ in range(3)]
+        for wallet in wallets:
+            WalletTransactionFactory(
+                wallet=wallet, transaction_type="CASH_IN", status="COMPLETED",
+                amount=Decimal("10.00"))
+            PaymentFactory(wallet=wallet, status="completed")
+        start_date, _ = EarningsSummaryService.get_period("weekly")
+
+        with django_assert_num_queries(2):
+            summaries = EarningsSummaryService.get_summaries(
+                [wallet.pk for wallet in wallets], start_date)
+            for summary in summaries.values():
+                [tip.amount for tip in summary["recent_tips"]]
+
+
+@pytest.mark.django_db
+class TestLedgerDailyStatsService:
+
+    def make_transaction(self, wallet, day, **fields):
+        tx = WalletTransactionFactory(wallet=wallet, **fields)
+        type(tx).objects.filter(pk=tx.pk).update(
+            created_at=LedgerDailyStatsService.get_day_start(day) + timedelta(hours=12))
+        return tx
+
+    def test_rollup_groups_by_type_and_status(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        day = date(2024, 3, 1)
+        self.make_transaction(wallet, day, transaction_type="CASH_IN",
+                              status="COMPLETED", amount=Decimal("10.00"))
+        self.make_transaction(wallet, day, transaction_type="CASH_IN",
+                              status="COMPLETED", amount=Decimal("15.00"))
+        self.make_transaction(wallet, day, transaction_type="FEE",
+                              status="COMPLETED", amount=Decimal("-1.50"))
+        self.make_transaction(wallet, day + timedelta(days=1), transaction_type="CASH_IN",
+                              status="COMPLETED", amount=Decimal("99.00"))
+
+        assert LedgerDailyStatsService.rollup(day) == 2
+
+        cash_in = LedgerDailyStats.objects.get(date=day, transaction_type="CASH_IN")
+        assert cash_in.count == 2
+        assert cash_in.amount_total == Decimal("25.00")
+        fee = LedgerDailyStats.objects.get(date=day, transaction_type="FEE")
+        assert fee.amount_total == Decimal("-1.50")
+        assert fee.abs_amount_total == Decimal("1.50")
+
+    def test_rollup_replaces_previous_rows(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        day = date(2024, 3, 1)
+        tx = self.make_transaction(wallet, day, transaction_type="PAYOUT",
+                                   status="PENDING", amount=Decimal("-50.00"))
+        LedgerDailyStatsService.rollup(day)
+        type(tx).objects.filter(pk=tx.pk).update(status="COMPLETED")
+
+        LedgerDailyStatsService.rollup(day)
+
+        assert list(LedgerDailyStats.objects.values_list("status", "count")) == [
+            ("COMPLETED", 1)]
+
+    def test_rollup_days_covers_closed_days(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        today = date(2024, 3, 10)
+        for offset in range(4):
+            self.make_transaction(wallet, today - timedelta(days=offset),
+                                  transaction_type="CASH_IN", status="COMPLETED")
+
+        LedgerDailyStatsService.rollup_days(2, end=today)
+
+        assert set(LedgerDailyStats.objects.values_list("date", flat=True)) == {
+            date(2024, 3, 9), date(2024, 3, 8)}
+
+    def test_rollup_recent_picks_up_late_finalized_payouts(self, user_factory, admin_user):
+        wallet = user_factory.creator_profile.wallet
+        WalletTxnService.cash_in(
+            wallet=wallet, amount=Decimal("100.00"), payment=None, reference="LATE-CASHIN")
+        wallet.refresh_from_db()
+        payout_tx = WalletTxnService.payout(
+            wallet=wallet, amount=wallet.balance, correlation_id="LATE-PAYOUT")
+        old_day = timezone.localdate() - timedelta(days=10)
+        type(payout_tx).objects.filter(pk=payout_tx.pk).update(
+            created_at=LedgerDailyStatsService.get_day_start(old_day) + timedelta(hours=12),
+            updated_at=timezone.now() - timedelta(days=10))
+        LedgerDailyStatsService.rollup(old_day)
+        payout_tx.refresh_from_db()
+
+        WalletTxnService.finalize_payout(
+            payout_tx=payout_tx, success=True, approved_by=admin_user)
+        LedgerDailyStatsService.rollup_recent()
+
+        assert list(LedgerDailyStats.objects.filter(
+            date=old_day, transaction_type="PAYOUT").values_list("status", flat=True)) == [
+            "COMPLETED"]
+
+
+@pytest.mark.django_db
+class TestWalletAnalyticsService:
+
+    def make_cash_in(self, wallet, day, amount):
+        tx = WalletTransactionFactory(
+            wallet=wallet, transaction_type="CASH_IN", status="COMPLETED", amount=amount)
+        type(tx).objects.filter(pk=tx.pk).update(
+            created_at=LedgerDailyStatsService.get_day_start(day) + timedelta(hours=12))
+        return tx
+
+    def test_cash_in_updates_daily_earnings(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        for reference in ("A", "B"):
+            WalletTxnService.cash_in(
+                wallet=wallet, amount=Decimal("20.00"), payment=None, reference=reference)
+
+        day = WalletDailyEarnings.objects.get(wallet=wallet)
+        assert day.date == timezone.localdate()
+        assert day.tip_count == 2
+        assert day.earnings == Decimal("36.00")  # net of the 10% fee
+
+    def test_rebuild_matches_ledger(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        self.make_cash_in(wallet, date(2024, 3, 1), Decimal("10.00"))
+        self.make_cash_in(wallet, date(2024, 3, 1), Decimal("5.00"))
+        self.make_cash_in(wallet, date(2024, 3, 2), Decimal("7.00"))
+
+        assert WalletAnalyticsService.rebuild() == 2
+        assert list(WalletDailyEarnings.objects.order_by("date").values_list(
+            "date", "earnings", "tip_count")) == [
+            (date(2024, 3, 1), Decimal("15.00"), 2),
+            (date(2024, 3, 2), Decimal("7.00"), 1),
+        ]
+
+    def test_series_is_zero_filled(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        self.make_cash_in(wallet, date(2024, 3, 2), Decimal("9.00"))
+        WalletAnalyticsService.rebuild()
+
+        series = WalletAnalyticsService.get_series(
+            wallet, "day", date(2024, 3, 1), date(2024, 3, 3))
+
+        assert [(b["period"], b["earnings"], b["tip_count"]) for b in series["buckets"]] == [
+            (date(2024, 3, 1), Decimal("0.00"), 0),
+            (date(2024, 3, 2), Decimal("9.00"), 1),
+            (date(2024, 3, 3), Decimal("0.00"), 0),
+        ]
+        assert series["buckets"][0]["average_tip"] == Decimal("0.00")
+
+    @pytest.mark.parametrize("interval, periods", [
+        ("week", [date(2024, 2, 26), date(2024, 3, 4)]),
+        ("month", [date(2024, 2, 1), date(2024, 3, 1)]),
+    ])
+    def test_series_buckets_by_interval(self, user_factory, interval, periods):
+        wallet = user_factory.creator_profile.wallet
+        self.make_cash_in(wallet, date(2024, 2, 29), Decimal("10.00"))
+        self.make_cash_in(wallet, date(2024, 3, 1), Decimal("5.00"))
+        self.make_cash_in(wallet, date(2024, 3, 4), Decimal("6.00"))
+        WalletAnalyticsService.rebuild()
+
+        series = WalletAnalyticsService.get_series(
+            wallet, interval, date(2024, 2, 28), date(2024, 3, 5))
+
+        assert [b["period"] for b in series["buckets"]] == periods
+        first, second = series["buckets"]
+        if interval == "week":
+            assert (first["earnings"], first["tip_count"]) == (Decimal("15.00"), 2)
+            assert first["average_tip"] == Decimal("7.50")
+        else:
+            assert (first["earnings"], first["tip_count"]) == (Decimal("10.00"), 1)
+            assert (second["earnings"], second["tip_count"]) == (Decimal("11.00"), 2)
+        assert series["totals"] == {
+            "earnings": Decimal("21.00"), "tip_count": 3, "average_tip": Decimal("7.00")}
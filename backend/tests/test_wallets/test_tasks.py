@@ -0,0 +1,42 @@
+"""
+Tests for Celery tasks in the wallets app.
+"""
+import pytest
+from decimal import Decimal
+from apps.wallets.models import Wallet
+from apps.wallets.tasks import verify_wallet_balances_task
+from apps.wallets.services.wallet_services import\
+    WalletTransactionService as WalletTxnService
+
+
+@pytest.mark.django_db
+class TestVerifyWalletBalancesTask:
+
+    def test_reports_in_sync_wallets(self, user_factory):
+        WalletTxnService.cash_in(
+            wallet=user_factory.creator_profile.wallet,
+            amount=Decimal("10.00"), payment=None, reference="TASK-SYNC"
+        )
+        result = verify_wallet_balances_task()
+        assert result == "All wallet balances match the ledger"
+
+    def test_flags_drift_without_repairing_by_default(self, user_factory, mocker):
+        wallet = user_factory.creator_profile.wallet
+        Wallet.objects.filter(pk=wallet.pk).update(balance=Decimal("5.00"))
+        mock_logger = mocker.patch("apps.wallets.tasks.logger")
+
+        result = verify_wallet_balances_task()
+
+        assert "drift detected on 1 wallets" in result
+        mock_logger.error.assert_called_once()
+        wallet.refresh_from_db()
+        assert wallet.balance == Decimal("5.00")
+
+    def test_repairs_drift(self, user_factory):
+        wallet = user_factory.creator_profile.wallet
+        Wallet.objects.filter(pk=wallet.pk).update(balance=Decimal("5.00"))
+
+        verify_wallet_balances_task(repair=True)
+
+        wallet.refresh_from_db()
+        assert wallet.balance == Decimal("0.00")
@@ -1,4 +1,6 @@
 import pytest
+from decimal import Decimal
+from utils.pagination import SizedPageNumberPagination
 from tests.factories import (
     APIClientFactory,
     UserFactory,
@@ -234,8 +236,10 @@ class TestWalletDetailsViews:
 
     def test_get_user_wallet(self, api_client, user_factory, mocker):
         """Test getting current user's wallet"""
-        mock_pawapay = mocker.patch("apps.wallets.views.pawapay_request")
-        mock_pawapay.return_value = {"status": "completed"}
+        mock_pawapay = mocker.patch(
+            "apps.payments.services.status_refresh_service.pawapay_request")
+        mocker.patch(
+            "apps.wallets.views.refresh_wallet_payment_statuses_task.delay")
         client = APIClientFactory()
         api_client.credentials(HTTP_X_API_KEY=client.api_key)
         api_client.force_authenticate(user=user_factory)
@@ -249,12 +253,15 @@ class TestWalletDetailsViews:
         assert "recent_transactions" in data
         assert "cash_in_costs" in data
 
-        # check that pawapay was not called no pending payments
+        # check that the provider is never called on the request path
         mock_pawapay.assert_not_called()
 
     def test_get_user_wallet_with_pending_payment(self, api_client, user_factory, mocker):
-        """Test getting current user's wallet with pending payment"""
-        mock_pawapay = mocker.patch("apps.wallets.views.pawapay_request")
+        """Test that pending payments are refreshed in the background"""
+        mock_pawapay = mocker.patch(
+            "apps.payments.services.status_refresh_service.pawapay_request")
+        mock_delay = mocker.patch(
+            "apps.wallets.views.refresh_wallet_payment_statuses_task.delay")
         client = APIClientFactory()
         api_client.credentials(HTTP_X_API_KEY=client.api_key)
         user = user_factory
@@ -262,10 +269,6 @@ class TestWalletDetailsViews:
             wallet=user.creator_profile.wallet,
             status="pending",
         )
-        mock_pawapay.return_value = (
-            {"data": {"depositId": str(payment.id), "status": "COMPLETED"}},
-            200,
-        )
         api_client.force_authenticate(user=user)
         response = api_client.get("/api/v1/wallets/me/")
         assert response.status_code == 200
@@ -276,48 +279,63 @@ class TestWalletDetailsViews:
         assert "is_active" in data
         assert "currency" in data
 
-        # check that pawapay was called
-        mock_pawapay.assert_called()
-        # check that payment status was updated
+        # the refresh is queued, the response renders from DB state
+        mock_delay.assert_called_once_with(user.creator_profile.wallet.id)
+        mock_pawapay.assert_not_called()
         payment.refresh_from_db()
-        assert payment.status == "completed"
+        assert payment.status == "pending"
+
+    def test_get_user_wallet_totals_from_summary(self, api_client, user_factory, mocker):
+        """Test that dashboard totals are served from the wallet summary"""
+        from decimal import Decimal
+        from apps.wallets.services.wallet_services import WalletTransactionService
+        mocker.patch(
+            "apps.wallets.views.refresh_wallet_payment_statuses_task.delay")
+        wallet = user_factory.creator_profile.wallet
+        WalletTransactionService.cash_in(
+            wallet=wallet, amount=Decimal("100.00"), payment=None, reference="DASH-1")
+        payout = WalletTransactionService.payout(
+            wallet=wallet, amount=Decimal("40.00"), correlation_id="DASH-2")
+        WalletTransactionService.finalize_payout(payout_tx=payout, success=True)
+        client = APIClientFactory()
+        api_client.credentials(HTTP_X_API_KEY=client.api_key)
+        api_client.force_authenticate(user=user_factory)
+
+        response = api_client.get("/api/v1/wallets/me/")
 
-    def test_get_wallet_with_multiple_pending_payments(self, api_client, user_factory, mocker):
-        """Test getting current user's wallet with multiple pending payments"""
-        mock_pawapay = mocker.patch("apps.wallets.views.pawapay_request")
+        assert response.status_code == 200
+        data = response.data["data"]
+        assert data["cash_in"] == Decimal("90.00")
+        assert data["cash_out"] == Decimal("40.00")
+        assert data["cash_in_costs"] == Decimal("10.00")
+        assert data["transaction_count"] == 3
+        assert data["total_outgoing"] == Decimal("40.00")
+
+    def test_get_wallet_refresh_is_debounced(self, api_client, user_factory, mocker):
+        """Test that repeated dashboard loads queue a single refresh"""
+        mock_delay = mocker.patch(
+            "apps.wallets.views.refresh_wallet_payment_statuses_task.delay")
         client = APIClientFactory()
         api_client.credentials(HTTP_X_API_KEY=client.api_key)
-        user = user_factory
-        payments = PaymentFactory.create_batch(
-            3,
-            wallet=user.creator_profile.wallet,
-            status="pending",
+        api_client.force_authenticate(user=user_factory)
+
+        for _ in range(3):
+            response = api_client.get("/api/v1/wallets/me/")
+            assert response.status_code == 200
+
+        mock_delay.assert_called_once()
+
+    def test_get_wallet_when_refresh_cannot_be_queued(self, api_client, user_factory, mocker):
+        """Test that a broker outage does not break the dashboard"""
+        mocker.patch(
+            "apps.wallets.views.refresh_wallet_payment_statuses_task.delay",
+            side_effect=Exception("broker down"),
         )
-        # Mock pawapay to return completed for all payments
-
-        def mock_pawapay_side_effect(method, endpoint, headers=None, payload=None):
-            # deposit_id = payload.get("depositId")
-            return (
-                {"data": {"depositId": "test_id", "status": "COMPLETED"}},
-                200,
-            )
-        mock_pawapay.side_effect = mock_pawapay_side_effect
-        api_client.force_authenticate(user=user)
+        client = APIClientFactory()
+        api_client.credentials(HTTP_X_API_KEY=client.api_key)
+        api_client.force_authenticate(user=user_factory)
         response = api_client.get("/api/v1/wallets/me/")
         assert response.status_code == 200
-        data = response.data.get("data")
-        assert data is not None
-        assert "id" in data
-        assert "balance" in data
-        assert "is_active" in data
-        assert "currency" in data
-
-        # check that pawapay was called multiple times
-        assert mock_pawapay.call_count == 3
-        # check that all payment statuses were updated
-        for payment in payments:
-            payment.refresh_from_db()
-            assert payment.status == "completed"
 
     def test_get_wallet_transactions(self, api_client, wallet_transaction_factory):
         """Test getting current users tips"""
@@ -344,6 +362,68 @@ class TestWalletDetailsViews:
         assert "status" in transaction
         assert "reference" in transaction
 
+    def test_get_wallet_transactions_cursor_pagination(self, api_client, user_factory):
+        """Test keyset pagination walks the history without gaps or repeats"""
+        from datetime import timedelta
+        from django.utils import timezone
+        from apps.wallets.models import WalletTransaction
+        wallet = user_factory.creator_profile.wallet
+        txns = WalletTransactionFactory.create_batch(7, wallet=wallet)
+        now = timezone.now()
+        for i, txn in enumerate(txns):
+            WalletTransaction.objects.filter(pk=txn.pk).update(
+                created_at=now - timedelta(minutes=i))
+        client = APIClientFactory()
+        api_client.credentials(HTTP_X_API_KEY=client.api_key)
+        api_client.force_authenticate(user=user_factory)
+
+        response = api_client.get(
+            "/api/v1/wallets/transactions/?pagination=cursor&limit=3")
+        assert response.status_code == 200
+        assert "count" not in response.data
+        seen = [t["reference"] for t in response.data["results"]["data"]]
+        next_url = response.data["next"]
+        while next_url:
+            response = api_client.get(next_url)
+            assert response.status_code == 200
+            seen += [t["reference"] for t in response.data["results"]["data"]]
+            next_url = response.data["next"]
+
+        assert seen == [txn.reference for txn in txns]
+
+    def test_get_wallet_supporters_cursor_pagination(self, auth_api_client, user_factory):
+        """Test supporters list supports keyset pagination"""
+        wallet = user_factory.creator_profile.wallet
+        for _ in range(3):
+            WalletTransactionFactory(
+                wallet=wallet, payment=PaymentFactory(wallet=wallet))
+        auth_api_client.force_authenticate(user=user_factory)
+
+        response = auth_api_client.get(
+            "/api/v1/wallets/supporters/?pagination=cursor&page_size=2")
+
+        assert response.status_code == 200
+        assert len(response.data["results"]["data"]) == 2
+        assert "cursor=" in response.data["next"]
+        response = auth_api_client.get(response.data["next"])
+        assert len(response.data["results"]["data"]) == 1
+        assert response.data["next"] is None
+
+    @pytest.mark.parametrize("page_size, expected", [
+        ("abc", 25), ("0", 25), ("-5", 25), ("1000", 100), ("2", 2)])
+    def test_supporters_page_size_is_validated(
+        self, auth_api_client, user_factory, page_size, expected, mocker
+    ):
+        """Invalid sizes fall back to the default, large ones are capped"""
+        auth_api_client.force_authenticate(user=user_factory)
+        paginate = mocker.spy(SizedPageNumberPagination, "get_page_size")
+
+        response = auth_api_client.get(
+            f"/api/v1/wallets/supporters/?page_size={page_size}")
+
+        assert response.status_code == 200
+        assert paginate.spy_return == expected
+
     def test_get_wallet_with_no_transactions(self, api_client, user_factory):
         """Test getting current user's wallet with no transactions"""
         client = APIClientFactory()
@@ -396,3 +476,58 @@ class TestWalletKycView:
         assert data["id_document_number"] == payload["idDocumentNumber"]
         assert data["account_type"] == payload["accountType"]
         assert data["bank_name"] == payload["bankName"]
+
+
+@pytest.mark.django_db
+class TestWalletAnalyticsView:
+    """Tests for the earnings analytics endpoint"""
+    url = "/api/v1/wallets/analytics/"
+
+    def test_returns_daily_series(self, auth_api_client, user_factory):
+        from apps.wallets.services.wallet_services import WalletTransactionService
+        wallet = user_factory.creator_profile.wallet
+        WalletTransactionService.cash_in(
+            wallet=wallet, amount=Decimal("50.00"), payment=None, reference="A")
+        auth_api_client.force_authenticate(user=user_factory)
+
+        response = auth_api_client.get(self.url)
+
+        assert response.status_code == 200
+        data = response.data["data"]
+        assert data["interval"] == "day"
+        assert len(data["buckets"]) == 30
+        assert data["buckets"][-1]["earnings"] == "45.00"
+        assert data["totals"] == {
+            "earnings": "45.00", "tip_count": 1, "average_tip": "45.00"}
+
+    def test_does_not_read_the_ledger(
+            self, auth_api_client, user_factory, django_assert_max_num_queries):
+        auth_api_client.force_authenticate(user=user_factory)
+        with django_assert_max_num_queries(4) as captured:
+            response = auth_api_client.get(
+                self.url, {"interval": "month", "start": "2024-01-01", "end": "2024-12-31"})
+
+        assert response.status_code == 200
+        assert len(response.data["data"]["buckets"]) == 12
+        assert not any(
+            "wallets_wallettransaction" in query["sql"] for query in captured.captured_queries)
+
+    @pytest.mark.parametrize("params", [
+        {"interval": "hour"},
+        {"start": "2024-02-01", "end": "2024-01-01"},
+        {"start": "2000-01-01", "end": "2024-01-01"},
+    ])
+    def test_invalid_query(self, auth_api_client, user_factory, params):
+        auth_api_client.force_authenticate(user=user_factory)
+
+        response = auth_api_client.get(self.url, params)
+
+        assert response.status_code == 400
+        assert response.data["status"] == "failed"
+
+    def test_user_without_wallet(self, auth_api_client, admin_user):
+        auth_api_client.force_authenticate(user=admin_user)
+
+        response = auth_api_client.get(self.url)
+
+        assert response.status_code == 404
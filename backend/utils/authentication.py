@@ -1,9 +1,17 @@
+import hashlib
+import time
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.permissions import BasePermission
 from django.contrib.auth import get_user_model
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from apps.creators.caching import invalidate_creator
+from apps.creators.models import CreatorProfile
+from apps.creators.services.discovery import CreatorDiscoveryService
 from apps.customauth.models import APIClient
+from apps.customauth.api_keys import resolve_api_client
 from rest_framework import authentication, exceptions
 from firebase_admin import auth
 
@@ -38,6 +46,111 @@ class FirebaseAuthentication(authentication.BaseAuthentication):
         # Fall back to settings or default to 'creator'
         return getattr(settings, 'DEFAULT_USER_TYPE', 'creator')
     
+    # Upper bound for caching verified claims, tokens expire after an hour
+    TOKEN_CACHE_MAX_TTL = 3600
+    # How long the uid -> user mapping (and last synced claims) is kept
+    USER_CACHE_TTL = 60 * 60 * 24
+
+    def _verify_token(self, id_token):
+        """
+        Verify an ID token, caching the decoded claims until the token expires.
+
+        Args:
+            id_token: The raw Firebase ID token
+
+        Returns:
+            dict: The decoded token claims
+        """
+        key = f"firebase_token:{hashlib.sha256(id_token.encode()).hexdigest()}"
+        try:
+            decoded_token = cache.get(key)
+        except Exception:
+            decoded_token = None
+        if decoded_token is not None:
+            return decoded_token
+
+        decoded_token = auth.verify_id_token(id_token)
+        ttl = min(int(decoded_token.get("exp", 0) - time.time()), self.TOKEN_CACHE_MAX_TTL)
+        if ttl > 0:
+            try:
+                cache.set(key, decoded_token, ttl)
+            except Exception:
+                pass
+        return decoded_token
+
+    def _get_user(self, identity, email, username, user_type):
+        """
+        Resolve the user for verified claims.
+
+        Repeat requests with unchanged claims are a single primary key
+        lookup, the user row is only written when the claims differ from the
+        ones last synced.
+
+        Args:
+            identity: Firebase uid (or email when the token has no uid)
+            email: Email claim
+            username: Username claim
+            user_type: Validated role claim
+
+        Returns:
+            User: The authenticated user
+        """
+        key = f"firebase_user:{identity}"
+        claims = {"email": email, "username": username, "user_type": user_type}
+        try:
+            cached = cache.get(key)
+        except Exception:
+            cached = None
+        if cached and cached["claims"] == claims:
+            user = User.objects.filter(pk=cached["user_id"]).first()
+            if user is not None:
+                return user
+
+        user, created = User.objects.get_or_create(
+            email=email,
+            defaults={
+                "username": username,
+                "user_type": user_type,  # Set user_type on creation (triggers CreatorProfile signal)
+            },
+        )
+        if not created:
+            self._sync_user(user, username, user_type)
+
+        try:
+            cache.set(key, {"user_id": user.pk, "claims": claims}, self.USER_CACHE_TTL)
+        except Exception:
+            pass
+        return user
+
+    def _sync_user(self, user, username, user_type):
+        """
+        Apply changed username/user_type claims with a single update(),
+        without the post_save fan-out of user.save().
+        """
+        updates = {}
+        if username and user.username != username.replace(" ", "-"):
+            updates["username"] = User.get_available_username(username, exclude_pk=user.pk)
+        if user.user_type != user_type:
+            updates["user_type"] = user_type
+        if not updates:
+            return
+
+        User.objects.filter(pk=user.pk).update(updated_at=timezone.now(), **updates)
+        for field, value in updates.items():
+            setattr(user, field, value)
+
+        # update() skips the post_save signals, keep the CreatorProfile in
+        # step with the user_type like update_creator_profile does
+        if "user_type" in updates:
+            if user_type == "creator":
+                CreatorProfile.objects.get_or_create(user=user)
+            else:
+                CreatorProfile.objects.filter(user=user).delete()
+        elif user.user_type == "creator":
+            # Username is denormalized into discovery and cached responses
+            CreatorDiscoveryService.update_user(user)
+            invalidate_creator(user.slug)
+
     def authenticate(self, request):
         auth_header = request.META.get("HTTP_AUTHORIZATION", "")
         if not auth_header.startswith("Bearer "):
@@ -48,7 +161,7 @@ class FirebaseAuthentication(authentication.BaseAuthentication):
             raise exceptions.AuthenticationFailed("Missing Firebase token.")
 
         try:
-            decoded_token = auth.verify_id_token(id_token)
+            decoded_token = self._verify_token(id_token)
         except Exception:
             raise exceptions.AuthenticationFailed("Invalid or expired Firebase token.")
 
@@ -69,23 +182,7 @@ class FirebaseAuthentication(authentication.BaseAuthentication):
         if user_type not in allowed_roles:
             user_type = "creator"
 
-        user, created = User.objects.get_or_create(
-            email=email,
-            defaults={
-                "username": username,
-                "user_type": user_type,  # Set user_type on creation (triggers CreatorProfile signal)
-            },
-        )
-
-        # Sync email if changed
-        if username and user.username != username:
-            user.username = username
-            user.save(update_fields=["username"])
-        
-        # Sync user_type if changed (this will trigger CreatorProfile creation/deletion signals)
-        if user.user_type != user_type:
-            user.user_type = user_type
-            user.save(update_fields=["user_type"])
+        user = self._get_user(firebase_uid or email, email, username, user_type)
 
         # Attach decoded token if you want later access
         request.firebase_user = decoded_token
@@ -110,9 +207,10 @@ class APIKeyAuthentication(BaseAuthentication):
         if not api_key:
             return None
 
-        try:
-            client = APIClient.objects.get(api_key=api_key, is_active=True)
-        except APIClient.DoesNotExist:
+        # Usually already resolved by ClientIdentificationMiddleware, served
+        # from the API key cache either way
+        client = resolve_api_client(api_key)
+        if client is None:
             raise AuthenticationFailed('Invalid or inactive API key.')
 
         # Store client info in request for later use
@@ -149,11 +247,9 @@ class ClientIdentificationMiddleware:
         # Try to identify client from API key
         api_key = request.META.get('HTTP_X_API_KEY')
         if api_key:
-            try:
-                client = APIClient.objects.get(api_key=api_key, is_active=True)
+            client = resolve_api_client(api_key)
+            if client is not None:
                 request.client = client
-            except APIClient.DoesNotExist:
-                pass
 
         # Try to identify from X-Client-ID header
         client_id = request.META.get('HTTP_X_CLIENT_ID')
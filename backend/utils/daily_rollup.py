@@ -0,0 +1,123 @@
+"""
+Daily rollup tables (PaymentDailyStats, LedgerDailyStats): one row per
+local day and group, recomputed from the source rows one day at a time so
+reruns and late changes never double count.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from django.db import transaction
+from django.utils import timezone
+
+
+def get_day_start(day: date) -> datetime:
+    """Start of a local day as an aware datetime"""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+class DailyRollupService:
+    """
+    Base for the services maintaining a daily rollup.
+
+    Subclasses set the source model (with created_at and updated_at), the
+    stats model (with a date field), the columns rows are grouped by and
+    the aggregates written for each group.
+    """
+    source_model = None
+    stats_model = None
+    group_by = ()
+
+    get_day_start = staticmethod(get_day_start)
+
+    @classmethod
+    def get_aggregates(cls) -> dict:
+        """Aggregate expressions by stats model field"""
+        raise NotImplementedError
+
+    @classmethod
+    def rollup(cls, day: date) -> int:
+        """
+        Recompute one day of the rollup with one grouped query.
+        Args:
+            day (date): The local day to roll up
+        Returns:
+            int: Number of rows written
+        """
+        start = get_day_start(day)
+        rows = (
+            cls.source_model.objects
+            .filter(created_at__gte=start, created_at__lt=start + timedelta(days=1))
+            .order_by()
+            .values(*cls.group_by)
+            .annotate(**cls.get_aggregates())
+        )
+        stats = [
+            cls.stats_model(date=day, **{
+                key: value if value is not None else 0 for key, value in row.items()})
+            for row in rows
+        ]
+        with transaction.atomic():
+            cls.stats_model.objects.filter(date=day).delete()
+            cls.stats_model.objects.bulk_create(stats)
+        return len(stats)
+
+    @classmethod
+    def get_changed_days(cls, since: datetime) -> list:
+        """
+        Closed days with source rows updated since the given time, their
+        rollup rows are stale.
+        Args:
+            since (datetime): Time of the previous rollup
+        Returns:
+            list: Local dates
+        """
+        today = timezone.localdate()
+        return [
+            day for day in
+            cls.source_model.objects.filter(updated_at__gte=since).dates("created_at", "day")
+            if day < today
+        ]
+
+    @classmethod
+    def rollup_recent(cls, hours: int = 25) -> int:
+        """
+        Roll up yesterday and every older day whose source rows changed in
+        the last hours.
+        Args:
+            hours (int): How far back to look for changed rows
+        Returns:
+            int: Number of days rolled up
+        """
+        days = set(cls.get_changed_days(timezone.now() - timedelta(hours=hours)))
+        days.add(timezone.localdate() - timedelta(days=1))
+        for day in sorted(days):
+            cls.rollup(day)
+        return len(days)
+
+    @classmethod
+    def get_first_day(cls) -> Optional[date]:
+        """Local day of the oldest source row, None when there are none"""
+        first = (
+            cls.source_model.objects.order_by("created_at")
+            .values_list("created_at", flat=True).first()
+        )
+        return timezone.localdate(first) if first else None
+
+    @classmethod
+    def rollup_days(cls, days: Optional[int] = None, end: Optional[date] = None) -> int:
+        """
+        Roll up the closed days before end.
+        Args:
+            days (int): Number of days to roll up, defaults to every day
+                since the oldest source row
+            end (date): First day not rolled up, defaults to today
+        Returns:
+            int: Number of rows written
+        """
+        end = end or timezone.localdate()
+        if days is None:
+            first_day = cls.get_first_day()
+            days = (end - first_day).days if first_day else 0
+        return sum(
+            cls.rollup(end - timedelta(days=offset))
+            for offset in range(1, days + 1)
+        )
@@ -23,4 +23,7 @@ class InvalidAmount(Exception):
 
 
 class PayoutNotFound(Exception):
-    pass
\ No newline at end of file
+    pass
+
+class DisbursementError(Exception):
+    pass
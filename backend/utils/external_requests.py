@@ -1,6 +1,7 @@
 import requests
 import logging
 from django.conf import settings
+from utils.gateway_client import GatewayUnavailable, gateway
 
 logger = logging.getLogger(__name__)
 
@@ -67,15 +68,16 @@ def pawapay_request(method, endpoint, headers=None, payload=None):
     try:
         if method == "POST" and payload is None:
             raise AttributeError("Payload missing")
-        response = requests.request(
-            method, url, headers=headers, json=payload, timeout=10
-        )
+        response = gateway.request(method, url, headers=headers, json=payload)
         try:
             return response.json(), response.status_code
         except ValueError:
             return response.text, response.status_code
     except AttributeError:
         return {"status": "BAD_REQUEST"}, 400
+    except GatewayUnavailable as e:
+        logger.error(f"PawaPay Unavailable: {e}")
+        return {"status": "GATEWAY_UNAVAILABLE"}, 503
     except requests.exceptions.RequestException as e:
         logger.error(f"PawaPay Request Error: {e}")
         return {"status": "EXTERNAL_ERROR"}, 500
@@ -102,15 +104,16 @@ def limopay_request(method, endpoint, headers=None, payload=None):
     try:
         if method == "POST" and payload is None:
             raise AttributeError("Payload missing")
-        response = requests.request(
-            method, url, headers=headers, json=payload, timeout=10
-        )
+        response = gateway.request(method, url, headers=headers, json=payload)
         try:
             return response.json(), response.status_code
         except ValueError:
             return response.text, response.status_code
     except AttributeError:
         return {"status": "BAD_REQUEST"}, 400
+    except GatewayUnavailable as e:
+        logger.error(f"Limopay Unavailable: {e}")
+        return {"status": "GATEWAY_UNAVAILABLE"}, 503
     except requests.exceptions.RequestException as e:
         logger.error(f"Limopay Request Error: {e}")
         return {"status": "EXTERNAL_ERROR"}, 500
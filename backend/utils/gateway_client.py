@@ -0,0 +1,170 @@
+"""
+Shared HTTP client for payment gateway calls (Limopay / PawaPay).
+
+Keeps one pooled keep-alive requests.Session per process so repeated calls
+reuse TCP/TLS connections, retries idempotent requests with jittered
+backoff and trips a circuit breaker when the gateway keeps failing.
+"""
+import logging
+import os
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Only requests that are safe to send twice are retried
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+RETRY_STATUSES = frozenset([502, 503, 504])
+RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class GatewayUnavailable(requests.exceptions.ConnectionError):
+    """Raised without calling the gateway while the circuit is open"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    Per-process circuit breaker.
+
+    Opens after ``failure_threshold`` consecutive failures and rejects calls
+    until ``reset_timeout`` seconds have passed, then lets a single trial
+    call through (half-open) which either closes or re-opens the circuit.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def allow_request(self):
+        """
+        Check whether a call may be made.
+        Returns:
+            bool: False while the circuit is open
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            # Open, or half-open with the trial call still in flight
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.reset()
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.error(
+                        f"Gateway circuit opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class GatewayClient:
+    """Pooled HTTP client with retries and a circuit breaker"""
+
+    def __init__(self, pool_size=None, connect_timeout=None, read_timeout=None,
+                 max_retries=None, backoff=None, failure_threshold=None,
+                 reset_timeout=None):
+        self.pool_size = pool_size or settings.LIMOPAY_POOL_SIZE
+        self.timeout = (
+            connect_timeout or settings.LIMOPAY_CONNECT_TIMEOUT,
+            read_timeout or settings.LIMOPAY_READ_TIMEOUT,
+        )
+        self.max_retries = (
+            settings.LIMOPAY_MAX_RETRIES if max_retries is None else max_retries)
+        self.backoff = settings.LIMOPAY_RETRY_BACKOFF if backoff is None else backoff
+        self.breaker = CircuitBreaker(
+            failure_threshold or settings.LIMOPAY_CIRCUIT_FAILURE_THRESHOLD,
+            settings.LIMOPAY_CIRCUIT_RESET_TIMEOUT if reset_timeout is None else reset_timeout,
+        )
+        self._session = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """
+        The process-wide session, rebuilt after a fork so Celery/gunicorn
+        workers never share sockets with their parent.
+        """
+        pid = os.getpid()
+        if self._session is None or self._pid != pid:
+            with self._lock:
+                if self._session is None or self._pid != pid:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_size,
+                        pool_maxsize=self.pool_size,
+                    )
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+                    self._pid = pid
+        return self._session
+
+    def backoff_delay(self, attempt):
+        """Full-jitter exponential backoff for the given retry attempt"""
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request through the pooled session.
+        Args:
+            method (str): HTTP method
+            url (str): Absolute URL
+            **kwargs: Passed through to requests.Session.request
+        Returns:
+            requests.Response: The gateway response
+        Raises:
+            GatewayUnavailable: If the circuit is open
+            requests.exceptions.RequestException: If the request failed
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.max_retries if method in IDEMPOTENT_METHODS else 0
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow_request():
+                raise GatewayUnavailable(f"Gateway circuit open, skipping {method} {url}")
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except Exception as e:
+                # Any error counts, a half-open trial that raised without
+                # recording an outcome would keep the circuit open for good
+                self.breaker.record_failure()
+                if attempt >= retries or not isinstance(e, RETRY_EXCEPTIONS):
+                    raise
+            else:
+                if response.status_code < 500:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if attempt >= retries or response.status_code not in RETRY_STATUSES:
+                    return response
+            time.sleep(self.backoff_delay(attempt))
+            attempt += 1
+
+
+gateway = GatewayClient()
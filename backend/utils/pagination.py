@@ -0,0 +1,36 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+# Largest page a client may ask for with ?page_size
+MAX_PAGE_SIZE = 100
+
+
+class SizedPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination with a client chosen ?page_size, capped at
+    MAX_PAGE_SIZE. Invalid sizes fall back to the view's page_size.
+    """
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination over created_at (newest first).
+
+    Each page is a range scan from the last seen created_at, so deep pages
+    cost the same as the first one, unlike OFFSET based pagination.
+    """
+    ordering = "-created_at"
+    page_size_query_param = "page_size"
+    max_page_size = MAX_PAGE_SIZE
+
+
+def use_cursor_pagination(request):
+    """
+    Whether the client asked for cursor pagination, with ?pagination=cursor
+    on the first page or a ?cursor= token on following pages.
+    """
+    return (
+        request.query_params.get("pagination") == "cursor"
+        or CreatedAtCursorPagination.cursor_query_param in request.query_params
+    )
@@ -5,18 +5,59 @@
 # - Missing payout account email: Sent to creators who have a pending payout but no payout account set up.
 # - Transaction receipt email: Sent to users after they receive a donation, containing transaction details.
 # - Daily/weekly summary email: Sent to creators summarizing their earnings and activity over a period of time (future feature).
+# Email bodies are Django templates under templates/emails/ (<name>.txt and
+# <name>.html), rendered with render_email / render_emails.
+# Bulk (campaign) emails are queued as EmailDelivery rows and sent in batches
+# over one SMTP connection with send_email_batch.
 
-from django.core.mail import send_mail
+from django.core.mail import send_mail, get_connection, EmailMultiAlternatives
 from django.conf import settings
-from django.utils import timezone
-from datetime import timedelta
-from decimal import Decimal
+from django.template.loader import get_template
 import logging
 from django.db.models import QuerySet
+from apps.wallets.services.wallet_services import EarningsSummaryService
 
 logger = logging.getLogger(__name__)
 
 
+def render_emails(template_name, contexts, html=True):
+    """
+    Render the bodies of one email template for a batch of contexts.
+
+    The templates are looked up once per batch (and compiled once per process
+    by the cached template loader), so bulk sends only pay for rendering.
+
+    Args:
+        template_name (str): Template name under templates/emails/, without
+            the .txt/.html extension
+        contexts (list): One context dict per email
+        html (bool): Also render the HTML alternative
+
+    Returns:
+        list: (message, html_message) per context, html_message is None
+            when html is False
+    """
+    text_template = get_template(f"emails/{template_name}.txt")
+    html_template = get_template(f"emails/{template_name}.html") if html else None
+    return [
+        (
+            text_template.render(context),
+            html_template.render(context) if html_template else None,
+        )
+        for context in contexts
+    ]
+
+
+def render_email(template_name, context, html=True):
+    """
+    Render the plain text and HTML bodies of a single email.
+
+    Returns:
+        tuple: (message, html_message)
+    """
+    return render_emails(template_name, [context], html=html)[0]
+
+
 def send_missing_payout_account_email(wallet):
     """
     Send an email to a creator requesting them to set up a payout account.
@@ -33,62 +74,9 @@ def send_missing_payout_account_email(wallet):
         creator_user = wallet.creator.user
         subject = "Action Required: Set Up Your Payout Account"
         
-        # Plain text version
-        message = f"""
-Hello {creator_user.first_name or creator_user.username},
-
-We are writing to inform you that an administrator is attempting to process a payout
-for your account. However, we were unable to complete the payout because you have not
-yet set up a payout account.
-
-To receive your earnings, please:
-1. Log into your creator dashboard
-2. Navigate to your wallet settings
-3. Add your payout account details (mobile money provider, account name, and phone number)
-
-Once you've set up your payout account, the admin can proceed with the payout.
-
-If you have any questions or need assistance, please don't hesitate to contact our support team.
-
-Best regards,
-TipZed Admin Team
-        """
-        
-        # HTML version
-        html_message = f"""
-<html>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px;">
-            <div style="background-color: #667eea; padding: 20px; border-radius: 8px 8px 0 0; color: white;">
-                <h2 style="margin: 0;">Action Required: Set Up Your Payout Account</h2>
-            </div>
-            
-            <div style="padding: 20px;">
-                <p>Hello {creator_user.first_name or creator_user.username},</p>
-                
-                <p>We are writing to inform you that an administrator is attempting to process a payout for your account.
-                However, we were unable to complete the payout because you have not yet set up a payout account.</p>
-                
-                <h3 style="color: #667eea;">To receive your earnings, please:</h3>
-                <ol>
-                    <li>Log into your creator dashboard</li>
-                    <li>Navigate to your wallet settings</li>
-                    <li>Add your payout account details (mobile money provider, account name, and phone number)</li>
-                </ol>
-                
-                <p>Once you've set up your payout account, the admin can proceed with the payout.</p>
-                
-                <p>If you have any questions or need assistance, please don't hesitate to contact our support team.</p>
-                
-                <p style="margin-top: 30px; color: #666; border-top: 1px solid #e0e0e0; padding-top: 20px;">
-                    Best regards,<br>
-                    <strong>TipZed Admin Team</strong>
-                </p>
-            </div>
-        </div>
-    </body>
-</html>
-        """
+        message, html_message = render_email("missing_payout_account", {
+            "name": creator_user.first_name or creator_user.username,
+        })
         
         send_mail(
             subject=subject,
@@ -131,106 +119,19 @@ def send_transaction_receipt_email(payment, recipient_email=None):
         creator = payment.wallet.creator
         creator_user = creator.user
         
-        # Format currency display
-        currency_display = dict(payment._meta.get_field('currency').choices).get(
-            payment.currency, payment.currency
-        )
-        
-        # Calculate provider fee display
-        provider_fee = payment.provider_fee or Decimal('0.00')
-        net_amount = payment.net_amount or (payment.amount - provider_fee)
-        
         subject = f"TipZed Receipt: Your donation to {creator_user.get_full_name() or creator_user.username}"
         
-        # Plain text version
-        message = f"""
-Hello {payment.patron_name or 'Valued Supporter'},
-
-Thank you for your support! We've received your donation.
-
-Transaction Details:
-Reference: {payment.reference}
-Amount: {payment.amount} {payment.currency}
-Status: {payment.get_status_display()}
-Date: {payment.created_at.strftime('%B %d, %Y at %I:%M %p')}
-
-Creator: {creator_user.get_full_name() or creator_user.username}
-Message: {payment.patron_message or 'No message included'}
-
-Your support helps creators continue doing what they love.
-You can view this transaction in your TipZed account anytime.
-
-Thank you for being awesome!
-
-Best regards,
-TipZed Team
-        """
-        
-        # HTML version
-        status_color = '#4CAF50' if payment.status in ['completed', 'captured'] else '#FF9800'
-        html_message = f"""
-<html>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px;">
-            <div style="background-color: #667eea; padding: 20px; border-radius: 8px 8px 0 0; color: white; text-align: center;">
-                <h2 style="margin: 0;">TipZed Receipt</h2>
-                <p style="margin: 10px 0 0 0; font-size: 14px;">Thank you for your support!</p>
-            </div>
-            
-            <div style="padding: 20px;">
-                <p>Hello {payment.patron_name or 'Valued Supporter'},</p>
-                
-                <p>Thank you for your support! We've received your donation to 
-                <strong>{creator_user.get_full_name() or creator_user.username}</strong>.</p>
-                
-                <div style="background-color: #f5f5f5; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <h3 style="margin-top: 0; color: #667eea;">Transaction Details</h3>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #e0e0e0; font-weight: bold;">Reference:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #e0e0e0;">{payment.reference}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #e0e0e0; font-weight: bold;">Amount:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #e0e0e0;">
-                                <strong style="font-size: 18px; color: #667eea;">{payment.amount} {payment.currency}</strong>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #e0e0e0; font-weight: bold;">Status:</td>
-                            <td style="padding: 8px 0; border-bottom: 1px solid #e0e0e0;">
-                                <span style="background-color: {status_color}; color: white; padding: 4px 8px; border-radius: 4px; font-size: 12px;">
-                                    {payment.get_status_display()}
-                                </span>
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 8px 0; font-weight: bold;">Date:</td>
-                            <td style="padding: 8px 0;">{payment.created_at.strftime('%B %d, %Y at %I:%M %p')}</td>
-                        </tr>
-                    </table>
-                </div>
-                
-                <div style="background-color: #f9f9f9; padding: 15px; border-left: 4px solid #667eea; margin: 20px 0;">
-                    <p><strong>Creator:</strong> {creator_user.get_full_name() or creator_user.username}</p>
-                    <p><strong>Your Message:</strong></p>
-                    <p style="margin: 10px 0; font-style: italic; color: #666;">
-                        "{payment.patron_message or 'No message included'}"
-                    </p>
-                </div>
-                
-                <p>Your support helps creators continue doing what they love. You can view this transaction 
-                in your TipZed account anytime.</p>
-                
-                <p style="margin-top: 30px; color: #666; border-top: 1px solid #e0e0e0; padding-top: 20px;">
-                    Thank you for being awesome!<br>
-                    <strong>TipZed Team</strong>
-                </p>
-            </div>
-        </div>
-    </body>
-</html>
-        """
+        message, html_message = render_email("transaction_receipt", {
+            "patron_name": payment.patron_name or 'Valued Supporter',
+            "creator_name": creator_user.get_full_name() or creator_user.username,
+            "reference": payment.reference,
+            "amount": payment.amount,
+            "currency": payment.currency,
+            "status_display": payment.get_status_display(),
+            "status_color": '#4CAF50' if payment.status in ['completed', 'captured'] else '#FF9800',
+            "created_at_display": payment.created_at.strftime('%B %d, %Y at %I:%M %p'),
+            "patron_message": payment.patron_message or 'No message included',
+        })
         
         send_mail(
             subject=subject,
@@ -248,6 +149,40 @@ TipZed Team
         return False
 
 
+def get_summary_context(wallet, summary, period_label):
+    """
+    Template context of the earnings summary email.
+
+    Args:
+        wallet (Wallet): The creator's wallet, with creator.user loaded
+        summary (dict): Figures from EarningsSummaryService
+        period_label (str): Human readable period, e.g. "Today"
+
+    Returns:
+        dict: Context for the earnings_summary templates
+    """
+    creator_user = wallet.creator.user
+    return {
+        "name": creator_user.first_name or creator_user.username,
+        "period_label": period_label,
+        "total_earnings": summary["total_earnings"],
+        "total_tips": summary["total_tips"],
+        "average_tip": summary["average_tip"],
+        "total_fees": summary["total_fees"],
+        "balance": wallet.balance,
+        "currency": wallet.currency,
+        "supporters": [
+            {
+                "name": payment.patron_name or 'Anonymous Supporter',
+                "amount": payment.amount,
+                "currency": payment.currency,
+                "created_at_display": payment.created_at.strftime('%B %d at %I:%M %p'),
+            }
+            for payment in summary["recent_tips"]
+        ],
+    }
+
+
 def send_daily_weekly_summary_email(wallet, period='daily'):
     """
     Send a summary email to a creator with their earnings and activity.
@@ -269,145 +204,12 @@ def send_daily_weekly_summary_email(wallet, period='daily'):
     try:
         creator_user = wallet.creator.user
         
-        # Calculate the date range based on period
-        now = timezone.now()
-        if period == 'daily':
-            start_date = now - timedelta(days=1)
-            period_label = "Today"
-        elif period == 'weekly':
-            # Last 7 days
-            start_date = now - timedelta(days=7)
-            period_label = "This Week"
-        else:
-            # Default to daily
-            start_date = now - timedelta(days=1)
-            period_label = "Custom Period"
-        
-        # Get transactions for the period
-        transactions = wallet.transactions.filter(
-            created_at__gte=start_date,
-            transaction_type='CASH_IN',
-            status='COMPLETED'
-        )
-        
-        # Calculate statistics
-        total_earnings = Decimal('0.00')
-        total_tips = 0
-        total_fees = Decimal('0.00')
-        
-        for transaction in transactions:
-            total_earnings += transaction.amount
-            total_fees += transaction.fee
-            total_tips += 1
-        
-        average_tip = total_earnings / total_tips if total_tips > 0 else Decimal('0.00')
-        
-        # Get recent supporters/payments
-        from apps.payments.models import Payment
-        payments = Payment.objects.filter(
-            wallet=wallet,
-            created_at__gte=start_date,
-            status__in=['completed', 'captured']
-        ).order_by('-created_at')[:5]
-        
-        subject = f"TipZed Summary: Your {period_label} Earnings"
-        
-        # Build supporters list HTML
-        supporters_html = ""
-        if payments.exists():
-            supporters_html = "<h3 style='color: #667eea;'>Recent Tips:</h3><ul>"
-            for payment in payments:
-                supporter_name = payment.patron_name or 'Anonymous Supporter'
-                supporters_html += f"""
-                <li style="padding: 10px 0; border-bottom: 1px solid #e0e0e0;">
-                    <strong>{supporter_name}</strong> sent {payment.amount} {payment.currency}
-                    <br><small style="color: #999;">{payment.created_at.strftime('%B %d at %I:%M %p')}</small>
-                </li>
-                """
-            supporters_html += "</ul>"
-        
-        # Plain text version
-        message = f"""
-Hello {creator_user.first_name or creator_user.username},
-
-Here's a summary of your TipZed earnings for {period_label}:
+        start_date, period_label = EarningsSummaryService.get_period(period)
+        summary = EarningsSummaryService.get_summary(wallet, start_date)
 
-Summary Statistics:
-Total Earnings: {total_earnings} {wallet.currency}
-Number of Donations: {total_tips}
-Average Donation: {average_tip} {wallet.currency}
-Total Fees: {total_fees} {wallet.currency}
-Current Balance: {wallet.balance} {wallet.currency}
-
-Keep creating amazing content, and your supporters will keep donating!
-
-Best regards,
-TipZed Team
-        """
-        
-        # HTML version
-        html_message = f"""
-<html>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 20px; border: 1px solid #e0e0e0; border-radius: 8px;">
-            <div style="background-color: #667eea; padding: 20px; border-radius: 8px 8px 0 0; color: white; text-align: center;">
-                <h2 style="margin: 0;">TipZed Earnings Summary</h2>
-                <p style="margin: 10px 0 0 0; font-size: 14px;">{period_label}</p>
-            </div>
-            
-            <div style="padding: 20px;">
-                <p>Hello {creator_user.first_name or creator_user.username},</p>
-                
-                <p>Here's a summary of your TipZed earnings for <strong>{period_label}</strong>:</p>
-                
-                <div style="background-color: #f5f5f5; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <h3 style="margin-top: 0; color: #667eea;">Summary Statistics</h3>
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr style="background-color: #e8eef7;">
-                            <td style="padding: 12px; font-weight: bold; border-radius: 4px 0 0 0;">Total Earnings</td>
-                            <td style="padding: 12px; text-align: right; font-size: 20px; color: #667eea; font-weight: bold; border-radius: 0 4px 0 0;">
-                                {total_earnings} {wallet.currency}
-                            </td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 12px 0; border-bottom: 1px solid #e0e0e0; font-weight: bold;">Number of Donations:</td>
-                            <td style="padding: 12px 0; border-bottom: 1px solid #e0e0e0; text-align: right;">{total_tips}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 12px 0; border-bottom: 1px solid #e0e0e0; font-weight: bold;">Average Donation:</td>
-                            <td style="padding: 12px 0; border-bottom: 1px solid #e0e0e0; text-align: right;">{average_tip} {wallet.currency}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 12px 0; border-bottom: 1px solid #e0e0e0; font-weight: bold;">Total Fees:</td>
-                            <td style="padding: 12px 0; border-bottom: 1px solid #e0e0e0; text-align: right;">{total_fees} {wallet.currency}</td>
-                        </tr>
-                        <tr>
-                            <td style="padding: 12px 0; font-weight: bold;">Current Balance:</td>
-                            <td style="padding: 12px 0; text-align: right; font-weight: bold; color: #4CAF50;">
-                                {wallet.balance} {wallet.currency}
-                            </td>
-                        </tr>
-                    </table>
-                </div>
-                
-                {supporters_html}
-                
-                <div style="background-color: #f0f7ff; padding: 15px; border-left: 4px solid #667eea; margin: 20px 0; border-radius: 4px;">
-                    <p style="margin: 0;">
-                        <strong>💡 Pro Tip:</strong> Keep creating amazing content, and your supporters will keep donating! 
-                        Your dedication to your craft is what makes TipZed special.
-                    </p>
-                </div>
-                
-                <p style="margin-top: 30px; color: #666; border-top: 1px solid #e0e0e0; padding-top: 20px;">
-                    Best regards,<br>
-                    <strong>TipZed Team</strong>
-                </p>
-            </div>
-        </div>
-    </body>
-</html>
-        """
+        subject = f"TipZed Summary: Your {period_label} Earnings"
+        message, html_message = render_email(
+            "earnings_summary", get_summary_context(wallet, summary, period_label))
         
         send_mail(
             subject=subject,
@@ -441,142 +243,9 @@ def send_welcome_email(user):
     try:
         subject = "Welcome to TipZed! 🎉 Let's Get You Started"
         
-        # Plain text version
-        message = f"""
-Hello {user.first_name or user.username},
-
-Welcome to TipZed! We're thrilled to have you join our creative community.
-
-You're now part of a platform where your supporters can easily send you tips
-to show their appreciation for the amazing content you create.
-
-Getting Started:
-1. Complete Your Creator Profile
-   - Add a profile picture and cover image
-   - Write a bio describing what you do
-
-2. Set Up Your Wallet
-   - Link your mobile money account (MTN, Airtel, Zamtel)
-   - Enable automatic payouts if desired
-   - Track your earnings in real-time
-
-3. Share Your Creator Link
-   - Promote your unique creator page to your audience
-   - Each donation supports your creative work directly
-   - Engage with your supporters and thank them
-
-Tips for Success:
-- Keep your profile up to date
-- Respond to your supporters' messages
-- Create consistent, quality content
-- Share your earnings milestones to celebrate with your community
-
-If you have any questions or need assistance, our support team is here to help.
-Don't hesitate to reach out!
-
-Happy creating!
-
-Best regards,
-The TipZed Team
-Email: tipzed2@gmail.com
-        """
-        
-        # HTML version
-        html_message = f"""
-<html>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <div style="max-width: 700px; margin: 0 auto; padding: 0;">
-            <!-- Header -->
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 40px 20px; text-align: center; color: white; border-radius: 8px 8px 0 0;">
-                <h1 style="margin: 0; font-size: 28px;">🎉 Welcome to TipZed!</h1>
-                <p style="margin: 10px 0 0 0; font-size: 16px; opacity: 0.9;">Earning Made Easy</p>
-            </div>
-            
-            <!-- Main Content -->
-            <div style="background-color: #fff; padding: 40px 20px; border: 1px solid #e0e0e0; border-top: none;">
-                <p>Hello {user.first_name or user.username},</p>
-                
-                <p style="font-size: 16px; color: #666;">
-                    Welcome to TipZed! We're thrilled to have you join our creative community.
-                </p>
-                
-                <p style="font-size: 16px; color: #666;">
-                    You're now part of a platform where your supporters can easily send you tips
-                    to show their appreciation for the amazing content you create.
-                </p>
-                
-                <!-- Getting Started Section -->
-                <h2 style="color: #667eea; margin-top: 30px; margin-bottom: 20px; border-bottom: 2px solid #667eea; padding-bottom: 10px;">
-                    Getting Started
-                </h2>
-                
-                <div style="margin: 20px 0;">
-                    <div style="background-color: #f9f9f9; padding: 15px; margin-bottom: 15px; border-left: 4px solid #667eea; border-radius: 4px;">
-                        <h3 style="margin: 0 0 8px 0; color: #667eea;">1. Complete Your Creator Profile</h3>
-                        <ul style="margin: 8px 0; color: #666;">
-                            <li>Add a profile picture and cover image</li>
-                            <li>Write a bio describing what you do</li>
-                        </ul>
-                    </div>
-                    
-                    <div style="background-color: #f9f9f9; padding: 15px; margin-bottom: 15px; border-left: 4px solid #667eea; border-radius: 4px;">
-                        <h3 style="margin: 0 0 8px 0; color: #667eea;">2. Set Up Your Wallet</h3>
-                        <ul style="margin: 8px 0; color: #666;">
-                            <li>Link your mobile money account (MTN, Airtel, Zamtel)</li>
-                            <li>Enable automatic payouts if desired</li>
-                            <li>Track your earnings in real-time</li>
-                        </ul>
-                    </div>
-                    
-                    <div style="background-color: #f9f9f9; padding: 15px; border-left: 4px solid #667eea; border-radius: 4px;">
-                        <h3 style="margin: 0 0 8px 0; color: #667eea;">3. Share Your Creator Link</h3>
-                        <ul style="margin: 8px 0; color: #666;">
-                            <li>Promote your unique creator page to your audience</li>
-                            <li>Each donation supports your creative work directly</li>
-                            <li>Engage with your supporters and thank them</li>
-                        </ul>
-                    </div>
-                </div>
-                
-                <!-- Tips Section -->
-                <div style="background-color: #f0f7ff; padding: 20px; border-radius: 8px; margin: 30px 0;">
-                    <h3 style="margin-top: 0; color: #667eea;">💡 Tips for Success</h3>
-                    <ul style="margin: 10px 0; color: #666; padding-left: 20px;">
-                        <li>Keep your profile up to date</li>
-                        <li>Respond to your supporters' messages</li>
-                        <li>Create consistent, quality content</li>
-                        <li>Share your earnings milestones to celebrate with your community</li>
-                    </ul>
-                </div>
-                
-                <!-- Support Section -->
-                <div style="background-color: #fff3cd; padding: 15px; border-radius: 8px; margin: 20px 0; border-left: 4px solid #ffc107;">
-                    <p style="margin: 0; color: #856404;">
-                        <strong>Need Help?</strong> If you have any questions or need assistance, our support team is here to help.
-                        Don't hesitate to reach out!
-                    </p>
-                </div>
-                
-                <p style="margin-top: 30px; text-align: center; color: #999; font-size: 14px;">
-                    <strong>Happy creating!</strong>
-                </p>
-            </div>
-            
-            <!-- Footer -->
-            <div style="background-color: #f5f5f5; padding: 20px; text-align: center; color: #666; font-size: 13px; border-radius: 0 0 8px 8px; border: 1px solid #e0e0e0; border-top: none;">
-                <p style="margin: 0;">
-                    Best regards,<br>
-                    <strong>The TipZed Team</strong>
-                    <strong> Email: tipzed2@gmail.com</strong>
-                </p>
-                <p style="margin: 10px 0 0 0; color: #999;">
-                    TipZed - Empower Creators, Support Creativity
-                </p>
-            </div>
-        </div>
-    </body>
-</html>
-        """
+        message, html_message = render_email("welcome", {
+            "name": user.first_name or user.username,
+        })
         
         send_mail(
             subject=subject,
@@ -594,6 +263,149 @@ Email: tipzed2@gmail.com
         return False
 
 
+def send_welcome_emails(users):
+    """
+    Queue welcome emails for many new creators, e.g. after a bulk import.
+
+    Args:
+        users (list): The newly created creator users
+
+    Returns:
+        int: Number of emails queued
+    """
+    from apps.creators.services.email_delivery import EmailDeliveryService
+
+    subject = "Welcome to TipZed! 🎉 Let's Get You Started"
+    bodies = render_emails("welcome", [
+        {"name": user.first_name or user.username} for user in users
+    ])
+    deliveries = [
+        {
+            "recipient": user.email,
+            "subject": subject,
+            "message": message,
+            "html_message": html_message,
+        }
+        for user, (message, html_message) in zip(users, bodies)
+    ]
+
+    delivery_ids = EmailDeliveryService.queue("welcome", deliveries)
+    EmailDeliveryService.dispatch(delivery_ids)
+    logger.info(f"Queued {len(delivery_ids)} welcome emails")
+    return len(delivery_ids)
+
+
+def send_daily_weekly_summary_emails(wallets: QuerySet, period='daily'):
+    """
+    Queue summary emails for many creators.
+
+    The figures for every wallet come from one grouped aggregate (see
+    EarningsSummaryService.get_summaries) and the bodies are rendered in one
+    batch, then the emails are sent by the batch mailer.
+
+    Args:
+        wallets (QuerySet): Wallets to send a summary to
+        period (str): 'daily', 'weekly', or 'custom' (default: 'daily')
+
+    Returns:
+        int: Number of emails queued
+    """
+    from apps.creators.services.email_delivery import EmailDeliveryService
+
+    start_date, period_label = EarningsSummaryService.get_period(period)
+    wallets = list(wallets.select_related('creator__user'))
+    summaries = EarningsSummaryService.get_summaries(
+        [wallet.id for wallet in wallets], start_date)
+
+    subject = f"TipZed Summary: Your {period_label} Earnings"
+    bodies = render_emails("earnings_summary", [
+        get_summary_context(wallet, summaries[wallet.id], period_label)
+        for wallet in wallets
+    ])
+    deliveries = [
+        {
+            "recipient": wallet.creator.user.email,
+            "subject": subject,
+            "message": message,
+            "html_message": html_message,
+        }
+        for wallet, (message, html_message) in zip(wallets, bodies)
+    ]
+
+    delivery_ids = EmailDeliveryService.queue(f"{period}_summary", deliveries)
+    EmailDeliveryService.dispatch(delivery_ids)
+    logger.info(f"Queued {len(delivery_ids)} {period} summary emails")
+    return len(delivery_ids)
+
+
+def build_email(subject, message, recipient, html_message=None):
+    """
+    Build a message for send_email_batch.
+
+    Args:
+        subject (str): Email subject
+        message (str): Plain text body
+        recipient (str): Recipient email address
+        html_message (str): Optional HTML alternative
+
+    Returns:
+        EmailMultiAlternatives: The unsent message
+    """
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=message,
+        from_email=settings.DEFAULT_FROM_EMAIL or 'noreply@tipzed.space',
+        to=[recipient],
+    )
+    if html_message:
+        email.attach_alternative(html_message, "text/html")
+    return email
+
+
+def send_email_batch(messages):
+    """
+    Send messages over a single mail backend connection.
+
+    Opening the SMTP connection (and its TLS handshake) once per batch instead
+    of once per message is what makes bulk sends fast. Messages are still
+    handed to the connection one at a time so each gets its own outcome.
+
+    Args:
+        messages (list): EmailMessage objects
+
+    Returns:
+        list: One entry per message, None if it was sent or the error
+            message if it failed
+    """
+    errors = []
+    if not messages:
+        return errors
+
+    connection = get_connection(fail_silently=False)
+    try:
+        connection.open()
+        for email in messages:
+            email.connection = connection
+            try:
+                connection.send_messages([email])
+                errors.append(None)
+            except Exception as e:
+                errors.append(str(e) or e.__class__.__name__)
+                # The server may have dropped the connection, reconnect for
+                # the rest of the batch
+                connection.close()
+                connection.open()
+    except Exception as e:
+        # Could not (re)connect, fail whatever was not attempted yet
+        errors.extend([str(e) or e.__class__.__name__] * (len(messages) - len(errors)))
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+    return errors
+
+
 def send_reminder_to_share_creator_link_email(wallets: QuerySet):
     """
     Send a reminder email to a creator who has zero balance to share their support link.
@@ -601,38 +413,35 @@ def send_reminder_to_share_creator_link_email(wallets: QuerySet):
     This can be triggered by a Celery beat task that runs daily and checks for creators who
     have received tips but haven't shared their creator link.
 
+    The emails are queued as EmailDelivery rows and sent in batches by
+    Celery workers (see EmailDeliveryService).
+
     Args: wallets (QuerySet): QuerySet of Wallet objects that meet the criteria for
         receiving the reminder email
 
+    Returns:
+        int: Number of emails queued
     """
-    for wallet in wallets:
-        try:
-            creator_user = wallet.creator.user
-
-            subject = "Share Your Creator Link and Get More Tips!"
-            message = f"""Hello {creator_user.first_name or creator_user.username},
-                            We noticed that you've received some tips, but you haven't shared your
-                            creator link yet. Sharing your link is the best way to get more support
-                            from your audience!
-                            Here's how to share your creator link:
-                            1. Log into your creator dashboard
-                            2. Copy your unique creator link
-                            3. Share it on your social media, website, or with your fans
-                            The more you share, the more tips you can receive! If you need any help,
-                            feel free to reach out to our support team.
-                            Best regards,
-                            The TipZed Team
-            """
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL or 'noreply@tipzed.space',
-                recipient_list=[creator_user.email],
-                fail_silently=False,
-            )
-            logger.info(f"Successfully sent reminder email to {creator_user.email}")
-        except Exception as e:
-            logger.error(f"Failed to send reminder email: {str(e)}")
+    from apps.creators.services.email_delivery import EmailDeliveryService
+
+    subject = "Share Your Creator Link and Get More Tips!"
+    recipients = []
+    contexts = []
+    for wallet in wallets.select_related('creator__user').iterator():
+        creator_user = wallet.creator.user
+        recipients.append(creator_user.email)
+        contexts.append({"name": creator_user.first_name or creator_user.username})
+
+    messages = render_emails("share_creator_link", contexts, html=False)
+    deliveries = [
+        {"recipient": recipient, "subject": subject, "message": message}
+        for recipient, (message, _) in zip(recipients, messages)
+    ]
+
+    delivery_ids = EmailDeliveryService.queue("share_creator_link", deliveries)
+    EmailDeliveryService.dispatch(delivery_ids)
+    logger.info(f"Queued {len(delivery_ids)} reminder emails to share creator link")
+    return len(delivery_ids)
 
 
 def welcome_early_adopter_email(email: str) -> bool:
@@ -643,26 +452,13 @@ def welcome_early_adopter_email(email: str) -> bool:
     """
     try:
         subject = "Welcome to TipZed! 🎉 Exclusive Benefits for Early Adopters"
-        message = f"""Hello,
-
-        Welcome to TipZed! As one of our early adopters, you're part of an exclusive group of creators who are shaping the future of our platform. We're thrilled to have you on board and want to share some of the special benefits you can enjoy as an early adopter:
-
-        1. Priority Support: Get access to our dedicated support team for any questions or assistance you may need.
-        2. Feature Previews: Be the first to try out new features and provide feedback that will help us improve.
-        3. Community Recognition: Join our early adopter community and connect with other creators who are also part of this exciting journey.
-        4. Exclusive Resources: Access guides, tips, and best practices to help you maximize your success on TipZed.
-
-        We're committed to supporting you every step of the way as you grow your presence on TipZed. If you have any questions or need assistance, please don't hesitate to reach out.
-
-        Best regards,
-        The TipZed Team
-        Email: tipzed2@gmail.com
-        """
+        message, html_message = render_email("early_adopter_welcome", {})
         send_mail(
             subject=subject,
             message=message,
             from_email=settings.DEFAULT_FROM_EMAIL or 'noreply@tipzed.space',
             recipient_list=[email],
+            html_message=html_message,
             fail_silently=False,
         )
         logger.info(f"Successfully sent welcome email to early adopter {email}")
@@ -683,26 +479,13 @@ def send_reminder_to_complete_profile(email: str) -> bool:
     """
     try:
         subject = "Complete Your TipZed Profile and Start Earning!"
-        message = f"""Hello,
-
-        We noticed that you haven't completed your TipZed profile setup yet. Completing your profile is essential to start receiving tips from your supporters. Here's how you can complete your profile:
-
-        1. Log into your creator dashboard
-        2. Add a profile picture and cover image
-        3. Write a compelling bio about yourself and your content
-        4. Set up your wallet to receive payouts
-
-        The more complete your profile, the more likely supporters will be to support you! If you need any help, feel free to reach out to our support team.
-
-        Best regards,
-        The TipZed Team
-        Email: tipzed2@gmail.com
-        """
+        message, html_message = render_email("complete_profile_reminder", {})
         send_mail(
             subject=subject,
             message=message,
             from_email=settings.DEFAULT_FROM_EMAIL or 'noreply@tipzed.space',
             recipient_list=[email],
+            html_message=html_message,
             fail_silently=False,
         )
         logger.info(f"Successfully sent reminder email to {email}")
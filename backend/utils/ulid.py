@@ -0,0 +1,67 @@
+"""
+Monotonic ULIDs: 48 bits of millisecond timestamp followed by 80 random
+bits, Crockford base32 encoded to 26 characters that sort by creation time.
+"""
+import os
+import secrets
+import threading
+import time
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+RANDOM_BITS = 80
+RANDOM_MAX = (1 << RANDOM_BITS) - 1
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_random = 0
+
+
+def _reset_after_fork():
+    # A forked worker must not continue the parent's random sequence, or two
+    # workers generating in the same millisecond would produce the same ids
+    global _last_ms, _last_random
+    _last_ms, _last_random = 0, 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def encode(value: int) -> str:
+    """Encode a 128-bit integer as 26 Crockford base32 characters"""
+    chars = []
+    for _ in range(26):
+        chars.append(CROCKFORD_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+def new_ulid() -> str:
+    """
+    Generate a ULID that sorts after every ULID this process generated before.
+
+    Within one millisecond (or when the clock steps back) the random part of
+    the previous id is incremented instead of drawn again. Across processes
+    and nodes uniqueness rests on the 80 random bits.
+    """
+    global _last_ms, _last_random
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _last_random = secrets.randbits(RANDOM_BITS)
+        elif _last_random < RANDOM_MAX:
+            _last_random += 1
+        else:
+            _last_ms += 1
+            _last_random = secrets.randbits(RANDOM_BITS)
+        value = (_last_ms << RANDOM_BITS) | _last_random
+    return encode(value)
+
+
+def ulid_timestamp_ms(ulid: str) -> int:
+    """Millisecond timestamp encoded in the first 10 characters of a ULID"""
+    value = 0
+    for char in ulid[:10].upper():
+        value = (value << 5) | CROCKFORD_ALPHABET.index(char)
+    return value